@@ -0,0 +1,26 @@
+"""
+SK AXIS AI 면접 런타임 데이터 경로
+
+이 파일은 서버가 실행 중에 만드는 파일(작업 큐 DB, 상태 아카이브/스냅샷, 결정 로그)의
+기준 디렉토리를 정의합니다.
+주요 기능:
+- AI_DATA_DIR: 런타임 데이터 기준 디렉토리 (기본: ai/data, 실행 위치와 무관)
+- data_path(*parts): 기준 디렉토리 아래 경로
+
+주의사항:
+- 상태 스냅샷은 pickle로 읽으므로 AI_DATA_DIR은 이 서버만 쓸 수 있는 로컬 디스크에 둘 것
+  (공유/외부에서 쓰기 가능한 마운트 금지)
+- 저장소에 커밋하지 않음 (.gitignore: ai/data/)
+"""
+
+import os
+
+AI_DATA_DIR = os.path.abspath(os.getenv(
+    "AI_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data"),
+))
+
+
+def data_path(*parts: str) -> str:
+    """AI_DATA_DIR 아래 경로를 반환합니다 (디렉토리는 만들지 않음)."""
+    return os.path.join(AI_DATA_DIR, *parts)
@@ -13,24 +13,88 @@ API 구조:
 - /api/v1/interview/* : 면접 시작/종료, 상태 관리
 - /api/v1/stt/* : 음성-텍스트 변환 처리
 - /api/v1/results/* : 평가 결과 조회 및 리포트 생성
+- /api/v1/admin/* : 작업 큐 상태 등 운영 지표 조회
+
+시작 시간 최적화:
+- STT 모델/OpenAI 클라이언트는 MODEL_REGISTRY에서 지연 로딩
+- MODEL_WARMUP에 지정한 리소스만 lifespan 워밍업 단계에서 미리 로딩
+- 시작 시 임포트/워밍업 소요 시간과 RSS를 리포트
 """
 
+import time
+_IMPORT_START = time.perf_counter()  # 콜드 스타트 측정 기준점 (다른 임포트보다 먼저)
+
 import os
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi import FastAPI
+
+from .services.model_registry import MODEL_REGISTRY, MODEL_WARMUP
+from .services.interview.audio_preprocess_service import shutdown_preprocess_pool
+from .services.queue_executor import QUEUE_SCHEDULER, purge_finished_jobs, replay_pending_jobs
+from .services.process_pool import CPU_POOL
+from .services.shared_queue import SHARED_QUEUE
+from .state.snapshot import STATE_SNAPSHOTTER
 
 # 각 도메인별 라우터 임포트
 from .routers.interview_router import router as interview_router  # 면접 관리 API
 from .routers.stt_router import router as stt_router              # STT 처리 API
 from .routers.result_router import router as result_router        # 결과 조회 API
+from .routers.admin_router import router as admin_router          # 운영 관리 API
+
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_START
+
+# ─── 앱 수명주기 (워밍업 + 시작 시간 리포트) ───
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    워커 시작 시 MODEL_WARMUP 리소스를 스레드에서 미리 로딩하고 시작 시간 리포트를 남깁니다.
+    이전 실행에서 끝나지 않은 큐 작업을 다시 등록하고, 종료 시 작업 큐 워커와 CPU 프로세스 풀, 오디오 전처리 풀을 정리합니다.
+    memory 상태 저장소는 시작 시 스냅샷에서 복원하고 종료 시 마지막 변경분까지 저장합니다.
+    """
+    warmup_start = time.perf_counter()
+    warmed = await asyncio.to_thread(MODEL_REGISTRY.warm_up, MODEL_WARMUP)
+    warmup_seconds = time.perf_counter() - warmup_start
+
+    app.state.startup_report = {
+        "pid": os.getpid(),
+        "import_seconds": round(_IMPORT_SECONDS, 3),
+        "warmup_seconds": round(warmup_seconds, 3),
+        "warmed": warmed,
+        **MODEL_REGISTRY.report(),
+    }
+    print(f"[Startup] 🚀 워커 준비 완료: {app.state.startup_report} / 큐 설정: {QUEUE_SCHEDULER.settings()} "
+          f"/ CPU 풀: {CPU_POOL.settings()}")
+
+    # 면접 상태 복원 (재실행될 작업이 이어서 쓸 상태를 먼저 올림)
+    if STATE_SNAPSHOTTER is not None:
+        await STATE_SNAPSHOTTER.load()
+        STATE_SNAPSHOTTER.start()
+    # 보관 시간이 지난 끝난 작업 정리 → 재시작 전에 끝나지 않은 파이프라인 작업 재실행 (핸들러는 라우터 임포트 시 등록됨)
+    await purge_finished_jobs(force=True)
+    await replay_pending_jobs()
+    # 다중 워커 공유 큐 디스패처 시작 (QUEUE_SHARED_BACKEND 설정 시)
+    if SHARED_QUEUE is not None:
+        SHARED_QUEUE.start()
+    yield
+    # 종료 시 공유 큐 리스 반납 → 작업 큐 워커 정리 (실행 중 작업이 끝난 뒤 CPU 프로세스 풀 종료)
+    if SHARED_QUEUE is not None:
+        await SHARED_QUEUE.stop()
+    await QUEUE_SCHEDULER.shutdown()
+    # 큐 작업이 마지막으로 저장한 상태까지 스냅샷에 기록
+    if STATE_SNAPSHOTTER is not None:
+        await STATE_SNAPSHOTTER.stop()
+    await asyncio.to_thread(CPU_POOL.shutdown)
+    await asyncio.to_thread(shutdown_preprocess_pool)
 
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title="SK AXIS AI Interview FastAPI",
     description="AI 면접 실시간 녹음, 비언어적 분석, 평가 및 결과물 생성 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # ─── CORS 설정 ───
@@ -48,6 +112,7 @@ app.add_middleware(
 app.include_router(interview_router, prefix="/api/v1")  # 면접 관리: /api/v1/interview/*
 app.include_router(stt_router, prefix="/api/v1")        # STT 처리: /api/v1/stt/*
 app.include_router(result_router, prefix="/api/v1")     # 결과 조회: /api/v1/results/*
+app.include_router(admin_router, prefix="/api/v1")      # 운영 관리: /api/v1/admin/*
 
 # ─── 정적 파일 서빙 ───
 # 리포트 이미지, CSS, JS 등 정적 파일을 서빙하기 위한 설정
@@ -0,0 +1,57 @@
+"""
+SK AXIS AI 면접 운영 관리 라우터
+
+이 파일은 운영자가 서버 내부 상태를 확인하기 위한 API 엔드포인트를 정의합니다.
+주요 기능:
+- 작업 큐 상태 조회 (면접자별 대기 작업 수, 대기/실행 시간 분포, 실행 중 작업 수)
+- 공유 큐 사용 시 이 워커가 점유한 면접자와 공유 대기 면접자 목록
+- 상태 저장소 메모리 사용량/제거 현황/스냅샷 현황 조회
+
+API 엔드포인트:
+- GET /api/v1/admin/queues : 작업 큐 스냅샷
+- GET /api/v1/admin/state : 상태 저장소 현황
+
+참고사항:
+- 워커 수(QUEUE_WORKERS) 산정과 면접 종료 전 백로그 확인에 사용
+- 워커 프로세스별 지표이므로 다중 워커 배포 시 워커마다 값이 다름
+"""
+
+from typing import Any, Dict
+from fastapi import APIRouter
+
+from app.services.queue_executor import get_queue_snapshot
+from app.services.shared_queue import SHARED_QUEUE
+from app.state.store import INTERVIEW_STATE_STORE
+from app.state.snapshot import STATE_SNAPSHOTTER
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+@router.get("/queues")
+async def get_queues() -> Dict[str, Any]:
+    """
+    작업 큐 상태를 조회합니다.
+
+    Returns:
+        Dict[str, Any]:
+        - scheduler: 워커 수, 실행 중 작업 수, 대기 작업 수
+        - metrics: 대기 시간/작업 종류별 실행 시간 히스토그램, 완료/실패 카운터, in_flight
+        - interviewees: 면접자별 {"depth", "running", "oldest_wait_sec"}
+        - registry: 면접자 슬롯 수/누적 생성·정리 수 (작업이 끝난 면접자는 정리되어야 함)
+        - shared: 공유 큐 점유/대기 현황 (QUEUE_SHARED_BACKEND 미설정 시 None)
+    """
+    snapshot = get_queue_snapshot()
+    snapshot["shared"] = await SHARED_QUEUE.snapshot() if SHARED_QUEUE is not None else None
+    return snapshot
+
+@router.get("/state")
+async def get_state_store() -> Dict[str, Any]:
+    """
+    상태 저장소 현황을 조회합니다.
+
+    Returns:
+        Dict[str, Any]: backend, 메모리 상태 수/추정 바이트, 예산, 완료 후 TTL, 사유별 제거 수, 아카이브 위치,
+        snapshot (복원/기록/합치기 횟수, 스냅샷 미사용 시 None)
+    """
+    stats = INTERVIEW_STATE_STORE.stats()
+    stats["snapshot"] = STATE_SNAPSHOTTER.stats() if STATE_SNAPSHOTTER is not None else None
+    return stats
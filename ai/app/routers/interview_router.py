@@ -9,6 +9,7 @@ SK AXIS AI 면접 시스템 - 면접 라우터
 
 API 엔드포인트:
 - POST /interview/end: 면접 종료 및 최종 리포트 생성
+- DELETE /interview/{interviewee_id}/tasks: 면접자의 대기/실행 중 파이프라인 작업 취소
 
 주요 처리 흐름:
 1. 비언어적 데이터 수집 (표정)
@@ -24,6 +25,7 @@ API 엔드포인트:
 # app/routers/interview_router.py
 from fastapi import APIRouter, HTTPException
 import os
+import copy
 from dotenv import load_dotenv
 import httpx
 
@@ -38,10 +40,12 @@ from app.schemas.interview import (
 
 from app.services.pipeline.graph_pipeline import final_flow_executor, interview_flow_executor
 from app.schemas.state import InterviewState
-from app.state.store import INTERVIEW_STATE_STORE  # 전역 메모리 스토어
+from app.state.store import INTERVIEW_STATE_STORE  # 전역 상태 저장소 (STATE_BACKEND)
 from app.services.interview.nonverbal_service import evaluate
 from app.state.question_store import QUESTION_STORE
 
+from app.services.queue_executor import PRIORITY_INTERACTIVE, enqueue_task
+from app.services.shared_queue import cancel_interviewee, drain_interviewee
 from app.services.interview.interview_end_processing_service import (
     process_last_audio_segment,
     save_nonverbal_counts
@@ -57,6 +61,9 @@ os.makedirs(RESULT_DIR, exist_ok=True)
 
 SPRINGBOOT_BASE_URL = os.getenv("SPRING_API_URL", "http://localhost:8080/api/v1")
 
+# 면접 종료 시 대기 중인 STT 작업을 기다리는 최대 시간 (초)
+INTERVIEW_END_DRAIN_TIMEOUT_SEC = float(os.getenv("INTERVIEW_END_DRAIN_TIMEOUT_SEC", "60"))
+
 # ──────────────── 🚀 면접 시작 엔드포인트 (현재 비활성화) ────────────────
 # 
 # 현재 면접 시작은 SpringBoot에서 처리하므로 이 엔드포인트는 사용하지 않음
@@ -85,6 +92,53 @@ SPRINGBOOT_BASE_URL = os.getenv("SPRING_API_URL", "http://localhost:8080/api/v1"
 
 # ──────────────── 🏁 면접 종료 엔드포인트 ────────────────
 
+async def _run_final_evaluation(interviewee_id: int, state: dict, nv: NonverbalData, version: int) -> None:
+    """
+    면접자 한 명의 최종 평가를 실행하고 상태를 저장합니다 (interactive 레인 큐 작업).
+
+    Args:
+        state: get_versioned()로 읽은 상태 사본
+        version: state를 읽을 때의 버전 (저장 시 비교, 그 사이 바뀌었으면 평가 결과 필드만 병합)
+
+    처리 단계:
+    1. 아직 처리되지 않은 음성 파일 STT 처리
+    2. 비언어적 데이터 저장
+    3. 최종 리포트 생성 및 done 플래그 설정
+    """
+    base = copy.deepcopy(state)
+
+    # (1) 마지막 녹음 파일 STT 처리 (큐 작업이 처리한 파일은 audio_path가 비워져 있음)
+    audio_path = state.get("audio_path")
+    if audio_path:  # 처리할 음성 파일이 있는 경우
+        print(f"[DEBUG] audio_path 존재함: {audio_path}")
+        # LangGraph interview_flow_executor 실행 (STT → 재작성 → 평가)
+        state = await interview_flow_executor.ainvoke(state, config={"recursion_limit": 10})
+        # 중복 실행 방지
+        state["audio_path"] = ""
+        state["audio_paths"] = []
+
+    # (2) 비언어적 데이터 저장
+    state["nonverbal_counts"] = {
+        "expression": nv.facial_expression.dict(),
+        "timestamp": nv.timestamp,
+    }
+    print(f"[DEBUG] state['nonverbal_counts']: {state['nonverbal_counts']}")
+
+    # (3) 최종 리포트 생성
+    print(f"[DEBUG] final_flow_executor 실행 전 - done: {state.get('done')}")
+    # LangGraph final_flow_executor 실행 (종합 평가 → 최종 리포트)
+    state = await final_flow_executor.ainvoke(state, config={"recursion_limit": 10})
+    print(f"[DEBUG] final_flow_executor 실행 후 - done: {state.get('done')}")
+    
+    # done 플래그 수동 설정 (파이프라인에서 누락된 경우)
+    if state.get("done") is None and state.get("summary"):
+        state["done"] = True
+        print(f"[DEBUG] done 플래그 수동 설정 - summary 존재로 인해 완료 처리")
+    
+    # 처리 완료된 상태 저장 (평가 도중 늦게 저장된 STT 결과는 병합으로 보존)
+    await INTERVIEW_STATE_STORE.commit(interviewee_id, base, state, version)
+    print(f"[DEBUG] INTERVIEW_STATE_STORE 저장 완료 - interviewee_id: {interviewee_id}, done: {state.get('done')}")
+
 @router.post("/end", response_model=EndInterviewResponse)
 async def end_interview(req: EndInterviewRequest):
     """
@@ -97,11 +151,11 @@ async def end_interview(req: EndInterviewRequest):
         EndInterviewResponse: 처리 결과 및 리포트 생성 상태
     
     처리 과정:
-    1. 각 면접자별로 상태 데이터 조회
+    1. 면접자 작업 큐가 빌 때까지 대기 (업로드된 STT 작업 완료 후 상태 조회)
     2. 비언어적 데이터 변환 및 저장
-    3. 마지막 음성 파일 STT 처리 (interview_flow_executor)
-    4. 최종 리포트 생성 (final_flow_executor)
-    5. done 플래그 설정 및 상태 저장
+    3. 아직 처리되지 않은 음성 파일 STT 처리 (interview_flow_executor)
+    4. 최종 리포트 생성 (final_flow_executor) - interactive 우선순위 큐 작업으로 실행 후 완료 대기
+    5. done 플래그 설정 및 상태 저장 (버전 비교 저장 - 늦은 STT 쓰기와 서로 덮어쓰지 않음)
     
     Note:
         - LangGraph 기반 AI 파이프라인 실행
@@ -117,8 +171,15 @@ async def end_interview(req: EndInterviewRequest):
             interviewee_id = int(interviewee_id_str)
             print(f"[DEBUG] Processing interviewee_id: {interviewee_id}")
 
-            # 면접자 상태 데이터 조회
-            state = INTERVIEW_STATE_STORE.get(interviewee_id)
+            # 대기 중인 /stt/upload 작업이 끝날 때까지 대기 (마지막 답변 전사 누락/중복 방지)
+            drained = await drain_interviewee(interviewee_id, INTERVIEW_END_DRAIN_TIMEOUT_SEC)
+            if not drained:
+                print(f"[WARN] 작업 큐 대기 시간 초과({INTERVIEW_END_DRAIN_TIMEOUT_SEC}s) - 현재 상태로 평가 진행: {interviewee_id}")
+                # 남은 작업은 최종 평가에 반영되지 않으므로 취소 (LLM 호출 낭비 방지)
+                await cancel_interviewee(interviewee_id)
+
+            # 면접자 상태 데이터 조회 (큐 작업 반영 후)
+            state, version = await INTERVIEW_STATE_STORE.get_versioned(interviewee_id)
             print(f"[TRACE] INTERVIEW_STATE_STORE 조회: interviewee_id={interviewee_id}, found={state is not None}")
 
             # 상태 데이터 유효성 검증
@@ -132,35 +193,19 @@ async def end_interview(req: EndInterviewRequest):
                 nv = NonverbalData(**nv)
             print(f"[DEBUG] 변환된 nv 데이터: {nv}")
 
-            # (1) 마지막 녹음 파일 STT 처리
-            audio_path = state.get("audio_path")
-            if audio_path:  # 처리할 음성 파일이 있는 경우
-                print(f"[DEBUG] audio_path 존재함: {audio_path}")
-                # LangGraph interview_flow_executor 실행 (STT → 재작성 → 평가)
-                state = await interview_flow_executor.ainvoke(state, config={"recursion_limit": 10})
-                state["audio_path"] = ""  # 중복 실행 방지
-
-            # (2) 비언어적 데이터 저장
-            state["nonverbal_counts"] = {
-                "expression": nv.facial_expression.dict(),
-                "timestamp": nv.timestamp,
-            }
-            print(f"[DEBUG] state['nonverbal_counts']: {state['nonverbal_counts']}")
-
-            # (3) 최종 리포트 생성
-            print(f"[DEBUG] final_flow_executor 실행 전 - done: {state.get('done')}")
-            # LangGraph final_flow_executor 실행 (종합 평가 → 최종 리포트)
-            state = await final_flow_executor.ainvoke(state, config={"recursion_limit": 10})
-            print(f"[DEBUG] final_flow_executor 실행 후 - done: {state.get('done')}")
-            
-            # done 플래그 수동 설정 (파이프라인에서 누락된 경우)
-            if state.get("done") is None and state.get("summary"):
-                state["done"] = True
-                print(f"[DEBUG] done 플래그 수동 설정 - summary 존재로 인해 완료 처리")
-            
-            # 처리 완료된 상태 저장
-            INTERVIEW_STATE_STORE[interviewee_id] = state
-            print(f"[DEBUG] INTERVIEW_STATE_STORE 저장 완료 - interviewee_id: {interviewee_id}, done: {state.get('done')}")
+            # (1)~(3) 최종 평가를 interactive 레인 작업으로 실행 (진행 중인 다른 면접자의 STT보다 우선)
+            handle = await enqueue_task(
+                interviewee_id,
+                lambda: _run_final_evaluation(interviewee_id, state, nv, version),
+                priority=PRIORITY_INTERACTIVE,
+                kind="final_evaluation",
+            )
+            await handle.wait()
+            if handle.future.cancelled():
+                print(f"[WARN] 최종 평가 작업이 취소됨 - interviewee_id: {interviewee_id}")
+                skipped_ids.append(interviewee_id)
+                continue
+            handle.future.result()  # 평가 중 예외는 그대로 전달 (500 응답)
 
             processed_count += 1
 
@@ -182,3 +227,20 @@ async def end_interview(req: EndInterviewRequest):
         traceback.print_exc()
         print(f"[DEBUG] Exception: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# ──────────────── 🛑 작업 취소 엔드포인트 ────────────────
+
+@router.delete("/{interviewee_id}/tasks")
+async def cancel_interview_tasks(interviewee_id: int):
+    """
+    면접자의 대기 중/실행 중 파이프라인 작업을 취소합니다.
+
+    면접자가 제외되었거나 면접이 중단된 경우, 아무도 읽지 않을 STT/LLM 작업이
+    워커 시간을 쓰지 않도록 호출합니다.
+
+    Returns:
+        dict: {"interviewee_id": int, "cancelled": 취소된 작업 수}
+    """
+    cancelled = await cancel_interviewee(interviewee_id)
+    return {"interviewee_id": interviewee_id, "cancelled": cancelled}
@@ -5,16 +5,22 @@ SK AXIS AI 면접 결과 조회 라우터
 주요 기능:
 - 면접 평가 상태 확인 (PENDING/DONE) - 폴링용
 - 최종 평가 결과 조회 (점수, 사유 등 상세 정보)
+- 파이프라인 결정 로그 전체 조회 (디버깅/감사용)
 
 API 엔드포인트:
 - GET /api/v1/results/statuses : 평가 상태 확인 (프론트엔드 폴링용)
 - GET /api/v1/results : 최종 평가 결과 조회 (상세 정보 포함)
+- GET /api/v1/results/{interviewee_id}/decision-log : 결정 로그 조회
 """
 
+import asyncio
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException, Query
 from dotenv import load_dotenv
 
 from app.state.store import INTERVIEW_STATE_STORE
+from app.services.decision_log import read_decision_log
 from app.schemas.result import (
     ResultStatusResponse,
     ResultStatusListResponse,
@@ -58,8 +64,8 @@ async def get_result_statuses(
 
         result_statuses: list[ResultStatusResponse] = []
         for interviewee_id in id_list:
-            # 메모리 저장소에서 면접 상태 조회
-            state = INTERVIEW_STATE_STORE.get(interviewee_id)
+            # 상태 저장소에서 면접 상태 조회
+            state = await INTERVIEW_STATE_STORE.get(interviewee_id)
             print(f"[DEBUG] /statuses - interviewee_id={interviewee_id}, state_exists={state is not None}")
             if state:
                 print(f"[DEBUG] /statuses - state_type={type(state)}, done_flag={state.get('done') if isinstance(state, dict) else 'N/A'}")
@@ -120,8 +126,8 @@ async def get_final_results(
 
         results: list[FinalResultResponse] = []
         for interviewee_id in id_list:
-            # 메모리 저장소에서 면접 상태 조회
-            state = INTERVIEW_STATE_STORE.get(interviewee_id)
+            # 상태 저장소에서 면접 상태 조회
+            state = await INTERVIEW_STATE_STORE.get(interviewee_id)
             
             # 평가 완료되지 않은 면접자는 결과에서 제외
             if not state or not isinstance(state, dict) or not state.get("done", False):
@@ -203,3 +209,20 @@ async def get_final_results(
     except Exception as e:
         import traceback; traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"결과 조회 중 오류 발생: {e}")
+
+@router.get("/{interviewee_id}/decision-log")
+async def get_decision_log(
+    interviewee_id: int,
+    step: Optional[str] = Query(None, description="이 단계의 로그만 조회 ex) rewrite_judge_agent"),
+    limit: Optional[int] = Query(None, ge=0, description="최근 N개만 조회"),
+):
+    """
+    면접자의 파이프라인 결정 로그 전체를 조회하는 API
+
+    상태에는 최근 항목만 남기 때문에, 전체 처리 과정은 결정 로그 저장소에서 읽어 옵니다.
+
+    Returns:
+        dict: {"interviewee_id": int, "count": int, "entries": [{"step", "result", "time", "details"}]}
+    """
+    entries = await asyncio.to_thread(read_decision_log, interviewee_id, step, limit)
+    return {"interviewee_id": interviewee_id, "count": len(entries), "entries": entries}
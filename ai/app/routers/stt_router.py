@@ -11,9 +11,9 @@ SK AXIS AI 면접 STT (Speech-to-Text) API 라우터
 처리 흐름:
 1. 오디오 파일 업로드 및 저장
 2. 면접자별 Lock 획득 (동시성 제어)
-3. 파이프라인 작업을 큐에 등록
+3. 파이프라인 작업 기술자를 영구 큐(SQLite, 다중 워커 배포 시 Redis 공유 큐)에 기록 후 등록
 4. 클라이언트에 즉시 응답 반환
-5. 백그라운드에서 STT → 리라이팅 → 평가 실행
+5. 백그라운드에서 STT → 리라이팅 → 평가 실행 (밀린 업로드는 묶어서 한 번에 실행)
 
 성능 특징:
 - 비동기 처리로 빠른 응답 시간
@@ -24,15 +24,132 @@ SK AXIS AI 면접 STT (Speech-to-Text) API 라우터
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from app.schemas.interview import STTUploadResponse
 from app.services.interview.stt_service import save_audio_file
-from app.services.queue_executor import enqueue_task  # ⬅️ 인터뷰이별 큐 실행기
-import asyncio
+from app.services.interview.stt_cache import audio_content_digest
+from app.services.queue_executor import register_job_handler  # ⬅️ 인터뷰이별 큐 실행기
+from app.services.shared_queue import submit_job
+from app.services.interviewee_registry import INTERVIEWEE_REGISTRY  # ⬅️ 인터뷰이별 Lock/큐 레지스트리
+from typing import Any, Dict, List
+import os
 
 # ──────────────── 🌐 라우터 설정 ────────────────
 router = APIRouter(prefix="/stt", tags=["STT"])
 
 # ──────────────── 🔒 동시성 제어 ────────────────
-# 인터뷰이별 Lock 관리 (순차 처리 보장)
-interviewee_locks = {}
+# 인터뷰이별 Lock은 INTERVIEWEE_REGISTRY가 관리 (순차 처리 보장, 등록이 끝나고 유휴가 되면 정리)
+
+# ──────────────── 🧩 파이프라인 작업 핸들러 ────────────────
+# 큐에는 클로저 대신 작업 기술자({"audio_path": ...})를 저장하고, 이 핸들러가 실행
+STT_PIPELINE_JOB = "stt_pipeline"
+STT_JOB_DEADLINE_SEC = float(os.getenv("STT_JOB_DEADLINE_SEC", "600"))  # 업로드 후 이 시간 안에 처리되지 않으면 폐기
+
+async def process_stt_job(interviewee_id: int, payload: Dict[str, Any]):
+    """
+    백그라운드에서 실행될 파이프라인 처리 함수 ("stt_pipeline" 작업 핸들러)
+
+    Args:
+        interviewee_id (int): 면접자 고유 ID
+        payload (Dict): {"audio_path": 업로드 저장 경로}
+    """
+    await process_stt_jobs(interviewee_id, [payload])
+
+async def process_stt_jobs(interviewee_id: int, payloads: List[Dict[str, Any]]):
+    """
+    대기 중이던 여러 업로드를 한 번의 파이프라인 실행으로 처리합니다 ("stt_pipeline" 묶음 핸들러)
+
+    Args:
+        interviewee_id (int): 면접자 고유 ID
+        payloads (List[Dict]): 업로드 순서대로의 [{"audio_path": 업로드 저장 경로}, ...]
+
+    처리 단계:
+    1. 상태 로딩 또는 초기화
+    2. LangGraph 파이프라인 실행 (세그먼트별 STT → 합쳐서 리라이팅 1회)
+    3. 결과를 전역 저장소에 저장 (읽을 때의 버전과 비교, 바뀌었으면 변경 필드만 병합)
+    4. 처리 로그 출력
+
+    Note:
+        - 워커가 밀려 같은 면접자의 업로드가 쌓이면 큐가 묶어서 넘김 (LLM 호출 수 절감)
+        - 파이프라인 실행 중에는 잠금을 잡지 않음 - 그 사이 면접이 종료(done)되면 결과는 버림
+    """
+    from app.state.store import INTERVIEW_STATE_STORE
+    from app.state.question_store import QUESTION_STORE
+    from app.services.pipeline.graph_pipeline import interview_flow_executor
+    from app.services.interview.state_service import create_initial_state
+    import copy
+    import traceback
+
+    file_paths = []
+    for payload in payloads:
+        if os.path.exists(payload["audio_path"]):
+            file_paths.append(payload["audio_path"])
+        else:
+            # 재시작 후 재실행 시 업로드 파일이 정리된 경우
+            print(f"[process] ⚠ 오디오 파일 없음 - 작업 생략: {payload['audio_path']}")
+    if not file_paths:
+        return
+    file_path = file_paths[-1]
+
+    print(f"\n{'='*30}")
+    print(f"[process] ▶ 인터뷰이 ID: {interviewee_id}")
+    print(f"[process] ▶ 오디오 경로 ({len(file_paths)}개): {file_paths}")
+
+    # 기존 상태 로딩 또는 새로 생성
+    state, version = await INTERVIEW_STATE_STORE.get_versioned(interviewee_id)
+    base = copy.deepcopy(state)  # 병합 기준 (파이프라인이 state를 직접 수정하므로 따로 보관)
+    if state is not None and state.get("done"):
+        # 이미 최종 평가가 끝난 면접 - 결과를 읽을 곳이 없으므로 처리 생략
+        print(f"[process] ⏭ 종료된 면접의 늦은 업로드 - 작업 생략: {file_paths}")
+        return
+    if state is None:
+        print(f"[process] ℹ️ 상태 없음 → 새로 생성")
+        questions = QUESTION_STORE.get(interviewee_id, [])
+        # print(f"[process] 🔍 질문 목록 ({len(questions)}개): {questions}")
+        if not questions:
+            print(f"[process] ⚠ 질문 목록이 비어 있습니다.")
+        state = create_initial_state(interviewee_id, questions, file_path)
+    else:
+        print(f"[process] 🔁 기존 상태 로딩")
+        state["audio_path"] = file_path
+    state["audio_paths"] = file_paths
+
+    # 상태 요약 출력 (디버깅용)
+    print(f"[process] ▶ 상태 요약:")
+    for k, v in state.items():
+        if isinstance(v, (list, dict)):
+            print(f"  - {k}: (len={len(v)})")
+        else:
+            print(f"  - {k}: {v}")
+
+    try:
+        print(f"[process] ▶ LangGraph 실행 시작")
+        # STT → 리라이팅 파이프라인 실행
+        state = await interview_flow_executor.ainvoke(state, config={"recursion_limit": 10})
+        # 처리 완료 - 면접 종료 시 같은 파일 재전사 방지
+        state["audio_path"] = ""
+        state["audio_paths"] = []
+        print(f"[process] ✅ 파이프라인 완료")
+    except Exception as e:
+        print(f"[process] ❌ LangGraph 실행 오류: {e}")
+        traceback.print_exc()
+        return
+
+    # ─── 상태 저장 및 타입 검증 ───
+    print(f"[TRACE] INTERVIEW_STATE_STORE 저장 전: interviewee_id={interviewee_id}, state type={type(state)}")
+    if not isinstance(state, dict):
+        print(f"[ERROR] [STT_ROUTER] state에 dict가 아닌 값이 저장되려 합니다! 실제 타입: {type(state)}, 값: {state}")
+    saved = await INTERVIEW_STATE_STORE.commit(interviewee_id, base, state, version, skip_if_done=True)
+    if saved is None:
+        print(f"[process] ⏭ 파이프라인 실행 중 면접 종료 - 결과 저장 생략: {file_paths}")
+        return
+    print(f"[TRACE] INTERVIEW_STATE_STORE 저장 완료: interviewee_id={interviewee_id}, backend={INTERVIEW_STATE_STORE.backend}")
+
+    # ─── STT 결과 요약 출력 ───
+    print(f"[process] ▶ STT 세그먼트 요약:")
+    for i, seg in enumerate(state.get("stt", {}).get("segments", [])):
+        print(f"  [{i}] {seg['timestamp']} - {seg['raw'][:50]}...")
+
+    print(f"{'='*30}\n")
+
+register_job_handler(STT_PIPELINE_JOB, process_stt_job, batch_handler=process_stt_jobs)
 
 @router.post("/upload", response_model=STTUploadResponse)
 async def upload_stt(
@@ -52,7 +169,7 @@ async def upload_stt(
     처리 과정:
     1. 오디오 파일 저장 (면접자 ID별 디렉토리)
     2. 면접자별 Lock 생성 및 획득
-    3. 파이프라인 작업 정의 및 큐 등록
+    3. 파이프라인 작업 기술자 기록 및 큐 등록 (서버 재시작 시 재실행)
     4. 즉시 응답 반환 (비동기 처리)
     
     Note:
@@ -77,80 +194,18 @@ async def upload_stt(
         print(f"[upload_stt] ✅ 오디오 저장 완료: {file_path}")
 
         # ─── 2) 인터뷰이별 Lock 생성 (순차 처리 보장) ───
-        if interviewee_id not in interviewee_locks:
-            interviewee_locks[interviewee_id] = asyncio.Lock()
-        
-        async with interviewee_locks[interviewee_id]:
+        async with INTERVIEWEE_REGISTRY.locked(interviewee_id, "upload"):
             print(f"[upload_stt] 🔒 Lock 획득 - 인터뷰이 {interviewee_id}")
             
-            # ─── 3) 실제 작업 정의 (큐에 넣을 비동기 함수) ───
-            async def process():
-                """
-                백그라운드에서 실행될 파이프라인 처리 함수
-                
-                처리 단계:
-                1. 상태 로딩 또는 초기화
-                2. LangGraph 파이프라인 실행 (STT → 리라이팅)
-                3. 결과를 전역 저장소에 저장
-                4. 처리 로그 출력
-                """
-                from app.state.store import INTERVIEW_STATE_STORE
-                from app.state.question_store import QUESTION_STORE
-                from app.services.pipeline.graph_pipeline import interview_flow_executor
-                from app.services.interview.state_service import create_initial_state
-                import traceback
-
-                print(f"\n{'='*30}")
-                print(f"[process] ▶ 인터뷰이 ID: {interviewee_id}")
-                print(f"[process] ▶ 오디오 경로: {file_path}")
-
-                # 기존 상태 로딩 또는 새로 생성
-                state = INTERVIEW_STATE_STORE.get(interviewee_id)
-                if state is None:
-                    print(f"[process] ℹ️ 상태 없음 → 새로 생성")
-                    questions = QUESTION_STORE.get(interviewee_id, [])
-                    # print(f"[process] 🔍 질문 목록 ({len(questions)}개): {questions}")
-                    if not questions:
-                        print(f"[process] ⚠ 질문 목록이 비어 있습니다.")
-                    state = create_initial_state(interviewee_id, questions, file_path)
-                else:
-                    print(f"[process] 🔁 기존 상태 로딩")
-                    state["audio_path"] = file_path
-
-                # 상태 요약 출력 (디버깅용)
-                print(f"[process] ▶ 상태 요약:")
-                for k, v in state.items():
-                    if isinstance(v, (list, dict)):
-                        print(f"  - {k}: (len={len(v)})")
-                    else:
-                        print(f"  - {k}: {v}")
-
-                try:
-                    print(f"[process] ▶ LangGraph 실행 시작")
-                    # STT → 리라이팅 파이프라인 실행
-                    state = await interview_flow_executor.ainvoke(state, config={"recursion_limit": 10})
-                    print(f"[process] ✅ 파이프라인 완료")
-                except Exception as e:
-                    print(f"[process] ❌ LangGraph 실행 오류: {e}")
-                    traceback.print_exc()
-                    return
-
-                # ─── 상태 저장 및 타입 검증 ───
-                print(f"[TRACE] INTERVIEW_STATE_STORE 저장 전: interviewee_id={interviewee_id}, state type={type(state)}")
-                if not isinstance(state, dict):
-                    print(f"[ERROR] [STT_ROUTER] state에 dict가 아닌 값이 저장되려 합니다! 실제 타입: {type(state)}, 값: {state}")
-                INTERVIEW_STATE_STORE[interviewee_id] = state
-                print(f"[TRACE] INTERVIEW_STATE_STORE 저장 완료: interviewee_id={interviewee_id}, state type={type(INTERVIEW_STATE_STORE[interviewee_id])}")
-
-                # ─── STT 결과 요약 출력 ───
-                print(f"[process] ▶ STT 세그먼트 요약:")
-                for i, seg in enumerate(state.get("stt", {}).get("segments", [])):
-                    print(f"  [{i}] {seg['timestamp']} - {seg['raw'][:50]}...")
-
-                print(f"{'='*30}\n")
-
-            # ─── 4) 큐에 등록 ───
-            await enqueue_task(interviewee_id, process)
+            # ─── 3) 작업 기술자를 영구 큐에 등록 (재시작 시 재실행) ───
+            # 같은 오디오 재업로드는 아직 시작 전인 이전 작업을 대체
+            # (QUEUE_SHARED_BACKEND 설정 시 다중 워커 공유 큐에 등록)
+            job_id = await submit_job(
+                interviewee_id, STT_PIPELINE_JOB, {"audio_path": file_path},
+                deadline_sec=STT_JOB_DEADLINE_SEC,
+                supersede_key=f"audio:{audio_content_digest(file_path)}",
+            )
+            print(f"[upload_stt] 📥 작업 등록: job {job_id}")
             print(f"[upload_stt] 🔓 Lock 해제 - 인터뷰이 {interviewee_id}")
 
         # ─── 5) 클라이언트에 즉시 응답 ───
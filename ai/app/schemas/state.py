@@ -11,6 +11,7 @@ SK AXIS AI 면접 파이프라인 상태 관리 스키마
 상태 병합 전략:
 - dict_merge: 딕셔너리 병합 (덮어쓰기)
 - operator.add: 리스트 추가 (누적)
+- bounded_log_merge: 로그 리스트 추가 후 최근 DECISION_LOG_STATE_TAIL개만 유지
 - 단일 값: 최신 값으로 덮어쓰기
 
 LangGraph 연동:
@@ -19,9 +20,13 @@ LangGraph 연동:
 - 파이프라인 완료까지 상태 유지
 """
 
+import os
 import operator
 from typing import TypedDict, Annotated, Dict, Any, List
 
+# 상태에 남겨 두는 decision_log 최근 항목 수 (전체 로그는 app.services.decision_log)
+DECISION_LOG_STATE_TAIL = int(os.getenv("DECISION_LOG_STATE_TAIL", "20"))
+
 # ──────────────── 🔧 유틸리티 함수 ────────────────
 
 def dict_merge(a: Dict[Any, Any], b: Dict[Any, Any]) -> Dict[Any, Any]:
@@ -44,6 +49,25 @@ def dict_merge(a: Dict[Any, Any], b: Dict[Any, Any]) -> Dict[Any, Any]:
     merged.update(b)
     return merged
 
+def bounded_log_merge(a: List[Any], b: List[Any]) -> List[Any]:
+    """
+    로그 리스트를 이어 붙이고 최근 DECISION_LOG_STATE_TAIL개만 남깁니다.
+
+    Args:
+        a (List[Any]): 기존 로그
+        b (List[Any]): 노드가 반환한 로그
+
+    Returns:
+        List[Any]: 병합된 새 리스트 (최근 항목만)
+
+    Note:
+        - 노드가 기존 리스트에 append한 뒤 상태 전체를 반환하면 b가 a로 시작하므로
+          a + b로 중복 누적하지 않고 b를 그대로 사용
+    """
+    a, b = a or [], b or []
+    merged = b if b[:len(a)] == a else a + b
+    return merged[-DECISION_LOG_STATE_TAIL:]
+
 # ──────────────── 📊 면접 상태 정의 ────────────────
 
 class InterviewState(TypedDict, total=False):
@@ -54,12 +78,13 @@ class InterviewState(TypedDict, total=False):
         interviewee_id (int): 면접자 고유 식별자 (단일 값)
         questions (List[Any]): 면접 질문 목록 (리스트 추가)
         audio_path (str): 현재 처리 중인 오디오 파일 경로 (단일 값)
+        audio_paths (List[str]): 큐에서 묶여 한 번에 처리할 오디오 파일 경로 목록 (단일 값)
         stt (Dict[str, Any]): STT 결과 딕셔너리 (병합)
         rewrite (Dict[str, Any]): 리라이팅 결과 딕셔너리 (병합)
         evaluation (Dict[str, Any]): 평가 결과 딕셔너리 (병합)
         summary (Dict[str, Any]): 최종 요약 결과 딕셔너리 (병합)
         report (Dict[str, Any]): 리포트 생성 결과 딕셔너리 (병합)
-        decision_log (List[Any]): 파이프라인 처리 로그 (리스트 추가)
+        decision_log (List[Any]): 파이프라인 처리 로그 최근 항목 (전체는 decision_log 저장소)
         nonverbal_counts (Dict[str, Any]): 비언어적 데이터 딕셔너리 (병합)
         
     Note:
@@ -76,10 +101,13 @@ class InterviewState(TypedDict, total=False):
 
     # ─── 현재 처리 파일 ───
     audio_path: str  # 오디오 파일 경로 (단일 값, 덮어쓰기)
+    audio_paths: List[str]  # 묶음 처리할 오디오 파일 경로 목록 (단일 값, 덮어쓰기 - 비어 있으면 audio_path 사용)
 
     # ─── 파이프라인 단계별 결과 (딕셔너리 병합) ───
     stt: Annotated[Dict[str, Any], dict_merge]  # STT 결과
-    # 구조: {"done": bool, "segments": [{"raw": str, "timestamp": str}]}
+    # 구조: {"done": bool, "segments": [{"raw": str, "timestamp": str, "audio": {...}, "audio_sha256": str, "container_ms": int}],
+    #        "last_result": "ok" | "silent" | "duplicate", "last_added": 이번 실행에서 추가된 세그먼트 수,
+    #        "audio_totals": {"original_ms", "output_ms", "removed_ms", "silent_skipped", "duplicate_skipped", "container_ms"}}
     
     rewrite: Annotated[Dict[str, Any], dict_merge]  # 리라이팅 결과
     # 구조: {"done": bool, "items": [...], "final": [...], "retry_count": int}
@@ -95,7 +123,7 @@ class InterviewState(TypedDict, total=False):
     # 구조: {"pdf_path": str}
 
     # ─── 로깅 및 추적 ───
-    decision_log: Annotated[List[Any], operator.add]  # 처리 로그 (리스트 추가)
+    decision_log: Annotated[List[Any], bounded_log_merge]  # 처리 로그 최근 항목 (전체는 app.services.decision_log)
     # 구조: [{"step": str, "result": str, "time": str, "details": {...}}]
 
     # ─── 비언어적 데이터 ───
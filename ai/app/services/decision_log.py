@@ -0,0 +1,157 @@
+"""
+SK AXIS AI 면접 파이프라인 결정 로그 저장소
+
+이 파일은 파이프라인 노드의 처리 기록(decision_log)을 상태 밖의
+면접자별 추가 전용(append-only) 로그로 보관하는 모듈입니다.
+주요 기능:
+- log_decision(state, entry): 로그 저장소에 기록 + 상태에는 최근 DECISION_LOG_STATE_TAIL개만 유지
+- 면접자별 JSONL 파일 (전체 로그, 백그라운드 스레드가 기록 → 이벤트 루프 비차단)
+- 파일 없이 쓰는 경우 면접자별 메모리 링 버퍼 (최근 DECISION_LOG_RING_SIZE개, 최근 사용한 DECISION_LOG_MAX_RINGS명까지)
+- read_decision_log(): 전체 로그 조회 (단계 필터, 최근 N개)
+
+사용 목적:
+- LangGraph ainvoke/병합마다 복사되던 로그 리스트를 작게 유지 (상태 크기/병합 비용 절감)
+- 면접 종료 후에도 전체 처리 과정 추적 (GET /api/v1/results/{interviewee_id}/decision-log)
+
+백엔드 (DECISION_LOG_SINK):
+- jsonl (기본): DECISION_LOG_DIR/{interviewee_id}.jsonl
+- memory: 링 버퍼 (테스트/로컬용, 재시작 시 소실, 면접자 수가 상한을 넘으면 가장 오래 사용하지 않은 링부터 제거)
+"""
+
+import os
+import json
+import queue
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from app.constants.data_paths import data_path
+from app.schemas.state import DECISION_LOG_STATE_TAIL
+
+# ──────────────── ⚙️ 로그 설정 ────────────────
+DECISION_LOG_SINK = os.getenv("DECISION_LOG_SINK", "jsonl")                     # "jsonl" | "memory"
+DECISION_LOG_DIR = os.getenv("DECISION_LOG_DIR", data_path("decision_log"))     # 면접자별 JSONL 파일 위치
+DECISION_LOG_RING_SIZE = int(os.getenv("DECISION_LOG_RING_SIZE", "500"))        # 면접자별 메모리 보관 개수
+DECISION_LOG_MAX_RINGS = int(os.getenv("DECISION_LOG_MAX_RINGS", "1000"))       # 메모리 링을 유지할 면접자 수 (LRU)
+
+KST = timezone(timedelta(hours=9), "KST")
+
+
+class DecisionLogSink:
+    """
+    면접자별 추가 전용 결정 로그
+
+    Note:
+        - directory가 있으면 append()는 파일 기록을 큐에 넘긴 뒤 바로 반환
+          (데몬 스레드 하나가 순서대로 기록 → 면접자별 기록 순서 보장, 메모리에는 남기지 않음)
+        - directory가 없으면 면접자별 링 버퍼에 최근 ring_size개만 보관하고,
+          링은 최근 기록/조회한 max_rings명까지만 유지 (면접자가 계속 늘어도 메모리 상한 유지)
+    """
+
+    def __init__(self, directory: Optional[str] = DECISION_LOG_DIR, ring_size: int = DECISION_LOG_RING_SIZE,
+                 max_rings: int = DECISION_LOG_MAX_RINGS):
+        self.directory = directory or None
+        self.ring_size = ring_size
+        self.max_rings = max(1, max_rings)
+        self._rings: "OrderedDict[int, Deque[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    def _path(self, interviewee_id: int) -> str:
+        return os.path.join(self.directory, f"{interviewee_id}.jsonl")
+
+    def append(self, interviewee_id: int, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            if not self.directory:
+                ring = self._rings.get(interviewee_id)
+                if ring is None:
+                    ring = self._rings[interviewee_id] = deque(maxlen=self.ring_size)
+                    while len(self._rings) > self.max_rings:
+                        self._rings.popitem(last=False)
+                else:
+                    self._rings.move_to_end(interviewee_id)
+                ring.append(entry)
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="decision-log-writer", daemon=True)
+                self._writer.start()
+        self._pending.put((interviewee_id, json.dumps(entry, ensure_ascii=False, default=str)))
+
+    def _write_loop(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        while True:
+            interviewee_id, line = self._pending.get()
+            try:
+                with open(self._path(interviewee_id), "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                print(f"[DecisionLog] ⚠️ 로그 기록 실패: {interviewee_id} - {e}")
+            finally:
+                self._pending.task_done()
+
+    def flush(self) -> None:
+        """대기 중인 파일 기록이 끝날 때까지 기다립니다."""
+        if self._writer is not None:
+            self._pending.join()
+
+    def read(self, interviewee_id: int) -> List[Dict[str, Any]]:
+        if self.directory:
+            self.flush()
+            try:
+                with open(self._path(interviewee_id), "r", encoding="utf-8") as f:
+                    return [json.loads(line) for line in f if line.strip()]
+            except FileNotFoundError:
+                return []
+        with self._lock:
+            ring = self._rings.get(interviewee_id)
+            if ring is None:
+                return []
+            self._rings.move_to_end(interviewee_id)
+            return list(ring)
+
+
+# ──────────────── 📦 전역 로그 저장소 ────────────────
+DECISION_LOG = DecisionLogSink(DECISION_LOG_DIR if DECISION_LOG_SINK == "jsonl" else None)
+
+
+def log_decision(state: Dict[str, Any], entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    파이프라인 결정 로그를 기록합니다.
+
+    Args:
+        state: 면접 상태 (interviewee_id, decision_log 사용)
+        entry: {"step": str, "result": str, "time": str(없으면 현재 KST), "details": {...}}
+
+    Returns:
+        Dict: 기록된 항목
+
+    Note:
+        - 전체 로그는 DECISION_LOG에, 상태의 decision_log에는 최근 DECISION_LOG_STATE_TAIL개만 유지
+    """
+    entry.setdefault("time", datetime.now(KST).isoformat())
+    interviewee_id = state.get("interviewee_id")
+    if interviewee_id is not None:
+        DECISION_LOG.append(interviewee_id, entry)
+    tail = state.setdefault("decision_log", [])
+    tail.append(entry)
+    del tail[:-DECISION_LOG_STATE_TAIL]
+    return entry
+
+
+def read_decision_log(interviewee_id: int, step: Optional[str] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    면접자의 전체 결정 로그를 기록 순서대로 반환합니다.
+
+    Args:
+        step: 이 단계(step)의 항목만 반환
+        limit: 최근 limit개만 반환
+    """
+    entries = DECISION_LOG.read(interviewee_id)
+    if step is not None:
+        entries = [e for e in entries if e.get("step") == step]
+    if limit is not None:
+        entries = entries[-limit:] if limit > 0 else []
+    return entries
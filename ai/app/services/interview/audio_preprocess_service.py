@@ -0,0 +1,334 @@
+"""
+SK AXIS AI 면접 오디오 전처리 서비스 (STT 이전 단계)
+
+이 파일은 업로드된 음성을 STT에 보내기 전에 정리하는 전처리 서비스입니다.
+주요 기능:
+- 에너지 기반 음성 구간 검출 (VAD, NumPy)
+- 앞/뒤 무음 제거 및 긴 내부 무음 축소
+- 전체가 무음인 클립 감지 (STT 호출 생략)
+- 제거된 오디오 길이 기록
+- 16kHz 모노 Opus/FLAC 트랜스코딩 (업로드 용량 축소) 및 크기/길이 리포트
+- 전용 워커 풀에서 실행 (이벤트 루프 비차단, 첫 사용 시 MODEL_REGISTRY에서 생성)
+- 긴 답변을 겹치는 구간으로 분할 (병렬 전사용)
+
+처리 흐름:
+save_audio_file → prepare_audio_for_stt_async
+    (디코딩 1회 → 16kHz 모노 변환 → VAD → 압축 포맷으로 저장) → transcribe_audio_file
+
+성능 효과:
+- STT 지연/비용이 실제 발화 길이에 비례하도록 무음 구간 제거
+- 무음 클립은 STT API를 아예 호출하지 않음
+- 스테레오/고비트레이트 WebM 대비 전송 용량 감소, API 크기 제한 회피
+"""
+
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from pydub import AudioSegment
+
+from app.services.model_registry import MODEL_REGISTRY
+
+# ──────────────── ⚙️ VAD 설정 ────────────────
+VAD_ENABLED = os.getenv("STT_VAD_ENABLED", "true").lower() == "true"
+VAD_FRAME_MS = int(os.getenv("STT_VAD_FRAME_MS", "30"))                # 에너지 계산 프레임 길이
+VAD_MIN_DBFS = float(os.getenv("STT_VAD_MIN_DBFS", "-45"))             # 이보다 작은 에너지는 항상 무음
+VAD_NOISE_MARGIN_DB = float(os.getenv("STT_VAD_NOISE_MARGIN_DB", "12")) # 배경 소음 대비 발화 판정 여유
+VAD_MAX_SILENCE_MS = int(os.getenv("STT_VAD_MAX_SILENCE_MS", "700"))   # 이보다 긴 내부 무음은 축소
+VAD_KEEP_SILENCE_MS = int(os.getenv("STT_VAD_KEEP_SILENCE_MS", "200")) # 발화 앞뒤로 남길 여유
+VAD_MIN_SPEECH_MS = int(os.getenv("STT_VAD_MIN_SPEECH_MS", "250"))     # 이보다 짧은 발화만 있으면 무음 클립
+VAD_MIN_GAIN_MS = int(os.getenv("STT_VAD_MIN_GAIN_MS", "300"))         # 제거량이 이보다 작으면 트리밍 생략
+
+# ──────────────── ⚙️ 트랜스코딩 설정 ────────────────
+TRANSCODE_ENABLED = os.getenv("STT_TRANSCODE_ENABLED", "true").lower() == "true"
+TRANSCODE_FORMAT = os.getenv("STT_TRANSCODE_FORMAT", "opus")           # "opus" | "flac"
+TRANSCODE_SAMPLE_RATE = int(os.getenv("STT_TRANSCODE_SAMPLE_RATE", "16000"))
+TRANSCODE_OPUS_BITRATE = os.getenv("STT_TRANSCODE_OPUS_BITRATE", "24k")
+
+# 포맷별 (확장자, pydub export 인자)
+_TRANSCODE_OUTPUTS = {
+    "opus": ("ogg", {"format": "ogg", "codec": "libopus", "bitrate": TRANSCODE_OPUS_BITRATE}),
+    "flac": ("flac", {"format": "flac"}),
+}
+
+# ──────────────── 🧵 전처리 워커 풀 ────────────────
+AUDIO_PREPROCESS_WORKERS = int(os.getenv("AUDIO_PREPROCESS_WORKERS", "2"))
+_PREPROCESS_POOL_NAME = "audio_preprocess_pool"
+
+
+def _create_preprocess_pool() -> ThreadPoolExecutor:
+    """전처리 워커 풀 생성 (임포트 시점이 아닌 첫 전처리 요청 시)"""
+    return ThreadPoolExecutor(max_workers=AUDIO_PREPROCESS_WORKERS, thread_name_prefix="audio-prep")
+
+
+MODEL_REGISTRY.register(_PREPROCESS_POOL_NAME, _create_preprocess_pool)
+
+
+def shutdown_preprocess_pool(wait: bool = True) -> None:
+    """
+    전처리 워커 풀을 종료합니다 (생성된 적 없으면 아무것도 하지 않음).
+    FastAPI lifespan 종료 단계에서 호출하며, 이후 요청이 오면 풀을 새로 만듭니다.
+    """
+    pool = MODEL_REGISTRY.release(_PREPROCESS_POOL_NAME)
+    if pool is not None:
+        pool.shutdown(wait=wait)
+        print("[전처리] 🧵 전처리 워커 풀 종료")
+
+
+@dataclass
+class PreparedAudio:
+    """
+    STT 전처리 결과
+
+    Attributes:
+        path (str): STT에 보낼 파일 경로 (트리밍 결과 또는 원본)
+        source_path (str): 원본 업로드 경로
+        original_ms (int): 원본 길이 (ms)
+        output_ms (int): 전처리 후 길이 (ms)
+        original_bytes (int): 원본 파일 크기
+        output_bytes (int): STT에 보낼 파일 크기
+        output_format (str): STT에 보낼 파일 포맷 ("source"면 원본 그대로)
+        is_silent (bool): 발화가 없는 클립 여부 (STT 생략 대상)
+    """
+    path: str
+    source_path: str
+    original_ms: int
+    output_ms: int
+    original_bytes: int = 0
+    output_bytes: int = 0
+    output_format: str = "source"
+    is_silent: bool = False
+
+    @property
+    def removed_ms(self) -> int:
+        return max(self.original_ms - self.output_ms, 0)
+
+    @property
+    def is_derived(self) -> bool:
+        """전처리로 새 파일이 만들어졌는지 여부 (STT 후 삭제 대상)"""
+        return self.path != self.source_path
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop("path")
+        data.pop("source_path")
+        data["removed_ms"] = self.removed_ms
+        return data
+
+
+def frame_dbfs(audio: AudioSegment, frame_ms: int = VAD_FRAME_MS) -> np.ndarray:
+    """
+    오디오를 frame_ms 단위 프레임으로 나눠 프레임별 RMS 에너지(dBFS)를 계산합니다.
+    다채널은 채널 평균으로 합친 뒤 계산합니다.
+    """
+    samples = np.array(audio.get_array_of_samples(), dtype=np.float64)
+    if audio.channels > 1:
+        samples = samples.reshape(-1, audio.channels).mean(axis=1)
+
+    frame_len = max(int(audio.frame_rate * frame_ms / 1000), 1)
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return np.empty(0)
+
+    frames = samples[: n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    full_scale = float(1 << (8 * audio.sample_width - 1))
+    return 20 * np.log10(rms / full_scale + 1e-10)
+
+
+def detect_speech_frames(dbfs: np.ndarray) -> np.ndarray:
+    """
+    프레임별 에너지로 발화 여부를 판정합니다.
+
+    임계값:
+        max(VAD_MIN_DBFS, min(소음 바닥 + 여유, 상위 에너지 - 여유))
+        - 소음 바닥: 하위 10% 에너지
+        - 상위 에너지: 상위 5% 에너지 (클립 전체가 발화여도 대부분 통과하도록)
+    """
+    if dbfs.size == 0:
+        return np.zeros(0, dtype=bool)
+    noise_floor = np.percentile(dbfs, 10)
+    loud = np.percentile(dbfs, 95)
+    threshold = max(VAD_MIN_DBFS, min(noise_floor + VAD_NOISE_MARGIN_DB, loud - VAD_NOISE_MARGIN_DB))
+    return dbfs > threshold
+
+
+def speech_regions(
+    flags: np.ndarray,
+    frame_ms: int = VAD_FRAME_MS,
+    max_silence_ms: int = VAD_MAX_SILENCE_MS,
+    keep_silence_ms: int = VAD_KEEP_SILENCE_MS,
+) -> List[Tuple[int, int]]:
+    """
+    발화 프레임 플래그를 (시작 ms, 끝 ms) 구간 목록으로 변환합니다.
+
+    Note:
+        - max_silence_ms 이하의 짧은 쉼은 같은 구간으로 병합 (자연스러운 호흡 유지)
+        - 각 구간 앞뒤로 keep_silence_ms 여유를 붙임
+        - 결과적으로 긴 내부 무음은 최대 2 × keep_silence_ms로 축소
+    """
+    regions: List[List[int]] = []
+    start = None
+    for i, is_speech in enumerate(flags):
+        if is_speech and start is None:
+            start = i
+        elif not is_speech and start is not None:
+            regions.append([start, i])
+            start = None
+    if start is not None:
+        regions.append([start, len(flags)])
+
+    # 짧은 쉼 병합
+    merged: List[List[int]] = []
+    max_gap = max_silence_ms // frame_ms
+    for region in regions:
+        if merged and region[0] - merged[-1][1] <= max_gap:
+            merged[-1][1] = region[1]
+        else:
+            merged.append(region)
+
+    # 여유 구간 추가 후 ms 단위로 변환
+    total_ms = len(flags) * frame_ms
+    padded: List[Tuple[int, int]] = []
+    for s, e in merged:
+        s_ms = max(s * frame_ms - keep_silence_ms, 0)
+        e_ms = min(e * frame_ms + keep_silence_ms, total_ms)
+        if padded and s_ms <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], e_ms)
+        else:
+            padded.append((s_ms, e_ms))
+    return padded
+
+
+def trim_silence(audio: AudioSegment) -> Tuple[AudioSegment, bool]:
+    """
+    무음을 제거한 오디오와 무음 클립 여부를 반환합니다.
+
+    Returns:
+        Tuple[AudioSegment, bool]: (트리밍된 오디오, 전체 무음 여부)
+    """
+    flags = detect_speech_frames(frame_dbfs(audio))
+    speech_ms = int(flags.sum()) * VAD_FRAME_MS
+    if speech_ms < VAD_MIN_SPEECH_MS:
+        return audio[:0], True
+
+    regions = speech_regions(flags)
+    trimmed = audio[:0]
+    for start_ms, end_ms in regions:
+        trimmed += audio[start_ms:end_ms]
+    return trimmed, False
+
+
+def prepare_audio_for_stt(file_path: str) -> PreparedAudio:
+    """
+    STT 전 오디오 전처리 (동기 함수 - 워커 풀에서 실행)
+
+    처리 과정:
+    1. 파일을 한 번만 디코딩 (pydub/ffmpeg)
+    2. 트랜스코딩 활성화 시 16kHz 모노로 변환 (이후 VAD 계산량도 감소)
+    3. 에너지 기반 VAD로 앞/뒤/긴 내부 무음 제거
+    4. 발화가 없으면 is_silent=True (STT 생략)
+    5. Opus/FLAC(트랜스코딩) 또는 WAV(트리밍만)로 저장, 변경이 없으면 원본 사용
+
+    Returns:
+        PreparedAudio: STT에 보낼 경로와 크기/길이 통계
+    """
+    audio = AudioSegment.from_file(file_path)
+    original_ms = len(audio)
+    original_bytes = os.path.getsize(file_path)
+    stats = dict(source_path=file_path, original_ms=original_ms, original_bytes=original_bytes)
+
+    if TRANSCODE_ENABLED:
+        audio = audio.set_channels(1).set_frame_rate(TRANSCODE_SAMPLE_RATE)
+
+    trimmed = False
+    if VAD_ENABLED:
+        speech, is_silent = trim_silence(audio)
+        if is_silent:
+            print(f"[VAD] 🔇 무음 클립 감지 - STT 생략: {file_path} ({original_ms}ms)")
+            return PreparedAudio(path=file_path, output_ms=0, is_silent=True, **stats)
+        if original_ms - len(speech) >= VAD_MIN_GAIN_MS:
+            audio, trimmed = speech, True
+
+    if TRANSCODE_ENABLED:
+        ext, export_kwargs = _TRANSCODE_OUTPUTS.get(TRANSCODE_FORMAT, _TRANSCODE_OUTPUTS["opus"])
+        out_path = f"{os.path.splitext(file_path)[0]}_stt.{ext}"
+        audio.export(out_path, **export_kwargs)
+        output_format = TRANSCODE_FORMAT
+    elif trimmed:
+        out_path = f"{os.path.splitext(file_path)[0]}_vad.wav"
+        audio.export(out_path, format="wav")
+        output_format = "wav"
+    else:
+        return PreparedAudio(path=file_path, output_ms=original_ms, output_bytes=original_bytes, **stats)
+
+    prepared = PreparedAudio(
+        path=out_path,
+        output_ms=len(audio),
+        output_bytes=os.path.getsize(out_path),
+        output_format=output_format,
+        **stats,
+    )
+    print(
+        f"[전처리] ✂️ {file_path}: {original_ms}ms/{original_bytes}B → "
+        f"{prepared.output_ms}ms/{prepared.output_bytes}B ({output_format}, 무음 제거 {prepared.removed_ms}ms)"
+    )
+    return prepared
+
+
+async def prepare_audio_for_stt_async(file_path: str) -> PreparedAudio:
+    """
+    전처리 워커 풀(AUDIO_PREPROCESS_WORKERS)에서 prepare_audio_for_stt를 실행합니다.
+    동시 디코딩/인코딩 수를 제한하면서 이벤트 루프는 막지 않습니다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(MODEL_REGISTRY.get(_PREPROCESS_POOL_NAME), prepare_audio_for_stt, file_path)
+
+
+def split_audio_windows(file_path: str, window_ms: int, overlap_ms: int) -> List[str]:
+    """
+    오디오를 window_ms 길이, overlap_ms만큼 겹치는 조각 파일들로 분할합니다.
+
+    Returns:
+        List[str]: 시간 순서의 조각 파일 경로 목록 (호출자가 사용 후 삭제)
+
+    Note:
+        - 조각은 트랜스코딩 포맷(비활성화 시 WAV)으로 저장
+        - 분할 도중 실패하면 이미 쓴 조각 파일을 삭제하고 예외를 다시 발생
+        - 겹침 구간은 경계에서 잘린 단어를 복원하기 위한 것 (stitch_transcripts에서 중복 제거)
+    """
+    audio = AudioSegment.from_file(file_path)
+    if TRANSCODE_ENABLED:
+        ext, export_kwargs = _TRANSCODE_OUTPUTS.get(TRANSCODE_FORMAT, _TRANSCODE_OUTPUTS["opus"])
+    else:
+        ext, export_kwargs = "wav", {"format": "wav"}
+
+    step_ms = max(window_ms - overlap_ms, 1)
+    base = os.path.splitext(file_path)[0]
+    paths: List[str] = []
+    try:
+        for index, start_ms in enumerate(range(0, len(audio), step_ms)):
+            chunk_path = f"{base}_part{index:03d}.{ext}"
+            paths.append(chunk_path)  # export 도중 실패해도 쓰다 만 파일까지 정리
+            audio[start_ms:start_ms + window_ms].export(chunk_path, **export_kwargs)
+            if start_ms + window_ms >= len(audio):
+                break
+    except Exception:
+        # 호출자는 분할이 끝나야 조각 경로를 받으므로, 실패 시 이미 쓴 조각은 여기서 삭제
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        raise
+    return paths
+
+
+async def split_audio_windows_async(file_path: str, window_ms: int, overlap_ms: int) -> List[str]:
+    """전처리 워커 풀에서 split_audio_windows를 실행합니다."""
+    loop = asyncio.get_running_loop()
+    pool = MODEL_REGISTRY.get(_PREPROCESS_POOL_NAME)
+    return await loop.run_in_executor(pool, split_audio_windows, file_path, window_ms, overlap_ms)
@@ -21,19 +21,15 @@ import os
 import json
 from typing import Dict, Tuple, List
 from dotenv import load_dotenv
-from openai import OpenAI
 
 from app.schemas.nonverbal import Posture, FacialExpression, NonverbalData, NonverbalScore
+from app.services.model_registry import MODEL_REGISTRY
 
 # ──────────────── 🔐 환경 설정 ────────────────
-# 1) 환경 변수 & OpenAI 클라이언트 초기화
+# 1) 환경 변수 로드
 load_dotenv()
-_openai_key = os.getenv("OPENAI_API_KEY")
-if not _openai_key:
-    raise ValueError("OPENAI_API_KEY가 설정되어 있지 않습니다.")
 
-# OpenAI 클라이언트 초기화 (비용 절약을 위해 gpt-4o-mini 사용)
-_client = OpenAI(api_key=_openai_key)
+# OpenAI 클라이언트는 MODEL_REGISTRY에서 공유 (최초 사용 시 생성, 비용 절약을 위해 gpt-4o-mini 사용)
 
 # ──────────────── 🧠 프롬프트 템플릿 ────────────────
 def _get_facial_prompt(facial_data: dict) -> str:
@@ -140,7 +136,7 @@ async def evaluate(nonverbal: FacialExpression) -> dict:
     prompt = _get_facial_prompt(data)
     
     # OpenAI GPT API 호출
-    response = _client.chat.completions.create(
+    response = MODEL_REGISTRY.get("openai_client").chat.completions.create(
         model="gpt-4o-mini",  # 비용 절약을 위해 mini 모델 사용
         messages=[{"role": "user", "content": prompt}],
         temperature=0.7       # 창의적 분석을 위해 적당한 temperature 설정
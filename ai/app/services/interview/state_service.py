@@ -11,12 +11,13 @@ SK AXIS AI 면접 상태 관리 서비스
 - interviewee_id: 면접자 고유 ID
 - questions: 면접 질문 목록
 - audio_path: 현재 처리 중인 오디오 파일 경로
+- audio_paths: 큐가 묶어 넘긴 오디오 파일 경로 목록
 - stt: 음성인식 결과 저장소
 - rewrite: 답변 정제 결과 저장소  
 - evaluation: 평가 결과 저장소
 - summary: 최종 요약 점수 저장소
 - report: 리포트 생성 결과 저장소 (프론트로 기능 이전)
-- decision_log: 처리 과정 로그 저장소
+- decision_log: 처리 과정 로그 최근 항목 (전체 로그는 app.services.decision_log)
 """
 
 from typing import List, Dict, Any
@@ -43,6 +44,7 @@ def create_initial_state(interviewee_id: int, questions: List[Dict], file_path:
         "interviewee_id": interviewee_id,    # 면접자 ID
         "questions": questions,              # 면접 질문 목록
         "audio_path": file_path,            # 현재 처리할 오디오 파일 경로
+        "audio_paths": [],                  # 묶음 처리할 오디오 파일 경로 (비어 있으면 audio_path)
         
         # ─── 파이프라인 단계별 상태 ───
         "stt": {                            # 음성인식 단계
@@ -71,5 +73,5 @@ def create_initial_state(interviewee_id: int, questions: List[Dict], file_path:
         },
         
         # ─── 처리 과정 로그 ───
-        "decision_log": [],                 # 각 단계별 처리 로그 (디버깅용)
+        "decision_log": [],                 # 각 단계별 처리 로그 최근 항목 (디버깅용)
     }
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""
+SK AXIS AI 면접 STT 백엔드 모음
+
+이 파일은 음성 인식 엔진을 교체 가능하도록 추상화한 STT 백엔드 모듈입니다.
+주요 기능:
+- 공통 인터페이스(STTBackend) 정의
+- OpenAI Whisper API 백엔드 (whisper-1, 원격)
+- faster-whisper 로컬 CPU 백엔드 (int8 양자화)
+- openai-whisper 로컬 CPU 백엔드
+- 동일 클립에 대한 백엔드별 벤치마크
+- 로컬 백엔드 비동기 전사는 CPU 프로세스 풀(CPU_POOL_WORKERS)에서 실행 (GIL로 이벤트 루프가 멈추지 않도록)
+
+백엔드 선택:
+- 환경 변수 STT_BACKEND = "openai" | "faster-whisper" | "whisper" (기본 "openai")
+- 로컬 모델 크기: STT_LOCAL_MODEL (기본 "base")
+- 온프레미스 노드는 로컬 백엔드로 네트워크 왕복 없이 전사 가능
+
+벤치마크 실행 예시:
+    python -m app.services.interview.stt_backends a.webm b.webm --backends openai,faster-whisper
+"""
+
+import os
+import time
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from app.services.process_pool import CPU_POOL, run_cpu_bound
+
+# ──────────────── ⚙️ 백엔드 설정 ────────────────
+STT_BACKEND = os.getenv("STT_BACKEND", "openai")                        # 사용할 백엔드 이름
+STT_LANGUAGE = os.getenv("STT_LANGUAGE", "ko")                          # 인식 언어
+STT_OPENAI_MODEL = os.getenv("STT_OPENAI_MODEL", "whisper-1")           # OpenAI API 모델
+STT_LOCAL_MODEL = os.getenv("STT_LOCAL_MODEL", "base")                  # 로컬 모델 크기
+STT_LOCAL_COMPUTE_TYPE = os.getenv("STT_LOCAL_COMPUTE_TYPE", "int8")    # faster-whisper 연산 타입
+STT_LOCAL_CPU_THREADS = int(os.getenv("STT_LOCAL_CPU_THREADS", "0"))    # 0이면 라이브러리 기본값
+
+
+class STTBackend(ABC):
+    """
+    STT 백엔드 공통 인터페이스
+
+    Note:
+        - transcribe()는 동기 함수이며 전사된 텍스트(strip 완료)를 반환 (하위 클래스 필수 구현)
+        - atranscribe()는 이벤트 루프를 막지 않는 비동기 버전 (기본: 스레드로 오프로딩)
+        - load()는 모델 등 리소스를 미리 로딩 (기본: 아무것도 하지 않음)
+        - 실패 시 예외를 그대로 전파 (호출자가 기본 메시지로 처리)
+    """
+    name = "base"
+
+    def load(self) -> None:
+        pass
+
+    @abstractmethod
+    def transcribe(self, file_path: str, language: str = STT_LANGUAGE) -> str:
+        """file_path를 전사한 텍스트를 반환합니다."""
+
+    async def atranscribe(self, file_path: str, language: str = STT_LANGUAGE) -> str:
+        return await asyncio.to_thread(self.transcribe, file_path, language)
+
+
+class OpenAIWhisperBackend(STTBackend):
+    """OpenAI Whisper API(whisper-1) 원격 백엔드"""
+    name = "openai"
+
+    def __init__(self, client=None, async_client=None, model: str = STT_OPENAI_MODEL):
+        if client is None or async_client is None:
+            from openai import OpenAI, AsyncOpenAI
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError("❌ OPENAI_API_KEY가 .env에 정의되지 않았습니다.")
+            client = client or OpenAI(api_key=api_key)
+            async_client = async_client or AsyncOpenAI(api_key=api_key)
+        self.client = client
+        self.async_client = async_client
+        self.model = model
+
+    def transcribe(self, file_path: str, language: str = STT_LANGUAGE) -> str:
+        with open(file_path, "rb") as f:
+            transcript = self.client.audio.transcriptions.create(
+                model=self.model,
+                file=f,
+                response_format="text",
+                language=language,
+            )
+        # response_format="text" 를 사용하면 문자열이 반환됩니다.
+        return transcript.strip()
+
+    async def atranscribe(self, file_path: str, language: str = STT_LANGUAGE) -> str:
+        # 비동기 클라이언트 사용: 전사 대기 중에도 이벤트 루프는 다른 요청을 처리
+        with open(file_path, "rb") as f:
+            transcript = await self.async_client.audio.transcriptions.create(
+                model=self.model,
+                file=f,
+                response_format="text",
+                language=language,
+            )
+        return transcript.strip()
+
+
+class LocalModelBackend(STTBackend):
+    """
+    로컬 모델 백엔드 공통 부분
+
+    Note:
+        - 모델은 처음 필요할 때 로딩 (프로세스 풀을 쓰면 API 프로세스에는 로딩하지 않음)
+        - atranscribe()는 CPU 프로세스 풀에서 실행, 워커 프로세스마다 모델을 한 번 로딩해 재사용
+    """
+
+    def __init__(self, **model_kwargs: Any):
+        self.model_kwargs = model_kwargs
+        self._model = None
+        self._load_lock = threading.Lock()
+
+    @abstractmethod
+    def _load_model(self):
+        """모델 객체를 생성합니다 (model 속성 첫 접근 시 한 번 호출)."""
+
+    def load(self) -> None:
+        """모델을 미리 로딩합니다 (워밍업)."""
+        _ = self.model
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._model = self._load_model()
+        return self._model
+
+    async def atranscribe(self, file_path: str, language: str = STT_LANGUAGE) -> str:
+        if not CPU_POOL.enabled:
+            return await asyncio.to_thread(self.transcribe, file_path, language)
+        return await run_cpu_bound(_transcribe_in_worker, self.name, self.model_kwargs, file_path, language)
+
+
+class FasterWhisperBackend(LocalModelBackend):
+    """faster-whisper(CTranslate2) 로컬 CPU 백엔드 - int8 양자화로 메모리/지연 최소화"""
+    name = "faster-whisper"
+
+    def __init__(
+        self,
+        model_size: str = STT_LOCAL_MODEL,
+        compute_type: str = STT_LOCAL_COMPUTE_TYPE,
+        cpu_threads: int = STT_LOCAL_CPU_THREADS,
+    ):
+        super().__init__(model_size=model_size, compute_type=compute_type, cpu_threads=cpu_threads)
+
+    def _load_model(self):
+        from faster_whisper import WhisperModel
+        return WhisperModel(
+            self.model_kwargs["model_size"], device="cpu",
+            compute_type=self.model_kwargs["compute_type"], cpu_threads=self.model_kwargs["cpu_threads"],
+        )
+
+    def transcribe(self, file_path: str, language: str = STT_LANGUAGE) -> str:
+        # segments는 제너레이터이므로 순회하면서 실제 디코딩이 진행됨
+        segments, _info = self.model.transcribe(file_path, language=language, beam_size=1)
+        return "".join(segment.text for segment in segments).strip()
+
+
+class LocalWhisperBackend(LocalModelBackend):
+    """openai-whisper 로컬 CPU 백엔드"""
+    name = "whisper"
+
+    def __init__(self, model_size: str = STT_LOCAL_MODEL):
+        super().__init__(model_size=model_size)
+
+    def _load_model(self):
+        import whisper
+        return whisper.load_model(self.model_kwargs["model_size"], device="cpu")
+
+    def transcribe(self, file_path: str, language: str = STT_LANGUAGE) -> str:
+        result = self.model.transcribe(file_path, language=language, fp16=False)
+        return result.get("text", "").strip()
+
+
+# 프로세스 풀 워커 안에서 재사용하는 로컬 백엔드 (워커 프로세스마다 모델 1회 로딩)
+_WORKER_BACKENDS: Dict[Tuple[str, Tuple], STTBackend] = {}
+
+
+def _transcribe_in_worker(name: str, model_kwargs: Dict[str, Any], file_path: str, language: str) -> str:
+    """CPU 프로세스 풀에서 실행되는 로컬 전사 함수 (모듈 수준 함수라 pickle 가능)"""
+    key = (name, tuple(sorted(model_kwargs.items())))
+    backend = _WORKER_BACKENDS.get(key)
+    if backend is None:
+        backend = _WORKER_BACKENDS[key] = create_stt_backend(name, **model_kwargs)
+    return backend.transcribe(file_path, language)
+
+
+# ──────────────── 📚 백엔드 레지스트리 ────────────────
+STT_BACKENDS: Dict[str, Type[STTBackend]] = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+    LocalWhisperBackend.name: LocalWhisperBackend,
+}
+
+
+def create_stt_backend(name: Optional[str] = None, **kwargs) -> STTBackend:
+    """
+    이름으로 STT 백엔드 인스턴스를 생성합니다.
+
+    Args:
+        name: 백엔드 이름 (None이면 STT_BACKEND 환경 변수 사용)
+        **kwargs: 백엔드 생성자 인자 (예: OpenAI client)
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름
+    """
+    name = name or STT_BACKEND
+    backend_cls = STT_BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"알 수 없는 STT 백엔드: {name} (사용 가능: {', '.join(STT_BACKENDS)})")
+    return backend_cls(**kwargs)
+
+
+def benchmark_stt_backends(file_paths: List[str], backend_names: List[str]) -> Dict[str, Dict]:
+    """
+    같은 클립 목록을 여러 백엔드로 전사하여 소요 시간과 결과를 비교합니다.
+
+    Returns:
+        Dict[str, Dict]: 백엔드별 {"load_sec", "total_sec", "clips": [{"path", "elapsed_sec", "text"}]}
+    """
+    report: Dict[str, Dict] = {}
+    for name in backend_names:
+        load_start = time.perf_counter()
+        backend = create_stt_backend(name)
+        backend.load()
+        load_sec = time.perf_counter() - load_start
+
+        clips = []
+        for path in file_paths:
+            start = time.perf_counter()
+            try:
+                text = backend.transcribe(path)
+            except Exception as e:
+                text = f"<error: {e}>"
+            clips.append({"path": path, "elapsed_sec": round(time.perf_counter() - start, 3), "text": text})
+
+        report[name] = {
+            "load_sec": round(load_sec, 3),
+            "total_sec": round(sum(c["elapsed_sec"] for c in clips), 3),
+            "clips": clips,
+        }
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="STT 백엔드 벤치마크")
+    parser.add_argument("files", nargs="+", help="전사할 오디오 파일 경로")
+    parser.add_argument("--backends", default="openai,faster-whisper", help="쉼표로 구분된 백엔드 이름")
+    args = parser.parse_args()
+
+    result = benchmark_stt_backends(args.files, [b.strip() for b in args.backends.split(",") if b.strip()])
+    print(json.dumps(result, ensure_ascii=False, indent=2))
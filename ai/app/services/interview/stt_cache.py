@@ -0,0 +1,134 @@
+"""
+SK AXIS AI 면접 STT 결과 캐시 (콘텐츠 해시 기반)
+
+이 파일은 같은 오디오가 다시 업로드되었을 때 STT를 반복하지 않도록
+전사 결과를 오디오 내용 해시로 캐싱하는 모듈입니다.
+주요 기능:
+- 오디오 내용 SHA-256 해시 기반 캐시 키 (백엔드/언어 포함)
+- 메모리 LRU 캐시 (최대 항목 수 초과 시 가장 오래된 항목 제거)
+- 선택적 디스크 캐시 (STT_CACHE_DIR 설정 시, 재시작 후에도 재사용)
+- 적중/미적중/제거 통계
+
+사용 배경:
+- 프론트엔드는 네트워크 불안정 시 /stt/upload를 재시도하므로 같은 오디오가 여러 번 도착
+- 업로드 파일명에 해시 앞 16자리가 포함되어 있어 파일을 다시 읽지 않고 키 계산 가능
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# ──────────────── ⚙️ 캐시 설정 ────────────────
+STT_CACHE_MAX_ENTRIES = int(os.getenv("STT_CACHE_MAX_ENTRIES", "512"))  # 메모리 캐시 최대 항목 수
+STT_CACHE_DIR = os.getenv("STT_CACHE_DIR", "")                          # 비어 있으면 디스크 캐시 비활성화
+
+# 업로드 파일명 규칙: {interviewee_id}_{timestamp}_{sha256 앞 16자리}.webm
+_DIGEST_IN_FILENAME = re.compile(r"_([0-9a-f]{16})\.[A-Za-z0-9]+$")
+
+
+def audio_content_digest(file_path: str) -> str:
+    """
+    오디오 파일 내용의 SHA-256 해시 앞 16자리를 반환합니다.
+    save_audio_file이 만든 파일명에 해시가 있으면 파일을 다시 읽지 않습니다.
+    """
+    match = _DIGEST_IN_FILENAME.search(os.path.basename(file_path))
+    if match:
+        return match.group(1)
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(256 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def transcription_cache_key(digest: str, backend_name: str, language: str) -> str:
+    """캐시 키: 같은 오디오라도 백엔드/언어가 다르면 별도 항목"""
+    return f"{backend_name}_{language}_{digest}"
+
+
+class TranscriptionCache:
+    """
+    메모리 LRU + 선택적 디스크 캐시
+
+    Note:
+        - 값은 JSON 직렬화 가능한 dict (transcribe_upload 결과)
+        - 디스크 항목은 {cache_dir}/{key}.json, 임시 파일 기록 후 원자적 rename
+        - 스레드 안전 (전처리 스레드에서 호출되어도 안전)
+    """
+
+    def __init__(self, max_entries: int = STT_CACHE_MAX_ENTRIES, cache_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir or None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(value)
+
+        if self.cache_dir and os.path.exists(self._disk_path(key)):
+            try:
+                with open(self._disk_path(key), "r", encoding="utf-8") as f:
+                    value = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"[STT 캐시] ⚠️ 디스크 캐시 읽기 실패: {key} - {e}")
+            else:
+                self._remember(key, value)
+                with self._lock:
+                    self.hits += 1
+                return dict(value)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        self._remember(key, value)
+        if self.cache_dir:
+            tmp_path = f"{self._disk_path(key)}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(value, f, ensure_ascii=False)
+                os.replace(tmp_path, self._disk_path(key))
+            except OSError as e:
+                print(f"[STT 캐시] ⚠️ 디스크 캐시 저장 실패: {key} - {e}")
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = dict(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk": bool(self.cache_dir),
+            }
+
+
+# ──────────────── 📦 전역 캐시 ────────────────
+STT_CACHE = TranscriptionCache(STT_CACHE_MAX_ENTRIES, STT_CACHE_DIR)
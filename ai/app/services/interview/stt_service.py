@@ -4,127 +4,324 @@ SK AXIS AI 면접 음성 인식 (STT) 서비스
 이 파일은 면접 중 녹음된 음성을 텍스트로 변환하는 STT 서비스입니다.
 주요 기능:
 - WebM 오디오 파일 처리 및 검증
-- OpenAI Whisper API를 통한 한국어 음성 인식
+- 교체 가능한 STT 백엔드를 통한 한국어 음성 인식 (OpenAI API / 로컬 Whisper)
 - 파일 손상 검사 및 오류 처리
 - STT 결과 후처리 및 필터링
 
 성능 최적화:
+- 업로드 파일을 청크 단위로 스트리밍 저장 (업로드 1건당 메모리 사용량 상한 유지)
 - 파일 헤더만 읽어서 빠른 검증 (전체 파일을 로드하지 않고 헤더만 읽어서 빠른 검증)
-- 손상된 WebM 파일 사전 감지
-- 잘못된 STT 결과 필터링 (유튜브 관련 오인식 제거)
+- 손상된 WebM 파일 사전 감지 (EBML 구조 검사로 잘린 업로드를 STT 전에 거부, 재생 길이 추출)
+- 잘못된 STT 결과 필터링 (유튜브 관련 오인식/반복 루프 제거, 다중 패턴 오토마톤 1회 스캔)
+- STT 전 무음 구간 제거(VAD) 및 무음 클립 STT 생략
+- STT 전 16kHz 모노 Opus/FLAC 트랜스코딩
+- 긴 답변은 겹치는 구간으로 나눠 병렬 전사 후 병합 (꼬리 지연을 조각 길이로 제한)
+- 오디오 내용 해시 기반 STT 결과 캐시 (재업로드 시 STT 생략)
 """
 
-from pydub import AudioSegment
-from openai import OpenAI
 import os
+import time
+import uuid
+import asyncio
+import hashlib
+import aiofiles
+from dataclasses import dataclass
 from dotenv import load_dotenv
 from fastapi import UploadFile
-import whisper
-from typing import Optional
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
-import numpy as np
+
+from app.services.interview.stt_backends import STTBackend, STT_BACKEND, STT_LANGUAGE, create_stt_backend
+from app.services.interview.stt_cache import STT_CACHE, audio_content_digest, transcription_cache_key
+from app.services.model_registry import MODEL_REGISTRY
+from app.services.interview.audio_preprocess_service import prepare_audio_for_stt_async, split_audio_windows_async
+from app.services.interview.transcript_stitching import stitch_transcripts
+from app.services.interview.webm_validator import WebMInfo, inspect_webm
+from app.services.interview.transcription_filter import TRANSCRIPTION_FILTER
+from app.services.process_pool import CPU_POOL
 
 
 # 📦 .env 환경 변수 로드
 dotenv_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
 load_dotenv(dotenv_path)
 
-# 🔑 OpenAI API Key 로드 및 클라이언트 초기화
-openai_key = os.getenv("OPENAI_API_KEY")
-if not openai_key:
-    raise ValueError("❌ OPENAI_API_KEY가 .env에 정의되지 않았습니다.")
-# OpenAI Python v1.x 클라이언트 초기화
-client = OpenAI(api_key=openai_key)
+# 🎙️ STT 백엔드 (배포별 선택: STT_BACKEND 환경 변수)
+# OpenAI 클라이언트와 로컬 모델은 임포트 시점이 아니라 최초 사용(또는 lifespan 워밍업) 시 로딩
+def _create_stt_backend() -> STTBackend:
+    kwargs = {
+        "client": MODEL_REGISTRY.get("openai_client"),
+        "async_client": MODEL_REGISTRY.get("openai_async_client"),
+    } if STT_BACKEND == "openai" else {}
+    backend = create_stt_backend(STT_BACKEND, **kwargs)
+    if not CPU_POOL.enabled:
+        # 로컬 모델은 이 프로세스에서 추론하므로 미리 로딩 (프로세스 풀 사용 시 워커 프로세스에서 로딩)
+        backend.load()
+    print(f"[STT] 🎙️ STT 백엔드 초기화: {backend.name}")
+    return backend
+
+MODEL_REGISTRY.register("stt_backend", _create_stt_backend)
+
+def get_stt_backend() -> STTBackend:
+    """
+    현재 배포에 설정된 STT 백엔드를 반환합니다 (프로세스당 1회 생성, 이후 공유).
+    """
+    return MODEL_REGISTRY.get("stt_backend")
+
+# 🚦 전역 STT 동시 실행 상한 (워커 프로세스 단위)
+STT_MAX_CONCURRENCY = int(os.getenv("STT_MAX_CONCURRENCY", "4"))
+_stt_semaphore: Optional[asyncio.Semaphore] = None
+
+def _get_stt_semaphore() -> asyncio.Semaphore:
+    # 실행 중인 이벤트 루프에서 최초 사용 시 생성 (임포트 시점 루프 바인딩 방지)
+    global _stt_semaphore
+    if _stt_semaphore is None:
+        _stt_semaphore = asyncio.Semaphore(STT_MAX_CONCURRENCY)
+    return _stt_semaphore
+
+# ✂️ 긴 답변 분할 전사 설정
+STT_CHUNK_THRESHOLD_MS = int(float(os.getenv("STT_CHUNK_THRESHOLD_SEC", "90")) * 1000)  # 이보다 길면 분할
+STT_CHUNK_WINDOW_MS = int(float(os.getenv("STT_CHUNK_WINDOW_SEC", "45")) * 1000)        # 조각 길이
+STT_CHUNK_OVERLAP_MS = int(float(os.getenv("STT_CHUNK_OVERLAP_SEC", "2")) * 1000)       # 조각 간 겹침
+
+# ──────────────── 📥 업로드 저장 설정 ────────────────
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+UPLOAD_CHUNK_SIZE = int(os.getenv("STT_UPLOAD_CHUNK_SIZE", str(256 * 1024)))       # 청크 크기 (기본 256KB)
+MAX_UPLOAD_BYTES = int(os.getenv("STT_MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)))  # 업로드 1건 최대 크기 (기본 50MB)
+
+
+class AudioUploadTooLargeError(ValueError):
+    """업로드 파일이 MAX_UPLOAD_BYTES를 초과했을 때 발생합니다."""
 
-# Whisper 모델 초기화
-model = whisper.load_model("base")
+
+@dataclass
+class AudioUploadStats:
+    """
+    스트리밍 저장 결과 통계
+
+    Attributes:
+        path (str): 기록된 파일 경로
+        size (int): 저장된 바이트 수
+        sha256 (str): 파일 내용 SHA-256 해시 (hex)
+        elapsed (float): 저장 소요 시간 (초)
+    """
+    path: str
+    size: int
+    sha256: str
+    elapsed: float
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.size / self.elapsed if self.elapsed > 0 else float(self.size)
 
 def is_valid_audio_file(file_path: str) -> bool:
     """
     오디오 파일이 손상되었는지 빠르게 검사합니다.
-    성능 최적화: 헤더만 읽어서 빠른 검증
+    성능 최적화: 디코딩 없이 헤더/컨테이너 구조만 검사
+    """
+    return inspect_audio_file(file_path)[0]
+
+def inspect_audio_file(file_path: str) -> Tuple[bool, Optional[WebMInfo]]:
+    """
+    오디오 파일 유효성을 검사하고, WebM이면 컨테이너 구조 정보를 함께 반환합니다.
+
+    Returns:
+        Tuple[bool, Optional[WebMInfo]]: (유효 여부, WebM 구조 정보 - WebM이 아니면 None)
+
+    Note:
+        - WebM은 EBML 요소를 mmap으로 순회해 잘린 업로드를 STT 전에 걸러냄 (수 ms)
+        - 추출한 재생 길이는 분할 전사 판단과 길이 통계에 사용
     """
     try:
         # 파일 존재 확인
         if not os.path.exists(file_path):
             print(f"[파일 검사] 파일이 존재하지 않음: {file_path}")
-            return False
+            return False, None
 
         # 파일 크기 확인 (0바이트 파일 감지)
         file_size = os.path.getsize(file_path)
         if file_size == 0:
             print(f"[파일 검사] 빈 파일 감지: {file_path}")
-            return False
+            return False, None
 
         # 최소 크기 확인 (1KB 미만은 의심스러움)
         if file_size < 1024:
             print(f"[파일 검사] 파일이 너무 작음: {file_path} ({file_size} bytes)")
-            return False
-
-        # 🚀 성능 최적화: 파일 헤더만 읽어서 빠른 검증
-        try:
-            with open(file_path, 'rb') as f:
-                # 처음 1KB만 읽어서 헤더 확인
-                header = f.read(1024)
-
-                # WebM 파일 시그니처 확인
-                if file_path.lower().endswith('.webm'):
-                    # WebM은 EBML 헤더로 시작 (0x1A, 0x45, 0xDF, 0xA3)
-                    if len(header) < 4 or header[:4] != b'\x1A\x45\xDF\xA3':
-                        print(f"[파일 검사] 잘못된 WebM 헤더: {file_path}")
-                        return False
-
-                # 기본적인 파일 무결성 확인 (전체 파일 읽지 않음)
-                # 파일 끝부분도 확인 (마지막 100바이트)
-                if file_size > 100:
-                    f.seek(-100, 2)  # 파일 끝에서 100바이트 전으로 이동
-                    tail = f.read(100)
-                    if len(tail) == 0:
-                        print(f"[파일 검사] 파일 끝 부분 읽기 실패: {file_path}")
-                        return False
-
-            print(f"[파일 검사] ✅ 유효한 오디오 파일: {file_path} ({file_size} bytes)")
-            return True
-
-        except Exception as e:
-            print(f"[파일 검사] 파일 헤더 읽기 실패: {file_path} - {e}")
-            return False
+            return False, None
+
+        # 🚀 WebM: EBML/Matroska 구조 검사 (Segment/Cluster/블록, 잘림 여부)
+        if file_path.lower().endswith('.webm'):
+            container = inspect_webm(file_path)
+            if not container.valid:
+                print(f"[파일 검사] 잘못된 WebM 구조: {file_path} - {container.reason}")
+                return False, container
+            print(f"[파일 검사] ✅ 유효한 WebM 파일: {file_path} ({file_size} bytes, "
+                  f"{container.duration_ms}ms, 클러스터 {container.cluster_count}개)")
+            return True, container
+
+        # 그 외 포맷: 파일 끝부분 읽기 확인 (마지막 100바이트)
+        with open(file_path, 'rb') as f:
+            if file_size > 100:
+                f.seek(-100, 2)  # 파일 끝에서 100바이트 전으로 이동
+                tail = f.read(100)
+                if len(tail) == 0:
+                    print(f"[파일 검사] 파일 끝 부분 읽기 실패: {file_path}")
+                    return False, None
+
+        print(f"[파일 검사] ✅ 유효한 오디오 파일: {file_path} ({file_size} bytes)")
+        return True, None
 
     except Exception as e:
         print(f"[파일 검사] 파일 검사 중 오류: {file_path} - {e}")
-        return False
+        return False, None
 
-# 🧠 OpenAI Whisper API를 통한 STT 수행
+# 🧠 STT 백엔드를 통한 STT 수행
 def transcribe_audio_file(file_path: str) -> str:
     """
-    Whisper API를 사용하여 주어진 오디오 파일을 텍스트로 전사함
+    설정된 STT 백엔드(OpenAI API 또는 로컬 Whisper)로 주어진 오디오 파일을 텍스트로 전사함
+    (동기 버전 - 파이프라인에서는 transcribe_audio_file_async 사용)
     """
     # 🔍 파일 유효성 검사 먼저 수행
     if not is_valid_audio_file(file_path):
         print(f"[STT] ❌ 손상된 오디오 파일 감지: {file_path}")
         return "음성 파일이 손상되어 인식할 수 없습니다."
     
+    backend = get_stt_backend()
     try:
-        print(f"[STT] 📄 STT 처리 시작: {file_path}")
+        print(f"[STT] 📄 STT 처리 시작 ({backend.name}): {file_path}")
+        result = backend.transcribe(file_path)
+
+    except Exception as e:
+        print(f"[STT] ❌ STT 백엔드 오류 ({backend.name}): {e}")
+        # 백엔드 오류 시 기본 텍스트 반환
+        return "음성을 명확하게 인식할 수 없습니다."
+
+    return _postprocess_transcription(result)
+
+async def transcribe_audio_file_async(file_path: str, validate: bool = True, duration_ms: Optional[int] = None) -> str:
+    """
+    이벤트 루프를 막지 않는 비동기 STT
 
-        with open(file_path, "rb") as f:
-            transcript = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=f,
-                response_format="text",
-                language="ko",
-                # 프롬프트 추가로 맥락 제공
-            )
+    Args:
+        file_path: 전사할 파일 경로
+        validate: 파일 검사 수행 여부 (이미 검사한 업로드의 전처리 결과면 False)
+        duration_ms: 오디오 길이 (알고 있으면 STT_CHUNK_THRESHOLD_MS 초과 시 분할 병렬 전사)
+
+    Note:
+        - OpenAI 백엔드는 AsyncOpenAI 클라이언트, 로컬 백엔드는 스레드로 오프로딩
+        - STT_MAX_CONCURRENCY로 워커 전체의 동시 전사 수를 제한
+        - 대기 중에도 업로드/상태 조회 요청은 계속 처리됨
+    """
+    # 🔍 파일 유효성 검사 먼저 수행 (헤더만 읽으므로 빠름)
+    if validate and not is_valid_audio_file(file_path):
+        print(f"[STT] ❌ 손상된 오디오 파일 감지: {file_path}")
+        return "음성 파일이 손상되어 인식할 수 없습니다."
+
+    try:
+        # 백엔드 최초 생성(로컬 모델 로딩 가능)도 스레드에서 수행
+        backend = await asyncio.to_thread(get_stt_backend)
+        if duration_ms and duration_ms > STT_CHUNK_THRESHOLD_MS:
+            result = await _transcribe_chunked(backend, file_path, duration_ms)
+        else:
+            async with _get_stt_semaphore():
+                print(f"[STT] 📄 STT 처리 시작 ({backend.name}, async): {file_path}")
+                result = await backend.atranscribe(file_path)
 
     except Exception as e:
-        print(f"[STT] ❌ OpenAI API 오류: {e}")
-        # OpenAI API 오류 시 기본 텍스트 반환
+        print(f"[STT] ❌ STT 백엔드 오류: {e}")
+        # 백엔드 오류 시 기본 텍스트 반환
         return "음성을 명확하게 인식할 수 없습니다."
-    
-    # response_format="text" 를 사용하면 문자열이 반환됩니다.
-    result = transcript.strip()
 
-    # 후처리: 명백히 잘못된 변환 필터링
+    return _postprocess_transcription(result)
+
+async def _transcribe_chunked(backend: STTBackend, file_path: str, duration_ms: int) -> str:
+    """
+    긴 오디오를 겹치는 조각으로 나눠 동시에 전사하고 겹침을 제거해 병합합니다.
+    조각별 전사도 전역 동시 실행 상한(STT_MAX_CONCURRENCY)을 따릅니다.
+    """
+    chunk_paths = await split_audio_windows_async(file_path, STT_CHUNK_WINDOW_MS, STT_CHUNK_OVERLAP_MS)
+    print(f"[STT] ✂️ 분할 전사 ({backend.name}): {file_path} {duration_ms}ms → {len(chunk_paths)}개 조각")
+
+    async def _run(chunk_path: str) -> str:
+        async with _get_stt_semaphore():
+            return await backend.atranscribe(chunk_path)
+
+    try:
+        texts = await asyncio.gather(*(_run(path) for path in chunk_paths))
+    finally:
+        for path in chunk_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    return stitch_transcripts(list(texts))
+
+# 🔇 무음 클립에 대한 기본 메시지 (STT 생략 시)
+SILENT_AUDIO_MESSAGE = "음성이 감지되지 않았습니다."
+
+# 일시적 실패 가능성이 있는 결과는 캐싱하지 않음 (다음 재시도에서 다시 전사)
+_UNCACHEABLE_RESULTS = {"음성을 명확하게 인식할 수 없습니다."}
+
+async def transcribe_upload(audio_path: str) -> Dict[str, Any]:
+    """
+    업로드된 세그먼트 1개에 대한 STT 단계 전체를 수행합니다.
+
+    처리 과정:
+    1. 파일 유효성 검사 (WebM은 컨테이너 구조 검사 + 재생 길이 추출)
+    2. 오디오 내용 해시로 STT 캐시 조회 (적중 시 즉시 반환)
+    3. 전처리 (16kHz 모노 변환 + 무음 제거, 전처리 워커 풀에서 실행)
+    4. 무음 클립이면 STT 생략
+    5. 전처리된 파일로 비동기 STT 수행 후 임시 파일 삭제, 결과 캐싱
+
+    Returns:
+        Dict[str, Any]: {"raw": str, "silent": bool, "audio": 길이 통계,
+                         "audio_sha256": 해시 앞 16자리, "container_ms": WebM 컨테이너 재생 길이,
+                         "cached": 캐시 적중 여부}
+    """
+    valid, container = await asyncio.to_thread(inspect_audio_file, audio_path)
+    container_ms = container.duration_ms if container else None
+    if not valid:
+        print(f"[STT] ❌ 손상된 오디오 파일 감지: {audio_path}")
+        return {"raw": "음성 파일이 손상되어 인식할 수 없습니다.", "silent": False, "audio": {},
+                "audio_sha256": None, "container_ms": container_ms, "cached": False}
+
+    digest = await asyncio.to_thread(audio_content_digest, audio_path)
+    cache_key = transcription_cache_key(digest, STT_BACKEND, STT_LANGUAGE)
+    cached = STT_CACHE.get(cache_key)
+    if cached is not None:
+        print(f"[STT 캐시] ♻️ 캐시 적중 - STT 생략: {audio_path} ({digest})")
+        return {**cached, "audio_sha256": digest, "container_ms": container_ms, "cached": True}
+
+    result = await _transcribe_uncached(audio_path, container_ms)
+    if result["raw"] not in _UNCACHEABLE_RESULTS:
+        STT_CACHE.put(cache_key, result)
+    return {**result, "audio_sha256": digest, "container_ms": container_ms, "cached": False}
+
+async def _transcribe_uncached(audio_path: str, container_ms: Optional[int] = None) -> Dict[str, Any]:
+    """VAD/트랜스코딩 전처리 → (무음이 아니면) STT 수행"""
+    try:
+        prepared = await prepare_audio_for_stt_async(audio_path)
+    except Exception as e:
+        # 전처리 실패 시 원본 그대로 STT 진행
+        print(f"[VAD] ⚠️ 전처리 실패 - 원본으로 STT 진행: {audio_path} - {e}")
+        # 원본은 이미 검사했으므로 재검사하지 않고, 분할 여부는 컨테이너 길이로 판단
+        raw = await transcribe_audio_file_async(audio_path, validate=False, duration_ms=container_ms)
+        return {"raw": raw, "silent": False, "audio": {}}
+
+    if prepared.is_silent:
+        return {"raw": SILENT_AUDIO_MESSAGE, "silent": True, "audio": prepared.to_dict()}
+
+    try:
+        # 원본 업로드는 이미 검사했으므로 전처리 결과는 재검사하지 않음 (짧은 Opus는 1KB 미만일 수 있음)
+        raw = await transcribe_audio_file_async(prepared.path, validate=False, duration_ms=prepared.output_ms)
+    finally:
+        if prepared.is_derived and os.path.exists(prepared.path):
+            os.remove(prepared.path)
+
+    return {"raw": raw, "silent": False, "audio": prepared.to_dict()}
+
+def _postprocess_transcription(result: str) -> str:
+    """
+    STT 결과 후처리: 명백히 잘못된 변환은 기본 메시지로 대체
+    """
     if is_invalid_transcription(result):
         print(f"[STT 후처리] ❌ 잘못된 변환 감지되어 필터링됨: '{result}'")
         return "음성을 명확하게 인식할 수 없습니다."
@@ -135,74 +332,104 @@ def transcribe_audio_file(file_path: str) -> str:
 def is_invalid_transcription(text: str) -> bool:
     """
     명백히 잘못된 STT 결과를 감지합니다.
+    (금지 문구/반복 루프/압축률 검사는 TRANSCRIPTION_FILTER가 한 번의 스캔으로 수행)
     """
-    if not text or len(text.strip()) == 0:
+    reason = TRANSCRIPTION_FILTER.check(text)
+    if reason is not None:
+        print(f"[STT 필터링] 감지: {reason} in '{(text or '')[:50]}...'")
         return True
+    return False
 
-    # 잘못된 변환 패턴들 (띄어쓰기 변형 포함)
-    invalid_patterns = [
-        "시청해주셔서 감사합니다",
-        "시청 해주셔서 감사합니다", 
-        "시청해 주셔서 감사합니다",
-        "오늘도 영상 시청 해주셔서 감사합니다",
-        "오늘도 시청해 주셔서 감사합니다",
-        "오늘도 시청해주셔서 감사합니다",
-        "영상 시청해주셔서 감사합니다",
-        "영상 시청해 주셔서 감사합니다",
-        "시청 감사합니다",
-        "시청해주셔서",
-        "시청해 주셔서",
-        "먹방",
-        "빠이빠이", 
-        "구독",
-        "영상 시청",
-        "채널",
-        "유튜브",
-        "좋아요",
-        "구독 버튼",
-        "알림 설정"
-    ]
-
-    text_lower = text.lower()
-    for pattern in invalid_patterns:
-        if pattern in text_lower:
-            print(f"[STT 필터링] 감지된 유튜브 관련 패턴: '{pattern}' in '{text[:50]}...'")
-            return True
-
-    # 너무 짧은 의미없는 단어들
-    if len(text.strip()) < 3:
-        return True
+async def stream_upload_to_file(
+    audio_file: UploadFile,
+    tmp_path: str,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> AudioUploadStats:
+    """
+    업로드 파일을 청크 단위로 임시 파일에 스트리밍 기록합니다.
 
-    return False
+    Args:
+        audio_file: 업로드된 파일
+        tmp_path: 기록할 임시 파일 경로 (호출자가 완료 후 최종 경로로 rename)
+        max_bytes: 허용 최대 크기 (초과 시 AudioUploadTooLargeError)
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        AudioUploadStats: 임시 경로, 크기, SHA-256, 소요 시간
+
+    Note:
+        - 메모리에는 청크 1개만 유지 (클립 길이와 무관)
+        - 같은 패스에서 SHA-256 해시 계산
+        - 실패 시 임시 파일 삭제
+    """
+    digest = hashlib.sha256()
+    size = 0
+    start = time.perf_counter()
+
+    try:
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while True:
+                chunk = await audio_file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise AudioUploadTooLargeError(f"업로드 크기 제한 초과: {size} > {max_bytes} bytes")
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return AudioUploadStats(
+        path=tmp_path,
+        size=size,
+        sha256=digest.hexdigest(),
+        elapsed=time.perf_counter() - start,
+    )
 
 async def save_audio_file(interviewee_id: int, audio_file: UploadFile) -> Optional[str]:
     """
-    업로드된 오디오 파일을 uploads 디렉토리에 저장합니다.
+    업로드된 오디오 파일을 uploads 디렉토리에 스트리밍 저장합니다.
     
     Args:
         interviewee_id: 면접자 ID
         audio_file: 업로드된 WebM 오디오 파일
         
     Returns:
-        str: 저장된 파일 경로
+        str: 저장된 파일 경로 (interviewee_id_timestamp_해시앞16자리.webm)
+        None: 저장 실패 또는 크기 제한 초과
+
+    Note:
+        - 임시 파일(.part)에 기록 후 os.replace로 원자적 rename
+        - 완성되지 않은 파일은 최종 경로에 나타나지 않음
     """
     try:
         # uploads 디렉토리 생성
-        save_dir = os.path.join("uploads")
+        save_dir = UPLOAD_DIR
         os.makedirs(save_dir, exist_ok=True)
 
-        # 파일명 생성 (interviewee_id_timestamp.webm 형식)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{interviewee_id}_{timestamp}.webm"
+        # 임시 파일에 스트리밍 저장 (해시는 저장과 같은 패스에서 계산)
+        tmp_path = os.path.join(save_dir, f".{interviewee_id}_{uuid.uuid4().hex}.part")
+        stats = await stream_upload_to_file(audio_file, tmp_path)
 
-        # 파일 저장
+        # 파일명 생성 (interviewee_id_timestamp_hash.webm 형식) 후 원자적 rename
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{interviewee_id}_{timestamp}_{stats.sha256[:16]}.webm"
         file_path = os.path.join(save_dir, filename)
-        with open(file_path, "wb") as buffer:
-            content = await audio_file.read()
-            buffer.write(content)
+        os.replace(tmp_path, file_path)
 
+        print(
+            f"[업로드] ✅ 저장 완료: {file_path} ({stats.size} bytes, "
+            f"{stats.elapsed:.3f}초, {stats.bytes_per_sec / 1024:.1f} KB/s, sha256={stats.sha256[:16]})"
+        )
         return file_path
 
+    except AudioUploadTooLargeError as e:
+        print(f"[업로드] ❌ {e}")
+        return None
     except Exception as e:
         print(f"파일 저장 중 오류 발생: {str(e)}")
-        return None
\ No newline at end of file
+        return None
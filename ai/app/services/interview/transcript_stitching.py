@@ -0,0 +1,69 @@
+"""
+SK AXIS AI 면접 분할 전사 결과 병합
+
+이 파일은 긴 답변을 겹치는 구간(overlap)으로 나눠 병렬 전사한 뒤,
+조각별 텍스트를 하나로 이어 붙이는 유틸리티입니다.
+주요 기능:
+- 앞 조각의 끝 단어들과 뒷 조각의 시작 단어들이 겹치는 부분 탐지
+- 겹친 단어를 한 번만 남기고 병합 (overlap 중복 제거)
+- 경계에서 잘린 단어로 인한 1~2단어 어긋남 허용
+
+병합 예시:
+    "저는 백엔드 개발을 주로 했고" + "개발을 주로 했고 팀장도 맡았습니다"
+    → "저는 백엔드 개발을 주로 했고 팀장도 맡았습니다"
+"""
+
+import re
+from typing import List
+
+# 겹침 탐색 범위 (단어 수)
+MAX_OVERLAP_WORDS = 20
+MIN_OVERLAP_WORDS = 2
+MAX_BOUNDARY_SKIP = 2  # 뒷 조각 앞부분에서 건너뛸 수 있는 잘린 단어 수
+
+_PUNCT = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def _normalize(word: str) -> str:
+    return _PUNCT.sub("", word).lower()
+
+
+def _overlap_end(prev_words: List[str], next_words: List[str]) -> int:
+    """
+    next_words 앞부분 중 prev_words 끝과 겹치는 부분이 끝나는 인덱스를 반환합니다 (없으면 0).
+    가장 긴 겹침을 우선하고, 경계에서 잘린 단어(겹침 단어의 일부)는 MAX_BOUNDARY_SKIP개까지 건너뜁니다.
+    """
+    prev_norm = [_normalize(w) for w in prev_words[-MAX_OVERLAP_WORDS:]]
+    next_norm = [_normalize(w) for w in next_words[: MAX_OVERLAP_WORDS + MAX_BOUNDARY_SKIP]]
+
+    for k in range(min(len(prev_norm), MAX_OVERLAP_WORDS), MIN_OVERLAP_WORDS - 1, -1):
+        tail = prev_norm[-k:]
+        for skip in range(0, MAX_BOUNDARY_SKIP + 1):
+            # 건너뛰는 단어는 겹침 구간 단어의 조각(잘린 단어)이어야 함
+            skipped = next_norm[:skip]
+            if not all(frag and any(frag in word for word in tail) for frag in skipped):
+                break
+            if next_norm[skip: skip + k] == tail:
+                return skip + k
+    return 0
+
+
+def stitch_transcripts(texts: List[str]) -> str:
+    """
+    순서대로 전사된 조각 텍스트를 겹침 중복을 제거하며 이어 붙입니다.
+
+    Args:
+        texts: 시간 순서의 조각별 전사 결과
+
+    Returns:
+        str: 병합된 전체 텍스트
+    """
+    words: List[str] = []
+    for text in texts:
+        next_words = (text or "").split()
+        if not next_words:
+            continue
+        if words:
+            next_words = next_words[_overlap_end(words, next_words):]
+        words.extend(next_words)
+    return " ".join(words)
@@ -0,0 +1,228 @@
+"""
+SK AXIS AI 면접 STT 환각(hallucination) 필터
+
+이 파일은 Whisper가 무음/잡음 구간에서 만들어 내는 잘못된 전사 결과를
+걸러내는 필터 엔진입니다.
+주요 기능:
+- 금지 문구 다중 패턴 매칭 (Aho-Corasick 오토마톤, 한 번의 스캔으로 모든 패턴 검사)
+- 반복 n-gram 탐지 ("감사합니다 감사합니다 감사합니다 ..." 같은 디코딩 루프)
+- 압축률 휴리스틱 (zlib 압축률이 지나치게 높으면 반복 텍스트로 판단)
+- 금지 문구 파일(STT_FILTER_PATTERNS_FILE) 변경 시 자동 재로딩
+
+매칭 규칙:
+- 공백을 제거하고 소문자로 바꾼 텍스트에서 매칭 ("시청 해주셔서" = "시청해주셔서")
+- 패턴 수가 수천 개로 늘어나도 검사 비용은 텍스트 길이에 비례
+"""
+
+import os
+import zlib
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+# ──────────────── ⚙️ 필터 설정 ────────────────
+STT_FILTER_PATTERNS_FILE = os.getenv("STT_FILTER_PATTERNS_FILE", "")                # 한 줄에 한 패턴, '#'은 주석
+STT_FILTER_MIN_CHARS = int(os.getenv("STT_FILTER_MIN_CHARS", "3"))                  # 이보다 짧으면 무의미한 결과
+STT_FILTER_MAX_NGRAM = int(os.getenv("STT_FILTER_MAX_NGRAM", "4"))                  # 반복 탐지 n-gram 최대 길이
+STT_FILTER_MAX_REPEATS = int(os.getenv("STT_FILTER_MAX_REPEATS", "4"))              # 연속 반복 허용 한도
+STT_FILTER_MAX_COMPRESSION_RATIO = float(os.getenv("STT_FILTER_MAX_COMPRESSION_RATIO", "2.4"))
+STT_FILTER_COMPRESSION_MIN_BYTES = 60                                               # 짧은 텍스트는 압축률 검사 생략
+
+# 기본 금지 문구 (유튜브 영상 자막에서 학습된 오인식)
+DEFAULT_BLOCK_PATTERNS = [
+    "시청해주셔서 감사합니다",
+    "오늘도 영상 시청 해주셔서 감사합니다",
+    "오늘도 시청해 주셔서 감사합니다",
+    "영상 시청해주셔서 감사합니다",
+    "시청 감사합니다",
+    "시청해주셔서",
+    "먹방",
+    "빠이빠이",
+    "구독",
+    "영상 시청",
+    "채널",
+    "유튜브",
+    "좋아요",
+    "구독 버튼",
+    "알림 설정",
+]
+
+
+def _compact(text: str) -> str:
+    """공백 제거 + 소문자 (띄어쓰기 변형을 하나의 패턴으로 매칭)"""
+    return "".join(text.split()).lower()
+
+
+class AhoCorasick:
+    """
+    다중 패턴 문자열 매칭 오토마톤
+
+    Note:
+        - 생성 시 한 번만 구축하고, 검색은 텍스트 길이에 비례하는 단일 스캔
+        - 상태 전이는 문자 → 다음 상태 dict, 실패 링크로 접미사 상태 연결
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Optional[str]] = [None]
+        self.size = 0
+
+        for pattern in patterns:
+            key = _compact(pattern)
+            if not key:
+                continue
+            state = 0
+            for ch in key:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(None)
+                    self._goto[state][ch] = nxt
+                state = nxt
+            if self._output[state] is None:
+                self._output[state] = pattern
+                self.size += 1
+
+        # BFS로 실패 링크 계산 (출력이 없는 상태는 실패 링크의 출력을 물려받음)
+        queue = deque(self._goto[0].values())  # 루트 자식의 실패 링크는 루트(0)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                if self._output[nxt] is None:
+                    self._output[nxt] = self._output[self._fail[nxt]]
+
+    def find_first(self, text: str) -> Optional[str]:
+        """텍스트(공백 무시)에서 처음 발견된 패턴을 반환합니다 (없으면 None)."""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for ch in _compact(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state] is not None:
+                return output[state]
+        return None
+
+
+def find_repeated_ngram(words: List[str], max_n: int = STT_FILTER_MAX_NGRAM,
+                        max_repeats: int = STT_FILTER_MAX_REPEATS) -> Optional[str]:
+    """
+    연속으로 max_repeats회 이상 반복되는 n-gram(n ≤ max_n)을 찾습니다.
+
+    Returns:
+        Optional[str]: 반복된 n-gram 문자열 (없으면 None)
+    """
+    for n in range(1, max_n + 1):
+        i = 0
+        while i + n * max_repeats <= len(words):
+            gram = words[i:i + n]
+            repeats = 1
+            while words[i + n * repeats: i + n * (repeats + 1)] == gram:
+                repeats += 1
+            if repeats >= max_repeats:
+                return " ".join(gram)
+            i += 1
+    return None
+
+
+def compression_ratio(text: str) -> float:
+    """원본 바이트 수 / zlib 압축 바이트 수 (반복이 많을수록 커짐)"""
+    data = text.encode("utf-8")
+    if not data:
+        return 0.0
+    return len(data) / len(zlib.compress(data))
+
+
+def load_patterns(path: str) -> List[str]:
+    """패턴 파일을 읽습니다 (빈 줄과 '#' 주석 무시)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+class TranscriptionFilter:
+    """
+    STT 결과 검증기
+
+    Note:
+        - patterns_file이 있으면 기본 금지 문구 대신 파일의 패턴 사용
+        - check()마다 파일 수정 시각을 확인하고, 바뀌었으면 오토마톤을 다시 구축해 교체
+        - 교체는 참조 할당 한 번이라 검사 중인 스레드에 영향 없음
+    """
+
+    def __init__(self, patterns_file: str = STT_FILTER_PATTERNS_FILE):
+        self.patterns_file = patterns_file or None
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._matcher = AhoCorasick(DEFAULT_BLOCK_PATTERNS)
+        self.reload()
+
+    @property
+    def pattern_count(self) -> int:
+        return self._matcher.size
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        패턴 파일이 바뀌었으면 다시 읽어 오토마톤을 교체합니다.
+
+        Returns:
+            bool: 교체 여부
+        """
+        if not self.patterns_file:
+            return False
+        try:
+            mtime = os.path.getmtime(self.patterns_file)
+        except OSError as e:
+            print(f"[STT 필터링] ⚠️ 패턴 파일 확인 실패 - 기존 패턴 유지: {self.patterns_file} - {e}")
+            return False
+
+        with self._lock:
+            if not force and mtime == self._mtime:
+                return False
+            try:
+                patterns = load_patterns(self.patterns_file)
+            except OSError as e:
+                print(f"[STT 필터링] ⚠️ 패턴 파일 읽기 실패 - 기존 패턴 유지: {self.patterns_file} - {e}")
+                return False
+            self._matcher = AhoCorasick(patterns)
+            self._mtime = mtime
+        print(f"[STT 필터링] 🔄 패턴 {self._matcher.size}개 로딩: {self.patterns_file}")
+        return True
+
+    def check(self, text: str) -> Optional[str]:
+        """
+        잘못된 전사 결과이면 사유를, 정상이면 None을 반환합니다.
+        """
+        if not text or not text.strip():
+            return "빈 결과"
+
+        self.reload()
+
+        pattern = self._matcher.find_first(text)
+        if pattern is not None:
+            return f"금지 문구 '{pattern}'"
+
+        if len(text.strip()) < STT_FILTER_MIN_CHARS:
+            return "너무 짧은 결과"
+
+        repeated = find_repeated_ngram(text.split())
+        if repeated is not None:
+            return f"반복 루프 '{repeated}'"
+
+        if len(text.encode("utf-8")) >= STT_FILTER_COMPRESSION_MIN_BYTES:
+            ratio = compression_ratio(text)
+            if ratio > STT_FILTER_MAX_COMPRESSION_RATIO:
+                return f"압축률 {ratio:.2f} 초과"
+
+        return None
+
+
+# ──────────────── 📦 전역 필터 (시작 시 한 번 구축) ────────────────
+TRANSCRIPTION_FILTER = TranscriptionFilter()
@@ -0,0 +1,258 @@
+"""
+SK AXIS AI 면접 WebM(EBML/Matroska) 구조 검사기
+
+이 파일은 업로드된 WebM 파일을 디코딩하지 않고 컨테이너 구조만 훑어
+손상/잘림 여부를 밀리초 단위로 판별하는 모듈입니다.
+주요 기능:
+- mmap 기반 EBML 요소 순회 (파일 전체를 메모리에 올리지 않음)
+- EBML 헤더/DocType, Segment, Cluster, SimpleBlock/BlockGroup 구조 검사
+- 선언된 크기가 파일 끝을 넘는 요소(잘린 업로드) 탐지
+- Info의 Duration(없으면 마지막 블록 타임코드)으로 재생 길이 추출
+
+참고:
+- 브라우저 MediaRecorder는 Segment/Cluster 크기를 "알 수 없음"(모든 비트 1)으로 기록하고
+  Duration도 남기지 않으므로, 이 경우 상위 레벨 요소 ID가 나오면 Cluster가 끝난 것으로 보고
+  블록 타임코드로 길이를 계산함
+"""
+
+import os
+import mmap
+import struct
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional, Tuple
+
+# ──────────────── 🔖 EBML/Matroska 요소 ID ────────────────
+EBML_HEADER_ID = 0x1A45DFA3
+DOCTYPE_ID = 0x4282
+SEGMENT_ID = 0x18538067
+INFO_ID = 0x1549A966
+TIMECODE_SCALE_ID = 0x2AD7B1
+DURATION_ID = 0x4489
+CLUSTER_ID = 0x1F43B675
+CLUSTER_TIMECODE_ID = 0xE7
+SIMPLE_BLOCK_ID = 0xA3
+BLOCK_GROUP_ID = 0xA0
+BLOCK_ID = 0xA1
+
+# Segment 직속 자식 (크기를 알 수 없는 Cluster의 끝을 판단하는 기준)
+_SEGMENT_CHILD_IDS = {
+    0x114D9B74,  # SeekHead
+    INFO_ID,
+    0x1654AE6B,  # Tracks
+    0x1C53BB6B,  # Cues
+    0x1043A770,  # Chapters
+    0x1254C367,  # Tags
+    0x1941A469,  # Attachments
+    CLUSTER_ID,
+}
+
+_DEFAULT_TIMECODE_SCALE_NS = 1_000_000  # 1ms
+_SUPPORTED_DOCTYPES = {"webm", "matroska"}
+
+
+class EBMLError(ValueError):
+    """EBML 구조가 잘못되었거나 파일이 잘린 경우"""
+
+
+@dataclass
+class WebMInfo:
+    """WebM 구조 검사 결과"""
+    valid: bool
+    reason: str = ""
+    doc_type: str = ""
+    duration_ms: int = 0
+    duration_source: str = ""  # "info" | "blocks" | ""
+    cluster_count: int = 0
+    block_count: int = 0
+    size_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _read_id(buf, pos: int, end: int) -> Tuple[int, int]:
+    """요소 ID(마커 비트 포함)와 다음 위치를 반환합니다."""
+    if pos >= end:
+        raise EBMLError("요소 ID를 읽는 중 파일 끝 도달")
+    first = buf[pos]
+    length = 1
+    mask = 0x80
+    while length <= 4 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 4:
+        raise EBMLError(f"잘못된 요소 ID (offset={pos})")
+    if pos + length > end:
+        raise EBMLError("요소 ID가 잘림")
+    return int.from_bytes(buf[pos:pos + length], "big"), pos + length
+
+
+def _read_size(buf, pos: int, end: int) -> Tuple[Optional[int], int]:
+    """요소 크기와 다음 위치를 반환합니다. 크기를 알 수 없으면 None."""
+    if pos >= end:
+        raise EBMLError("요소 크기를 읽는 중 파일 끝 도달")
+    first = buf[pos]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise EBMLError(f"잘못된 요소 크기 (offset={pos})")
+    if pos + length > end:
+        raise EBMLError("요소 크기가 잘림")
+    value = int.from_bytes(buf[pos:pos + length], "big") & ((1 << (7 * length)) - 1)
+    if value == (1 << (7 * length)) - 1:
+        return None, pos + length
+    return value, pos + length
+
+
+def _read_header(buf, pos: int, end: int) -> Tuple[int, Optional[int], int]:
+    element_id, pos = _read_id(buf, pos, end)
+    size, pos = _read_size(buf, pos, end)
+    if size is not None and pos + size > end:
+        raise EBMLError(f"요소 0x{element_id:X} 크기가 파일 끝을 넘음 (잘린 업로드)")
+    return element_id, size, pos
+
+
+def _read_uint(buf, pos: int, size: int) -> int:
+    return int.from_bytes(buf[pos:pos + size], "big")
+
+
+def _read_float(buf, pos: int, size: int) -> float:
+    if size == 4:
+        return struct.unpack(">f", buf[pos:pos + 4])[0]
+    if size == 8:
+        return struct.unpack(">d", buf[pos:pos + 8])[0]
+    return 0.0
+
+
+def _block_timecode(buf, pos: int, end: int) -> int:
+    """(Simple)Block 데이터에서 클러스터 기준 상대 타임코드(int16)를 읽습니다."""
+    _, pos = _read_size(buf, pos, end)  # 트랙 번호 (vint)
+    if pos + 3 > end:
+        raise EBMLError("블록 헤더가 잘림")
+    return struct.unpack(">h", buf[pos:pos + 2])[0]
+
+
+def _walk_ebml_header(buf, pos: int, end: int, info: WebMInfo) -> None:
+    while pos < end:
+        element_id, size, data = _read_header(buf, pos, end)
+        if size is None:
+            raise EBMLError("EBML 헤더 자식의 크기를 알 수 없음")
+        if element_id == DOCTYPE_ID:
+            info.doc_type = bytes(buf[data:data + size]).rstrip(b"\x00").decode("ascii", "replace")
+        pos = data + size
+
+
+def _walk_info(buf, pos: int, end: int) -> Tuple[int, Optional[float]]:
+    scale, duration = _DEFAULT_TIMECODE_SCALE_NS, None
+    while pos < end:
+        element_id, size, data = _read_header(buf, pos, end)
+        if size is None:
+            raise EBMLError("Info 자식의 크기를 알 수 없음")
+        if element_id == TIMECODE_SCALE_ID:
+            scale = _read_uint(buf, data, size) or _DEFAULT_TIMECODE_SCALE_NS
+        elif element_id == DURATION_ID:
+            duration = _read_float(buf, data, size)
+        pos = data + size
+    return scale, duration
+
+
+def _walk_cluster(buf, pos: int, end: int, info: WebMInfo) -> Tuple[int, int]:
+    """
+    Cluster 자식들을 순회하고 (다음 위치, 마지막 블록 절대 타임코드)를 반환합니다.
+    크기를 알 수 없는 Cluster는 Segment 직속 요소 ID를 만나면 끝난 것으로 봅니다.
+    """
+    cluster_tc, last_tc = 0, 0
+    while pos < end:
+        element_id, _ = _read_id(buf, pos, end)
+        if element_id in _SEGMENT_CHILD_IDS or element_id == EBML_HEADER_ID:
+            break
+        element_id, size, data = _read_header(buf, pos, end)
+        if size is None:
+            raise EBMLError(f"Cluster 자식 0x{element_id:X}의 크기를 알 수 없음")
+        if element_id == CLUSTER_TIMECODE_ID:
+            cluster_tc = _read_uint(buf, data, size)
+        elif element_id == SIMPLE_BLOCK_ID:
+            last_tc = max(last_tc, cluster_tc + _block_timecode(buf, data, data + size))
+            info.block_count += 1
+        elif element_id == BLOCK_GROUP_ID:
+            inner = data
+            while inner < data + size:
+                child_id, child_size, child_data = _read_header(buf, inner, data + size)
+                if child_size is None:
+                    raise EBMLError("BlockGroup 자식의 크기를 알 수 없음")
+                if child_id == BLOCK_ID:
+                    last_tc = max(last_tc, cluster_tc + _block_timecode(buf, child_data, child_data + child_size))
+                    info.block_count += 1
+                inner = child_data + child_size
+        pos = data + size
+    return pos, last_tc
+
+
+def _walk_segment(buf, pos: int, end: int, info: WebMInfo) -> None:
+    scale, duration, last_tc = _DEFAULT_TIMECODE_SCALE_NS, None, 0
+    while pos < end:
+        element_id, size, data = _read_header(buf, pos, end)
+        if element_id == EBML_HEADER_ID:
+            break  # 이어 붙은 다음 스트림 - 첫 Segment만 검사
+        if element_id == CLUSTER_ID:
+            info.cluster_count += 1
+            cluster_end = end if size is None else data + size
+            pos, cluster_last = _walk_cluster(buf, data, cluster_end, info)
+            last_tc = max(last_tc, cluster_last)
+            continue
+        if size is None:
+            raise EBMLError(f"Segment 자식 0x{element_id:X}의 크기를 알 수 없음")
+        if element_id == INFO_ID:
+            scale, duration = _walk_info(buf, data, data + size)
+        pos = data + size
+
+    if duration and duration > 0:
+        info.duration_ms = int(duration * scale / 1_000_000)
+        info.duration_source = "info"
+    elif info.block_count:
+        info.duration_ms = int(last_tc * scale / 1_000_000)
+        info.duration_source = "blocks"
+
+
+def inspect_webm(file_path: str) -> WebMInfo:
+    """
+    WebM 파일 구조를 검사하고 길이 정보를 추출합니다.
+
+    Returns:
+        WebMInfo: valid=False면 reason에 원인 기록
+
+    Note:
+        - 오디오 블록이 하나도 없는 파일(녹음 직후 중단 등)은 유효하지 않은 것으로 처리
+    """
+    size_bytes = os.path.getsize(file_path)
+    info = WebMInfo(valid=False, size_bytes=size_bytes)
+    if size_bytes == 0:
+        info.reason = "빈 파일"
+        return info
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        try:
+            element_id, size, data = _read_header(buf, 0, size_bytes)
+            if element_id != EBML_HEADER_ID or size is None:
+                raise EBMLError("EBML 헤더가 없음")
+            _walk_ebml_header(buf, data, data + size, info)
+            if info.doc_type not in _SUPPORTED_DOCTYPES:
+                raise EBMLError(f"지원하지 않는 DocType: {info.doc_type!r}")
+
+            element_id, size, data = _read_header(buf, data + size, size_bytes)
+            if element_id != SEGMENT_ID:
+                raise EBMLError("Segment가 없음")
+            _walk_segment(buf, data, size_bytes if size is None else data + size, info)
+        except EBMLError as e:
+            info.reason = str(e)
+            return info
+
+    if not info.block_count:
+        info.reason = "오디오 블록이 없음"
+        return info
+
+    info.valid = True
+    return info
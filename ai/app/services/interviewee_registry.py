@@ -0,0 +1,128 @@
+"""
+SK AXIS AI 면접자별 런타임 자원 레지스트리
+
+이 파일은 면접자별로 프로세스 안에서 필요한 자원(작업 큐, 실행 중 여부, 잠금)을
+한 곳에서 만들고 정리하는 레지스트리입니다.
+주요 기능:
+- 면접자별 슬롯: 작업 큐(deque) / 실행 중 여부 / 이름별 asyncio.Lock
+- 조회/생성 O(1) (dict 한 번)
+- 참조 카운트: 잠금을 잡고 있거나 acquire()로 붙잡은 동안에는 정리하지 않음
+- 유휴 정리(GC): 참조 0 + 큐 비어 있음 + 실행 중 아님 + 잠금 해제 → 즉시 슬롯 제거
+- stats(): 현재 슬롯 수, 누적 생성/정리 수 (/admin/queues)
+
+사용 목적:
+- 면접자마다 생기고 줄지 않던 전역 dict(업로드 Lock, 작업 큐, 실행 중 플래그)를 대체
+- 면접이 끝나 마지막 작업(최종 평가)이 완료되면 슬롯이 사라지므로 장기 실행 워커의 메모리 누수 방지
+
+주의사항:
+- 단일 이벤트 루프에서만 사용 (스레드 안전하지 않음)
+- 정리된 면접자에 다시 작업이 들어오면 새 슬롯을 만듦 (상태는 상태 저장소에 있으므로 문제 없음)
+"""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+
+@dataclass(eq=False)
+class IntervieweeSlot:
+    """면접자 한 명의 런타임 자원"""
+    queue: deque = field(default_factory=deque)                    # 대기 중인 QueuedTask
+    running: bool = False                                          # 작업 실행 중 여부
+    locks: Dict[str, asyncio.Lock] = field(default_factory=dict)   # 용도별 잠금 (예: "upload")
+    refs: int = 0                                                  # acquire()/locked() 참조 수
+
+    @property
+    def idle(self) -> bool:
+        return (self.refs == 0 and not self.queue and not self.running
+                and not any(lock.locked() for lock in self.locks.values()))
+
+
+class IntervieweeRegistry:
+    """
+    면접자별 슬롯 레지스트리
+
+    Example:
+        async with INTERVIEWEE_REGISTRY.locked(101, "upload"):
+            ...  # 같은 면접자의 업로드 등록 순서 보장
+        queue = INTERVIEWEE_REGISTRY.slot(101).queue
+    """
+
+    def __init__(self):
+        self._slots: Dict[int, IntervieweeSlot] = {}
+        self.created = 0
+        self.collected = 0
+
+    def slot(self, interviewee_id: int) -> IntervieweeSlot:
+        """슬롯을 반환합니다 (없으면 생성)."""
+        slot = self._slots.get(interviewee_id)
+        if slot is None:
+            slot = self._slots[interviewee_id] = IntervieweeSlot()
+            self.created += 1
+        return slot
+
+    def get(self, interviewee_id: int) -> Optional[IntervieweeSlot]:
+        """슬롯을 반환합니다 (없으면 None, 생성하지 않음)."""
+        return self._slots.get(interviewee_id)
+
+    def acquire(self, interviewee_id: int) -> IntervieweeSlot:
+        slot = self.slot(interviewee_id)
+        slot.refs += 1
+        return slot
+
+    def release(self, interviewee_id: int) -> None:
+        slot = self._slots.get(interviewee_id)
+        if slot is not None:
+            slot.refs = max(0, slot.refs - 1)
+            self.collect(interviewee_id)
+
+    def set_running(self, interviewee_id: int, running: bool) -> None:
+        if running:
+            self.slot(interviewee_id).running = True
+            return
+        slot = self._slots.get(interviewee_id)
+        if slot is not None:
+            slot.running = False
+
+    def collect(self, interviewee_id: int) -> bool:
+        """유휴 슬롯이면 제거하고 True를 반환합니다."""
+        slot = self._slots.get(interviewee_id)
+        if slot is None or not slot.idle:
+            return False
+        del self._slots[interviewee_id]
+        self.collected += 1
+        return True
+
+    @asynccontextmanager
+    async def locked(self, interviewee_id: int, name: str = "default") -> AsyncIterator[IntervieweeSlot]:
+        """면접자의 name 잠금을 잡는 동안 슬롯을 참조하고, 풀린 뒤 유휴이면 정리합니다."""
+        slot = self.acquire(interviewee_id)
+        lock = slot.locks.get(name)
+        if lock is None:
+            lock = slot.locks[name] = asyncio.Lock()
+        try:
+            async with lock:
+                yield slot
+        finally:
+            # 대기 중인 다른 코루틴도 참조를 잡고 있으므로 잠금은 슬롯과 함께 정리됨
+            self.release(interviewee_id)
+
+    def items(self) -> Iterator[Tuple[int, IntervieweeSlot]]:
+        return iter(list(self._slots.items()))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "slots": len(self._slots),
+            "created": self.created,
+            "collected": self.collected,
+            "referenced": sum(1 for slot in self._slots.values() if slot.refs),
+        }
+
+
+# ──────────────── 📦 전역 레지스트리 ────────────────
+INTERVIEWEE_REGISTRY = IntervieweeRegistry()
@@ -0,0 +1,220 @@
+"""
+SK AXIS AI 면접 로컬 Redis 대체 구현
+
+이 파일은 redis.asyncio 클라이언트 중 이 프로젝트가 사용하는 명령만
+프로세스 메모리로 구현한 대체 클라이언트입니다.
+주요 기능:
+- 문자열: get / set(nx, px, ex) / delete / exists / pexpire / pttl / incr
+- 리스트: rpush / lrange / lindex / llen / lrem
+- 집합: sadd / srem / smembers
+- 키 순회: scan_iter(match)
+- 스크립트: register_script(lua) → local_script로 등록한 같은 동작의 파이썬 구현을 실행
+- 만료(PX/EX)는 조회 시점에 지연 삭제
+
+사용 목적:
+- Redis 없이 단일 프로세스 개발/테스트 (QUEUE_SHARED_BACKEND=local, STATE_BACKEND=local)
+- 공유 큐/상태 저장소 코드를 실제 Redis와 같은 호출 형태로 검증
+
+주의사항:
+- 프로세스 간 공유되지 않음 (다중 워커 배포에는 실제 Redis 사용)
+- 값은 실제 Redis처럼 bytes로 저장/반환 (decode_responses=False 동작)
+- Lua는 실행하지 않음 → 스크립트마다 파이썬 구현을 local_script로 함께 등록해야 함
+"""
+
+import time
+import fnmatch
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Union
+
+Value = Union[bytes, str, int, float]
+ScriptImpl = Callable[["LocalRedis", List[str], List[Value]], Awaitable[Any]]
+
+# Lua 스크립트 원문 → 같은 동작의 파이썬 구현
+_LOCAL_SCRIPTS: Dict[str, ScriptImpl] = {}
+
+
+def local_script(script: str) -> Callable[[ScriptImpl], ScriptImpl]:
+    """
+    Lua 스크립트의 LocalRedis용 파이썬 구현을 등록하는 데코레이터
+
+    Note:
+        - 구현은 LocalRedis 명령만 await해야 함 (명령은 중간에 양보하지 않으므로 스크립트 전체가 원자적)
+    """
+    def decorator(impl: ScriptImpl) -> ScriptImpl:
+        _LOCAL_SCRIPTS[script] = impl
+        return impl
+    return decorator
+
+
+def _encode(value: Value) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
+
+
+class LocalRedis:
+    """
+    redis.asyncio.Redis 호환 최소 구현 (단일 이벤트 루프용)
+
+    Note:
+        - 각 명령은 await 지점 없이 실행되므로 이벤트 루프 안에서는 원자적
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+        self._expire_at: Dict[str, float] = {}
+
+    # ─── 내부 도우미 ───
+    def _alive(self, key: str) -> bool:
+        expire_at = self._expire_at.get(key)
+        if expire_at is not None and time.monotonic() >= expire_at:
+            self._data.pop(key, None)
+            self._expire_at.pop(key, None)
+        return key in self._data
+
+    def _typed(self, key: str, kind: type, create: bool = False):
+        if not self._alive(key):
+            if not create:
+                return None
+            self._data[key] = kind()
+        value = self._data[key]
+        if not isinstance(value, kind):
+            raise TypeError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    # ─── 문자열 ───
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._typed(key, bytes)
+
+    async def set(self, key: str, value: Value, nx: bool = False, px: Optional[int] = None,
+                  ex: Optional[int] = None) -> Optional[bool]:
+        if nx and self._alive(key):
+            return None
+        self._data[key] = _encode(value)
+        self._expire_at.pop(key, None)
+        if px is not None:
+            self._expire_at[key] = time.monotonic() + px / 1000
+        elif ex is not None:
+            self._expire_at[key] = time.monotonic() + ex
+        return True
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        value = int(self._typed(key, bytes) or b"0") + amount
+        self._data[key] = _encode(value)
+        return value
+
+    async def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                del self._data[key]
+                self._expire_at.pop(key, None)
+                removed += 1
+        return removed
+
+    async def exists(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._alive(key))
+
+    async def pexpire(self, key: str, ms: int) -> bool:
+        if not self._alive(key):
+            return False
+        self._expire_at[key] = time.monotonic() + ms / 1000
+        return True
+
+    async def pttl(self, key: str) -> int:
+        if not self._alive(key):
+            return -2
+        expire_at = self._expire_at.get(key)
+        return -1 if expire_at is None else int((expire_at - time.monotonic()) * 1000)
+
+    # ─── 리스트 ───
+    async def rpush(self, key: str, *values: Value) -> int:
+        items = self._typed(key, list, create=True)
+        items.extend(_encode(v) for v in values)
+        return len(items)
+
+    async def lrange(self, key: str, start: int, end: int) -> List[bytes]:
+        items = self._typed(key, list) or []
+        end = len(items) if end == -1 else end + 1
+        return list(items[start:end])
+
+    async def lindex(self, key: str, index: int) -> Optional[bytes]:
+        items = self._typed(key, list) or []
+        return items[index] if -len(items) <= index < len(items) else None
+
+    async def llen(self, key: str) -> int:
+        return len(self._typed(key, list) or [])
+
+    async def lrem(self, key: str, count: int, value: Value) -> int:
+        items = self._typed(key, list)
+        if not items:
+            return 0
+        target = _encode(value)
+        limit = abs(count) or len(items)
+        # count < 0이면 뒤에서부터 삭제
+        indexes = [i for i, item in enumerate(items) if item == target]
+        indexes = (indexes[::-1] if count < 0 else indexes)[:limit]
+        for i in sorted(indexes, reverse=True):
+            del items[i]
+        removed = len(indexes)
+        if not items:
+            await self.delete(key)
+        return removed
+
+    # ─── 집합 ───
+    async def sadd(self, key: str, *members: Value) -> int:
+        members_set: Set[bytes] = self._typed(key, set, create=True)
+        before = len(members_set)
+        members_set.update(_encode(m) for m in members)
+        return len(members_set) - before
+
+    async def srem(self, key: str, *members: Value) -> int:
+        members_set = self._typed(key, set)
+        if not members_set:
+            return 0
+        before = len(members_set)
+        members_set.difference_update(_encode(m) for m in members)
+        if not members_set:
+            await self.delete(key)
+        return before - len(members_set)
+
+    async def smembers(self, key: str) -> Set[bytes]:
+        return set(self._typed(key, set) or ())
+
+    # ─── 스크립트 ───
+    def register_script(self, script: str) -> Callable[..., Awaitable[Any]]:
+        """redis.asyncio의 register_script와 같은 호출 형태: await script(keys=[...], args=[...])"""
+        impl = _LOCAL_SCRIPTS.get(script)
+        if impl is None:
+            raise NotImplementedError("LocalRedis에 파이썬 구현이 등록되지 않은 스크립트")
+
+        def run(keys: Sequence[str] = (), args: Sequence[Value] = ()) -> Awaitable[Any]:
+            return impl(self, list(keys), list(args))
+        return run
+
+    # ─── 키 순회 ───
+    async def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None) -> AsyncIterator[bytes]:
+        for key in list(self._data):
+            if self._alive(key) and (match is None or fnmatch.fnmatchcase(key, match)):
+                yield key.encode("utf-8")
+
+    async def aclose(self) -> None:
+        pass
+
+
+def create_redis_client(backend: str, url: str = ""):
+    """
+    백엔드 이름으로 비동기 Redis 클라이언트를 생성합니다.
+
+    Args:
+        backend (str): "redis" (redis.asyncio, url 필요) | "local" (LocalRedis)
+
+    Note:
+        - redis 패키지는 "redis" 백엔드를 쓸 때만 임포트
+        - redis.asyncio 클라이언트는 첫 명령 실행 시 연결
+    """
+    if backend == "local":
+        return LocalRedis()
+    if backend == "redis":
+        import redis.asyncio as aioredis
+        return aioredis.from_url(url)
+    raise ValueError(f"지원하지 않는 Redis 백엔드: {backend}")
@@ -0,0 +1,140 @@
+"""
+SK AXIS AI 면접 모델/클라이언트 레지스트리
+
+이 파일은 무거운 리소스(STT 모델, OpenAI 클라이언트 등)를 프로세스 단위로
+한 번만 생성해 공유하는 지연 로딩 레지스트리입니다.
+주요 기능:
+- 이름 → 팩토리 등록, 최초 get() 시점에 생성 (지연 로딩)
+- 스레드 안전한 단일 생성 보장 (동시 요청에도 모델 1회 로딩)
+- FastAPI lifespan 워밍업 단계에서 미리 로딩 (MODEL_WARMUP)
+- 리소스별 로딩 시간 및 프로세스 RSS 리포트
+
+사용 목적:
+- app.main 임포트 시 모델/클라이언트 생성을 피해서 콜드 스타트 단축
+- uvicorn 워커별 불필요한 리소스 로딩 방지 (실제 사용하는 것만 로딩)
+
+사용 예시:
+    MODEL_REGISTRY.register("openai_client", _create_openai_client)
+    client = MODEL_REGISTRY.get("openai_client")
+"""
+
+import os
+import time
+import resource
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+from dotenv import load_dotenv
+
+# ──────────────── 🔐 환경 설정 ────────────────
+load_dotenv()
+
+# 워밍업 대상 리소스 이름 (쉼표 구분, 비어 있으면 모두 지연 로딩)
+MODEL_WARMUP = [name.strip() for name in os.getenv("MODEL_WARMUP", "").split(",") if name.strip()]
+
+
+class ModelRegistry:
+    """
+    프로세스 전역 지연 로딩 리소스 레지스트리
+
+    Note:
+        - 같은 이름을 여러 번 get()해도 팩토리는 한 번만 실행됨
+        - 팩토리 실패 시 예외를 그대로 전파하고 다음 get()에서 재시도
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._load_times: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """리소스 팩토리를 등록합니다 (이미 로딩된 인스턴스는 유지)."""
+        with self._lock:
+            self._factories[name] = factory
+
+    def get(self, name: str) -> Any:
+        """리소스를 반환합니다. 아직 생성되지 않았다면 팩토리를 실행합니다."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            # 다른 스레드가 먼저 생성했는지 재확인 (double-checked locking)
+            if name in self._instances:
+                return self._instances[name]
+            factory = self._factories.get(name)
+            if factory is None:
+                raise KeyError(f"등록되지 않은 리소스: {name}")
+
+            start = time.perf_counter()
+            instance = factory()
+            self._load_times[name] = time.perf_counter() - start
+            self._instances[name] = instance
+            print(f"[ModelRegistry] 📦 '{name}' 로딩 완료 ({self._load_times[name]:.3f}초)")
+            return instance
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def release(self, name: str) -> Optional[Any]:
+        """
+        로딩된 인스턴스를 레지스트리에서 빼서 반환합니다 (없으면 None).
+        정리(shutdown/close)는 호출자가 하며, 다음 get()은 팩토리로 새로 생성합니다.
+        """
+        with self._lock:
+            self._load_times.pop(name, None)
+            return self._instances.pop(name, None)
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        지정한 리소스를 미리 로딩합니다.
+
+        Args:
+            names: 로딩할 리소스 이름 목록 (None이면 MODEL_WARMUP)
+
+        Returns:
+            Dict[str, float]: 리소스별 로딩 시간 (실패 시 -1.0)
+        """
+        results: Dict[str, float] = {}
+        for name in (MODEL_WARMUP if names is None else names):
+            try:
+                self.get(name)
+                results[name] = round(self._load_times.get(name, 0.0), 3)
+            except Exception as e:
+                print(f"[ModelRegistry] ❌ '{name}' 워밍업 실패: {e}")
+                results[name] = -1.0
+        return results
+
+    def report(self) -> Dict[str, Any]:
+        """등록/로딩 현황과 프로세스 최대 RSS(MB)를 반환합니다."""
+        return {
+            "registered": sorted(self._factories),
+            "loaded": {name: round(sec, 3) for name, sec in self._load_times.items()},
+            "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        }
+
+
+# ──────────────── 📦 전역 레지스트리 ────────────────
+MODEL_REGISTRY = ModelRegistry()
+
+
+def _create_openai_client():
+    """OpenAI 동기 클라이언트 생성 (API 키 필수)"""
+    from openai import OpenAI
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("❌ OPENAI_API_KEY가 .env에 정의되지 않았습니다.")
+    return OpenAI(api_key=api_key)
+
+
+def _create_openai_async_client():
+    """OpenAI 비동기 클라이언트 생성 (API 키 필수)"""
+    from openai import AsyncOpenAI
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("❌ OPENAI_API_KEY가 .env에 정의되지 않았습니다.")
+    return AsyncOpenAI(api_key=api_key)
+
+
+MODEL_REGISTRY.register("openai_client", _create_openai_client)
+MODEL_REGISTRY.register("openai_async_client", _create_openai_async_client)
@@ -30,9 +30,9 @@ from datetime import datetime
 from typing import Literal, Dict, Any
 import os
 import json
+import asyncio
 import openai
 from dotenv import load_dotenv
-import openpyxl
 import httpx
 import pytz
 
@@ -41,13 +41,13 @@ import pytz
 load_dotenv()
 RESULT_DIR = os.getenv("RESULT_DIR", "./result")
 
-from app.services.interview.stt_service import transcribe_audio_file
+from app.services.interview.stt_service import transcribe_upload
 from app.services.interview.rewrite_service import rewrite_answer
 from app.services.interview.evaluation_service import evaluate_keywords_from_full_answer
-from app.services.interview.report_service import generate_pdf
 from app.schemas.nonverbal import Posture, FacialExpression, NonverbalData
 from app.services.interview.nonverbal_service import evaluate
 from app.schemas.state import InterviewState
+from app.services.decision_log import log_decision
 from langgraph.channels import LastValue, BinaryOperatorAggregate
 from app.constants.evaluation_constants_full_all import (
     EVAL_CRITERIA_WITH_ALL_SCORES,
@@ -126,9 +126,9 @@ def safe_get(d, key, default=None, context=""):
 # 1) STT 노드: audio_path → raw text
 # ───────────────────────────────────────────────────
 
-def stt_node(state: InterviewState) -> InterviewState:
+async def stt_node(state: InterviewState) -> InterviewState:
     """
-    음성 파일을 텍스트로 변환하는 STT 노드
+    음성 파일을 텍스트로 변환하는 STT 노드 (비동기)
     
     Args:
         state (InterviewState): 면접 상태 객체
@@ -137,21 +137,71 @@ def stt_node(state: InterviewState) -> InterviewState:
         InterviewState: STT 결과가 추가된 상태
         
     처리 과정:
-    1. audio_path에서 오디오 파일 경로 추출
-    2. OpenAI Whisper API로 음성 인식 수행
+    1. audio_paths(묶인 세그먼트) 또는 audio_path에서 오디오 파일 경로 추출
+    2. VAD 전처리 후 STT 백엔드로 음성 인식 수행 (await - 이벤트 루프 비차단)
     3. 손상된 파일 또는 인식 실패 시 기본 메시지 설정
     4. 결과를 state["stt"]["segments"]에 저장
     
     Note:
+        - 여러 세그먼트가 묶여 오면 모두 전사한 뒤 한 번의 리라이팅으로 넘김 (stt["last_added"] = 추가된 수)
+        - 무음 클립은 STT/리라이팅 모두 생략 (state["stt"]["last_result"] = "silent")
+        - 이미 처리한 오디오(같은 해시)는 세그먼트 추가/리라이팅 생략 ("duplicate")
+        - 전역 동시 전사 수 제한 (STT_MAX_CONCURRENCY)
         - 파일 헤더 검증으로 3000배 속도 향상
         - 손상된 WebM 파일 사전 감지
         - 유튜브 관련 오인식 필터링
     """
     print("[LangGraph] 🧠 stt_node 진입")
-    
-    audio_path = safe_get(state, "audio_path", context="stt_node")
-    raw = transcribe_audio_file(audio_path)
-    
+
+    # 큐에서 묶인 여러 세그먼트(audio_paths) 또는 단일 세그먼트(audio_path)
+    audio_paths = safe_get(state, "audio_paths", None, context="stt_node") or [safe_get(state, "audio_path", context="stt_node")]
+    # 세그먼트들은 동시에 전사하고 (전역 STT 동시 실행 상한 적용), 결과는 업로드 순서대로 반영
+    results = await asyncio.gather(*(transcribe_upload(path) for path in audio_paths))
+
+    state.setdefault("stt", {"done": False, "segments": []})
+    stt = state["stt"]
+    outcomes = [_apply_stt_result(stt, path, result) for path, result in zip(audio_paths, results)]
+
+    added = outcomes.count("ok")
+    stt["last_added"] = added
+    stt["last_result"] = "ok" if added else outcomes[-1]
+    if added:
+        print(f"[LangGraph] ✅ STT 완료: 세그먼트 {added}개 추가 - {stt['segments'][-1]['raw'][:50]}...")
+    return state
+
+def _apply_stt_result(stt: Dict[str, Any], audio_path: str, result: Dict[str, Any]) -> str:
+    """
+    세그먼트 하나의 STT 결과를 state["stt"]에 반영합니다.
+
+    Returns:
+        str: "ok"(세그먼트 추가) | "silent"(무음) | "duplicate"(이미 처리한 오디오)
+    """
+    raw = result["raw"]
+
+    # VAD로 제거된 오디오 길이 누적 (비용/지연 절감량 추적, 캐시 적중 시에는 제외)
+    audio_stats = result.get("audio", {})
+    totals = stt.setdefault("audio_totals", {"original_ms": 0, "output_ms": 0, "removed_ms": 0, "silent_skipped": 0})
+    if not result.get("cached"):
+        for key in ("original_ms", "output_ms", "removed_ms"):
+            totals[key] += audio_stats.get(key, 0)
+    # 디코딩 없이 컨테이너에서 읽은 업로드 재생 길이 (업로드 총량 집계)
+    container_ms = result.get("container_ms")
+    if container_ms:
+        totals["container_ms"] = totals.get("container_ms", 0) + container_ms
+
+    # 재업로드된 같은 오디오: 세그먼트 중복 추가 및 리라이팅 생략 (평가 왜곡 방지)
+    digest = result.get("audio_sha256")
+    if digest and any(seg.get("audio_sha256") == digest for seg in stt["segments"]):
+        totals["duplicate_skipped"] = totals.get("duplicate_skipped", 0) + 1
+        print(f"[LangGraph] ♻️ 중복 세그먼트 - 추가 생략: {audio_path} ({digest})")
+        return "duplicate"
+
+    # 무음 클립: 세그먼트를 추가하지 않고 리라이팅도 건너뜀
+    if result.get("silent"):
+        totals["silent_skipped"] += 1
+        print(f"[LangGraph] 🔇 무음 클립 - 세그먼트 추가 생략: {audio_path}")
+        return "silent"
+
     # 손상된 파일 또는 STT 실패 처리
     if not raw or not str(raw).strip():
         raw = "음성을 인식할 수 없습니다."
@@ -159,12 +209,25 @@ def stt_node(state: InterviewState) -> InterviewState:
         print(f"[LangGraph] ⚠️ 손상된 오디오 파일 처리: {audio_path}")
         # 손상된 파일에 대한 기본 답변 설정
         raw = "기술적 문제로 음성을 인식할 수 없어 답변을 제공할 수 없습니다."
-    
-    state.setdefault("stt", {"done": False, "segments": []})
-    state["stt"]["segments"].append({"raw": raw, "timestamp": datetime.now(KST).isoformat()})
-    
-    print(f"[LangGraph] ✅ STT 완료: {raw[:50]}...")
-    return state
+
+    stt["segments"].append({
+        "raw": raw,
+        "timestamp": datetime.now(KST).isoformat(),
+        "audio": audio_stats,
+        "audio_sha256": digest,
+        "container_ms": container_ms,
+    })
+    return "ok"
+
+def should_rewrite(state: InterviewState) -> Literal["rewrite", "skip"]:
+    """
+    STT 결과에 따라 리라이팅 진행 여부를 결정하는 조건 함수
+
+    Returns:
+        Literal["rewrite", "skip"]: 새 세그먼트가 추가되었으면 "rewrite", 무음/중복 클립이면 "skip"
+    """
+    stt = safe_get(state, "stt", {}, context="should_rewrite")
+    return "skip" if stt.get("last_result") in ("silent", "duplicate") else "rewrite"
 
 # ───────────────────────────────────────────────────
 # 2) Rewrite 에이전트: raw → rewritten
@@ -180,7 +243,7 @@ async def rewrite_agent(state: InterviewState) -> InterviewState:
         InterviewState: 리라이팅 결과가 추가된 상태
         
     처리 과정:
-    1. STT 결과에서 마지막 세그먼트 추출
+    1. 이번 실행에서 추가된 세그먼트(stt["last_added"]개) 추출 - 여러 개면 줄바꿈으로 합쳐 한 번에 리라이팅
     2. GPT-4o-mini로 의미 보존 기반 텍스트 정제
     3. 재시도 횟수 관리 (현재 재시도 비활성화)
     4. 결과를 state["rewrite"]["items"]에 저장
@@ -194,7 +257,8 @@ async def rewrite_agent(state: InterviewState) -> InterviewState:
     print("[LangGraph] ✏️ rewrite_agent 진입")
     stt = safe_get(state, "stt", {}, context="rewrite_agent")
     stt_segments = safe_get(stt, "segments", [], context="rewrite_agent")
-    raw = stt_segments[-1]["raw"] if stt_segments else "없음"
+    added = max(1, safe_get(stt, "last_added", 1, context="rewrite_agent"))
+    raw = "\n".join(seg["raw"] for seg in stt_segments[-added:]) if stt_segments else "없음"
     if not raw or not str(raw).strip():
         raw = "없음"
     rewritten, _ = await rewrite_answer(raw)
@@ -225,7 +289,7 @@ async def rewrite_agent(state: InterviewState) -> InterviewState:
 
     print(f"[LangGraph] ✅ rewrite 결과: {rewritten[:30]}... (retry_count={retry_count})")
     ts = datetime.now(KST).isoformat()
-    state.setdefault("decision_log", []).append({
+    log_decision(state, {
         "step":   "rewrite_agent",
         "result": "processing",
         "time":   ts,
@@ -285,7 +349,7 @@ async def rewrite_judge_agent(state: InterviewState) -> InterviewState:
     force   = safe_get(rewrite, "force_ok", False, context="rewrite_judge_agent")
 
     if not items:
-        state.setdefault("decision_log", []).append({
+        log_decision(state, {
             "step":   "rewrite_judge_agent",
             "result": "error",
             "time":   datetime.now(KST).isoformat(),
@@ -370,7 +434,7 @@ async def rewrite_judge_agent(state: InterviewState) -> InterviewState:
                 item["ok"] = True
                 item["judge_notes"].append("강제 통과 (재시도 3회 초과)")
 
-            state.setdefault("decision_log", []).append({
+            log_decision(state, {
                 "step":   "rewrite_judge_agent",
                 "result": f"ok={item['ok']}",
                 "time":   datetime.now(KST).isoformat(),
@@ -383,7 +447,7 @@ async def rewrite_judge_agent(state: InterviewState) -> InterviewState:
             print(f"[DEBUG] 🔍 원본 LLM 응답: {llm_response if 'llm_response' in locals() else 'N/A'}")
             item["ok"]          = False
             item["judge_notes"] = [f"judge error: {e}"]
-            state.setdefault("decision_log", []).append({
+            log_decision(state, {
                 "step":"rewrite_judge_agent",
                 "result":"error",
                 "time":datetime.now(KST).isoformat(),
@@ -433,11 +497,13 @@ async def nonverbal_evaluation_agent(state: InterviewState) -> InterviewState:
         # 구조 체크
         if not counts or not isinstance(counts, dict):
             print("[WARNING] nonverbal_counts가 dict가 아님 또는 비어있음. 비언어적 평가를 건너뜀.")
-            state.decision_log.append("Nonverbal data not available for evaluation.")
+            log_decision(state, {"step": "nonverbal_evaluation", "result": "skipped",
+                                 "details": {"reason": "Nonverbal data not available for evaluation."}})
             return state
         if "expression" not in counts or not isinstance(counts["expression"], dict):
             print("[WARNING] nonverbal_counts['expression']가 dict가 아님 또는 없음. 비언어적 평가를 건너뜀.")
-            state.decision_log.append("Nonverbal expression data not available for evaluation.")
+            log_decision(state, {"step": "nonverbal_evaluation", "result": "skipped",
+                                 "details": {"reason": "Nonverbal expression data not available for evaluation."}})
             return state
         # expression 내부 키 체크
         exp = counts["expression"]
@@ -462,7 +528,7 @@ async def nonverbal_evaluation_agent(state: InterviewState) -> InterviewState:
             "score": pts,
             "reason": analysis or feedback or "평가 사유없음"
         }
-        state.setdefault("decision_log", []).append({
+        log_decision(state, {
             "step": "nonverbal_evaluation",
             "result": "success",
             "time": ts,
@@ -473,7 +539,7 @@ async def nonverbal_evaluation_agent(state: InterviewState) -> InterviewState:
         print(f"[DEBUG] nonverbal_evaluation_agent - state['evaluation']['results']['비언어적']: {state.get('evaluation', {}).get('results', {}).get('비언어적')}")
     except Exception as e:
         print(f"[ERROR] 비언어적 평가 중 예외 발생: {e}")
-        state.setdefault("decision_log", []).append({
+        log_decision(state, {
             "step": "nonverbal_evaluation",
             "result": "error",
             "time": ts,
@@ -626,7 +692,7 @@ async def evaluation_agent(state: InterviewState) -> InterviewState:
     }
     state["done"] = True  # 파이프라인 전체 종료 신호 추가
     ts = datetime.now(KST).isoformat()
-    state.setdefault("decision_log", []).append({
+    log_decision(state, {
         "step": "evaluation_agent",
         "result": "done",
         "time": ts,
@@ -662,7 +728,7 @@ async def evaluation_judge_agent(state: InterviewState) -> InterviewState:
     evaluation = safe_get(state, "evaluation", {}, context="evaluation_judge_agent:evaluation")
     results = safe_get(evaluation, "results", {}, context="evaluation_judge_agent:evaluation.results")
     if not results:
-        state.setdefault("decision_log", []).append({
+        log_decision(state, {
             "step": "evaluation_judge_agent",
             "result": "error",
             "time": datetime.now(KST).isoformat(),
@@ -803,7 +869,7 @@ async def evaluation_judge_agent(state: InterviewState) -> InterviewState:
         print(f"[LangGraph] ❌ 내용 검증 오류: {e}")
 
     ts = datetime.now(KST).isoformat()
-    state.setdefault("decision_log", []).append({
+    log_decision(state, {
         "step": "evaluation_judge_agent",
         "result": f"ok={is_valid}",
         "time": ts,
@@ -1008,7 +1074,7 @@ async def score_summary_agent(state):
         print(f"[⏱️] 평가 소요시간: {total_elapsed:.2f}초 (평가 시작 → 완료)")
         
         # decision_log에도 기록
-        state.setdefault("decision_log", []).append({
+        log_decision(state, {
             "step": "evaluation_complete",
             "result": "success",
             "time": datetime.now(KST).isoformat(),
@@ -1040,7 +1106,7 @@ async def score_summary_agent(state):
 파이프라인 실행 흐름:
 
 1. interview_flow_executor (STT → 리라이팅):
-   stt_node → rewrite_agent → rewrite_judge_agent → (재시도 없음) → 완료
+   stt_node → (무음/중복 클립이면 종료) → rewrite_agent → rewrite_judge_agent → (재시도 없음) → 완료
 
 2. final_flow_executor (평가 → 요약):
    nonverbal_eval → evaluation_agent → evaluation_judge_agent → (재시도 최대 1회) → score_summary_agent → 완료
@@ -1054,7 +1120,10 @@ interview_builder.add_node("stt_node", stt_node)
 interview_builder.add_node("rewrite_agent", rewrite_agent)
 interview_builder.add_node("rewrite_judge_agent", rewrite_judge_agent)
 interview_builder.set_entry_point("stt_node")
-interview_builder.add_edge("stt_node", "rewrite_agent")
+interview_builder.add_conditional_edges(
+    "stt_node", should_rewrite,
+    {"rewrite":"rewrite_agent", "skip":"__end__"}
+)
 interview_builder.add_edge("rewrite_agent", "rewrite_judge_agent")
 interview_builder.add_conditional_edges(
     "rewrite_judge_agent", should_retry_rewrite,
@@ -0,0 +1,121 @@
+"""
+SK AXIS AI 면접 CPU 작업 프로세스 풀
+
+이 파일은 GIL을 잡고 오래 도는 CPU 작업(로컬 Whisper 추론 등)을
+별도 프로세스에서 실행하는 공용 풀입니다.
+주요 기능:
+- ProcessPoolExecutor 지연 생성 (첫 작업 제출 시, spawn 방식)
+- run_cpu_bound(func, *args): 제출 후 결과를 await (이벤트 루프는 다른 요청 계속 처리)
+- 워커 프로세스 비정상 종료(BrokenProcessPool) 시 풀 재생성 후 새 풀에서 한 번 재시도 (또 깨지면 예외 전파)
+- CPU_POOL_WORKERS=0이면 프로세스 풀 없이 스레드로 실행 (로컬 개발/테스트용)
+
+주의사항:
+- func와 인자는 pickle 가능해야 함 (모듈 수준 함수, 기본 자료형 인자)
+- 워커 프로세스는 모델 등 무거운 리소스를 프로세스별로 한 번 로딩해 재사용 (호출 측 모듈 전역 캐시)
+- 앱 종료 시 lifespan에서 shutdown() 호출
+- 풀이 깨져도 API 프로세스 안에서 대신 실행하지 않음 (워커를 OOM으로 죽인 모델 로딩이 API 프로세스까지 죽이지 않도록)
+"""
+
+import os
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# ──────────────── ⚙️ 프로세스 풀 설정 ────────────────
+CPU_POOL_WORKERS = int(os.getenv("CPU_POOL_WORKERS", "2"))  # 0이면 스레드로 실행
+
+
+class CPUBoundPool:
+    """
+    지연 생성 프로세스 풀
+
+    Note:
+        - fork 대신 spawn 사용: 이벤트 루프/스레드가 돌고 있는 프로세스를 fork하면 락 상태가 복제되어 교착 위험
+        - 풀이 깨지면 다음 제출 때 새로 생성
+    """
+
+    def __init__(self, workers: int = CPU_POOL_WORKERS):
+        self.workers = max(0, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.restarts = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                print(f"[CPUPool] 🚀 프로세스 워커 {self.workers}개 시작")
+            return self._executor
+
+    def _discard_executor(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        func(*args)를 프로세스 풀에서 실행하고 결과를 반환합니다.
+
+        Note:
+            - 작업 예외는 그대로 전파
+            - 풀이 깨지면 새 풀을 만들어 한 번만 재시도, 그래도 깨지면 BrokenProcessPool 전파
+        """
+        if not self.enabled:
+            return await asyncio.to_thread(func, *args)
+
+        self.submitted += 1
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+            except BrokenProcessPool as e:
+                self._discard_executor(executor)
+                self.restarts += 1
+                if attempt:
+                    print(f"[CPUPool] ❌ 재생성한 프로세스 풀도 손상 - 작업 실패: {e}")
+                    raise
+                print(f"[CPUPool] ⚠️ 프로세스 풀 손상 - 새 풀에서 재시도: {e}")
+
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "submitted": self.submitted,
+            "restarts": self.restarts,
+        }
+
+    def shutdown(self) -> None:
+        """워커 프로세스 종료 (앱 종료 시 호출)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            print("[CPUPool] 🛑 프로세스 워커 종료")
+
+
+# ──────────────── 📦 전역 프로세스 풀 ────────────────
+CPU_POOL = CPUBoundPool(CPU_POOL_WORKERS)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any) -> T:
+    """
+    CPU 작업을 전역 프로세스 풀에서 실행합니다.
+
+    Example:
+        text = await run_cpu_bound(_transcribe_in_worker, backend_name, model_kwargs, file_path, language)
+    """
+    return await CPU_POOL.run(func, *args)
@@ -3,87 +3,720 @@ SK AXIS AI 면접 비동기 작업 큐 관리자
 
 이 파일은 면접자별 비동기 작업을 순차적으로 처리하는 큐 시스템입니다.
 주요 기능:
-- 면접자별 독립적인 작업 큐 관리
+- 면접자별 독립적인 작업 큐 관리 (INTERVIEWEE_REGISTRY 슬롯 - 작업이 모두 끝나면 정리)
+- 고정 개수 워커 풀 + 면접자 간 라운드 로빈 (공정 분배)
 - 동시성 제어 및 순차 처리 보장
 - 비동기 작업 예외 처리 및 로깅
 
 사용 목적:
 - STT, 리라이팅, 평가 작업의 순차 처리
-- 여러 면접자의 동시 처리 지원
+- 여러 면접자의 동시 처리 지원 (전체 동시 실행 수는 QUEUE_WORKERS로 제한)
 - 작업 충돌 방지 및 안정성 보장
 
 작업 흐름:
 1. enqueue_task()로 작업 등록
-2. 큐가 비어있으면 _process_queue() 시작
-3. 큐의 모든 작업을 순차적으로 실행
-4. 예외 발생 시 로깅 후 다음 작업 계속 진행
+2. 해당 면접자가 대기/실행 중이 아니면 준비 큐(라운드 로빈 순서)에 추가
+3. 워커가 준비 큐에서 면접자를 꺼내 작업 하나를 실행
+4. 남은 작업이 있으면 면접자를 준비 큐 맨 뒤로 다시 넣음 (한 면접자가 워커를 독점하지 않음)
+5. 예외 발생 시 로깅 후 다음 작업 계속 진행
+
+영구 작업 (재시작 복구):
+- enqueue_job()은 작업 기술자(면접자 ID, 작업 종류, payload)를 작업 저장소(get_job_store, 기본 SQLite)에 먼저 기록
+- 작업 종류별 핸들러는 register_job_handler()로 등록 (클로저 대신 모듈 수준 함수)
+- 워커 시작 시 replay_pending_jobs()가 끝나지 않은 작업 중 종료된 워커의 것만 점유해 등록 순서대로 다시 실행
+  (uvicorn --workers N이 같은 SQLite 파일을 열어도 작업당 한 워커만 재실행)
+- 끝난 작업 행은 purge_finished_jobs()가 정리 (시작 시 + 작업 등록 시 QUEUE_PURGE_INTERVAL_SEC마다)
+
+우선순위 레인:
+- interactive (면접 종료 후 최종 평가 - 사람이 결과를 기다림)
+- ingest (면접 중 /stt/upload STT 파이프라인)
+- background (재채점 등 급하지 않은 작업)
+- 레인 간 가중 라운드 로빈 (QUEUE_LANE_WEIGHTS, 기본 6:3:1)
+- 기아 방지: 준비 상태로 QUEUE_STARVATION_SEC 이상 기다린 면접자가 있는 레인을 먼저 처리
+- 레인은 면접자 큐의 맨 앞 작업 기준 (같은 면접자 안에서는 등록 순서 유지)
+
+묶음 실행 (coalescing):
+- register_job_handler(kind, handler, batch_handler=...)로 묶음 핸들러를 등록한 작업 종류는
+  워커가 작업을 꺼낼 때 같은 면접자 큐에 연달아 대기 중인 같은 종류/레인의 작업을 최대 QUEUE_COALESCE_MAX개까지 함께 꺼냄
+- 묶인 작업들은 batch_handler(interviewee_id, [payload, ...]) 한 번으로 실행 (예: 밀린 STT 세그먼트 → 리라이팅 1회)
+- 묶인 작업의 핸들은 앞 작업과 같은 결과로 완료, 작업 저장소 상태도 함께 기록
+
+작업 핸들:
+- enqueue_task()/enqueue_job()은 TaskHandle을 반환 (await 하면 작업 완료까지 대기)
+- drain_interviewee_queue()로 면접자의 대기/실행 중 작업이 모두 끝날 때까지 대기 (타임아웃 지원)
+
+마감/취소/대체:
+- 작업별 마감 시간(deadline_sec): 시작 전에 지났으면 버리고, 실행 중 초과하면 중단
+- cancel_interviewee_tasks()로 면접자의 대기/실행 중 작업 취소 (면접 종료/면접자 제외 시)
+- supersede_key가 같은 새 작업이 들어오면 아직 시작 전인 이전 작업은 버림 (재업로드 등)
+- 버려진 작업의 핸들은 취소 상태, 영구 작업은 작업 저장소에 cancelled로 기록
+
+지표:
+- 면접자별 대기 작업 수, 등록 → 시작 대기 시간/실행 시간 히스토그램, 전체 실행 중 작업 수
+- 면접자 슬롯 수/누적 생성·정리 수 (메모리 누수 확인용)
+- get_queue_snapshot()으로 조회 (/admin/queues)
+
+동시성 보장:
+- 한 면접자의 작업은 동시에 하나만 실행 (등록 순서대로)
+- 200명이 동시에 면접해도 STT/LLM 호출은 최대 QUEUE_WORKERS개 파이프라인에서만 발생
 """
 
-from collections import defaultdict, deque
-from typing import Callable, Coroutine, Any, Dict
+import os
+import time
 import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Coroutine, Any, Dict, List, Optional, Set
+
+from app.services.queue_store import (
+    JobRecord, QUEUE_MAX_ATTEMPTS, QUEUE_PURGE_INTERVAL_SEC, QUEUE_RETENTION_SEC, get_job_store,
+)
+from app.services.queue_metrics import QUEUE_METRICS
+from app.services.interviewee_registry import INTERVIEWEE_REGISTRY
+
+# ──────────────── ⚙️ 스케줄러 설정 ────────────────
+QUEUE_WORKERS = int(os.getenv("QUEUE_WORKERS", "8"))  # 동시에 실행되는 파이프라인 작업 수 상한
+QUEUE_STARVATION_SEC = float(os.getenv("QUEUE_STARVATION_SEC", "30"))  # 이 시간 이상 대기하면 가중치 무시하고 우선 처리
+QUEUE_COALESCE_MAX = int(os.getenv("QUEUE_COALESCE_MAX", "8"))  # 한 번에 묶어 실행할 최대 작업 수 (1이면 묶지 않음)
+
+# 우선순위 레인 (높은 순)
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_INGEST = "ingest"
+PRIORITY_BACKGROUND = "background"
+PRIORITY_LANES = (PRIORITY_INTERACTIVE, PRIORITY_INGEST, PRIORITY_BACKGROUND)
+
+
+def _parse_lane_weights(raw: str) -> Dict[str, int]:
+    """"interactive:6,ingest:3,background:1" 형식의 레인 가중치 파싱"""
+    weights = {PRIORITY_INTERACTIVE: 6, PRIORITY_INGEST: 3, PRIORITY_BACKGROUND: 1}
+    for item in raw.split(","):
+        lane, _, weight = item.partition(":")
+        if lane.strip() in weights and weight.strip().isdigit():
+            weights[lane.strip()] = max(1, int(weight))
+    return weights
+
+
+QUEUE_LANE_WEIGHTS = _parse_lane_weights(os.getenv("QUEUE_LANE_WEIGHTS", ""))
 
 # ──────────────── 📦 전역 저장소 ────────────────
-# 인터뷰이별 큐와 실행 상태 저장소
-INTERVIEW_TASK_QUEUES: Dict[int, deque] = defaultdict(deque)      # 면접자별 작업 큐
-INTERVIEW_QUEUE_RUNNING: Dict[int, bool] = defaultdict(bool)      # 면접자별 큐 실행 상태
+# 면접자별 작업 큐와 실행 중 여부는 INTERVIEWEE_REGISTRY 슬롯에 보관 (작업이 모두 끝나면 슬롯 정리)
+
+# 작업 종류별 핸들러: handler(interviewee_id, payload)
+JobHandler = Callable[[int, Dict[str, Any]], Awaitable[None]]
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+# 작업 종류별 묶음 핸들러: batch_handler(interviewee_id, [payload, ...])
+JobBatchHandler = Callable[[int, List[Dict[str, Any]]], Awaitable[None]]
+JOB_BATCH_HANDLERS: Dict[str, JobBatchHandler] = {}
+
 
-async def enqueue_task(interviewee_id: int, coro: Callable[[], Coroutine[Any, Any, None]]):
+@dataclass
+class QueuedTask:
+    """면접자 큐에 들어가는 작업 (대기 시간 측정을 위해 등록 시각 보관)"""
+    run: Callable[[], Coroutine[Any, Any, None]]
+    kind: str
+    enqueued_at: float
+    future: asyncio.Future
+    priority: str = PRIORITY_INGEST
+    deadline: Optional[float] = None          # time.monotonic() 기준 마감 시각
+    supersede_key: Optional[str] = None
+    job_id: Optional[int] = None              # 영구 작업이면 작업 저장소 ID
+    runner: Optional[asyncio.Task] = None     # 실행 중인 작업 Task (취소용)
+    record: Optional[JobRecord] = None        # 영구 작업 기술자 (묶음 실행용)
+    coalesced: List["QueuedTask"] = field(default_factory=list)  # 이 작업과 함께 묶여 실행되는 작업
+
+
+@dataclass(eq=False)
+class TaskHandle:
+    """
+    등록된 작업의 완료 핸들
+
+    Example:
+        handle = await enqueue_task(101, process)
+        await handle              # 완료까지 대기 (작업 예외는 그대로 전달)
+        await handle.wait(5.0)    # 최대 5초 대기, 완료 여부 반환
+    """
+    interviewee_id: int
+    kind: str
+    future: asyncio.Future
+    job_id: Optional[int] = None
+    priority: str = PRIORITY_INGEST
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def __await__(self):
+        return self.future.__await__()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """timeout초까지 완료를 기다리고 완료 여부를 반환합니다 (작업 예외는 전달하지 않음)."""
+        await asyncio.wait({self.future}, timeout=timeout)
+        return self.future.done()
+
+
+def _mark_exception_retrieved(future: asyncio.Future) -> None:
+    # 아무도 await하지 않는 핸들의 예외로 "exception was never retrieved" 경고가 나지 않도록 처리
+    if not future.cancelled():
+        future.exception()
+
+
+# 아직 끝나지 않은 작업 저장소 취소 기록 (스케줄러 종료 시 모두 기다림)
+_PENDING_CANCEL_WRITES: Set[asyncio.Future] = set()
+
+
+def _record_cancelled(job_id: int, reason: str) -> None:
+    """작업 저장소에 cancelled 기록을 스레드에서 실행합니다 (실패는 로그로 남김)."""
+    future = asyncio.get_running_loop().run_in_executor(None, get_job_store().mark_cancelled, job_id, reason)
+    _PENDING_CANCEL_WRITES.add(future)
+
+    def _done(f: asyncio.Future) -> None:
+        _PENDING_CANCEL_WRITES.discard(f)
+        if not f.cancelled() and f.exception() is not None:
+            print(f"[QueueExecutor] ⚠️ 작업 취소 기록 실패 - 재시작 시 다시 실행될 수 있음: job {job_id} - {f.exception()}")
+
+    future.add_done_callback(_done)
+
+
+def _drop_task(task: QueuedTask, reason: str, error: Optional[BaseException] = None) -> None:
+    """
+    실행하지 않거나 중단한 작업을 정리합니다.
+    핸들은 취소(또는 error로 실패) 처리하고, 영구 작업이면 작업 저장소에 cancelled로 기록합니다.
+    저장소 기록은 이벤트 루프를 막지 않도록 스레드에서 실행하고 shutdown()에서 완료를 기다립니다.
+    """
+    if not task.future.done():
+        if error is not None:
+            task.future.set_exception(error)
+        else:
+            task.future.cancel()
+    QUEUE_METRICS.record_drop(reason)
+    if task.job_id is not None:
+        _record_cancelled(task.job_id, reason)
+
+
+class FairShareScheduler:
+    """
+    고정 워커 풀 기반 공정 분배 스케줄러
+
+    Note:
+        - 준비 큐에는 "대기 작업이 있고 실행 중이 아닌" 면접자 ID가 한 번씩만 들어감
+        - 준비 큐는 레인별로 나뉘고, 면접자는 맨 앞 작업의 우선순위 레인에 들어감
+        - 워커는 레인을 가중 라운드 로빈(smooth weighted round robin)으로 고른 뒤
+          면접자 단위로 작업을 하나씩 꺼내 실행 → 레인 안에서는 면접자 간 라운드 로빈
+        - 워커는 첫 작업 등록 시 실행 중인 이벤트 루프에서 지연 시작
+    """
+
+    def __init__(self, workers: int = QUEUE_WORKERS, lane_weights: Optional[Dict[str, int]] = None,
+                 starvation_sec: float = QUEUE_STARVATION_SEC):
+        self.workers = max(1, workers)
+        self.lane_weights = dict(lane_weights or QUEUE_LANE_WEIGHTS)
+        self.starvation_sec = starvation_sec
+        # 레인별 준비 큐: (면접자 ID, 준비 상태가 된 시각)
+        self._lanes: Dict[str, deque] = {lane: deque() for lane in PRIORITY_LANES}
+        self._lane_credit: Dict[str, int] = {lane: 0 for lane in PRIORITY_LANES}
+        self._ready: Optional[asyncio.Semaphore] = None  # 준비 큐 전체 항목 수
+        self._scheduled: Set[int] = set()   # 준비 큐에 있거나 실행 중인 면접자
+        self._running: Dict[int, QueuedTask] = {}  # 면접자별 실행 중인 작업
+        self._worker_tasks: List[asyncio.Task] = []
+        self._active = 0
+
+    def _ensure_started(self) -> None:
+        if self._worker_tasks:
+            return
+        self._ready = asyncio.Semaphore(0)
+        for lane in self._lanes.values():
+            lane.clear()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(n), name=f"queue-worker-{n}")
+            for n in range(self.workers)
+        ]
+        print(f"[QueueExecutor] 🚀 워커 {self.workers}개 시작")
+
+    def submit(
+        self,
+        interviewee_id: int,
+        coro: Callable[[], Coroutine[Any, Any, None]],
+        kind: str = "task",
+        deadline_sec: Optional[float] = None,
+        supersede_key: Optional[str] = None,
+        job_id: Optional[int] = None,
+        priority: str = PRIORITY_INGEST,
+        record: Optional[JobRecord] = None,
+    ) -> TaskHandle:
+        """
+        작업을 면접자 큐에 넣고, 필요하면 면접자를 준비 큐에 올립니다.
+
+        Args:
+            priority: 우선순위 레인 (PRIORITY_INTERACTIVE / PRIORITY_INGEST / PRIORITY_BACKGROUND)
+            deadline_sec: 지금부터 이 시간(초) 안에 끝나야 하는 작업 (None이면 무제한)
+            supersede_key: 같은 키로 대기 중인 이전 작업을 버림
+            job_id: 영구 작업 ID (버려질 때 작업 저장소에 기록)
+            record: 영구 작업 기술자 (묶음 핸들러가 있으면 연속 작업과 묶어 실행)
+        """
+        if priority not in self._lanes:
+            raise ValueError(f"알 수 없는 우선순위 레인: {priority}")
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_mark_exception_retrieved)
+        now = time.monotonic()
+        queue = INTERVIEWEE_REGISTRY.slot(interviewee_id).queue
+        if supersede_key is not None:
+            for old in [t for t in queue if t.supersede_key == supersede_key]:
+                queue.remove(old)
+                _drop_task(old, "superseded")
+        queue.append(QueuedTask(
+            coro, kind, now, future,
+            priority=priority,
+            deadline=None if deadline_sec is None else now + deadline_sec,
+            supersede_key=supersede_key,
+            job_id=job_id,
+            record=record,
+        ))
+        QUEUE_METRICS.record_enqueue()
+        if interviewee_id not in self._scheduled:
+            self._scheduled.add(interviewee_id)
+            self._push_ready(interviewee_id)
+        return TaskHandle(interviewee_id, kind, future, job_id, priority)
+
+    def _push_ready(self, interviewee_id: int) -> None:
+        """면접자를 맨 앞 작업의 레인 준비 큐 맨 뒤에 넣습니다."""
+        slot = INTERVIEWEE_REGISTRY.get(interviewee_id)
+        lane = slot.queue[0].priority if slot is not None and slot.queue else PRIORITY_INGEST
+        self._lanes[lane].append((interviewee_id, time.monotonic()))
+        self._ready.release()
+
+    def _pick_lane(self) -> str:
+        """
+        다음에 처리할 레인을 고릅니다.
+        1) 기아 방지: starvation_sec 이상 기다린 항목이 있으면 가장 오래 기다린 레인
+        2) 그 외에는 smooth weighted round robin (가중치 비율대로 고르게 분산)
+        """
+        candidates = [lane for lane in PRIORITY_LANES if self._lanes[lane]]
+        oldest = min(candidates, key=lambda lane: self._lanes[lane][0][1])
+        if time.monotonic() - self._lanes[oldest][0][1] >= self.starvation_sec:
+            return oldest
+
+        total = 0
+        best = candidates[0]
+        for lane in candidates:
+            self._lane_credit[lane] += self.lane_weights[lane]
+            total += self.lane_weights[lane]
+            if self._lane_credit[lane] > self._lane_credit[best]:
+                best = lane
+        self._lane_credit[best] -= total
+        return best
+
+    def cancel(self, interviewee_id: int, include_running: bool = True) -> int:
+        """면접자의 대기 작업(및 실행 중 작업)을 취소하고 취소한 수를 반환합니다."""
+        slot = INTERVIEWEE_REGISTRY.get(interviewee_id)
+        cancelled = 0
+        while slot is not None and slot.queue:
+            _drop_task(slot.queue.popleft(), "cancelled")
+            cancelled += 1
+        running = self._running.get(interviewee_id)
+        if include_running and running is not None and running.runner and not running.runner.done():
+            running.runner.cancel()
+            cancelled += 1 + len(running.coalesced)
+        return cancelled
+
+    def pending_futures(self, interviewee_id: int) -> List[asyncio.Future]:
+        """면접자의 실행 중 + 대기 중 작업 완료 future 목록"""
+        slot = INTERVIEWEE_REGISTRY.get(interviewee_id)
+        futures = [task.future for task in slot.queue] if slot is not None else []
+        running = self._running.get(interviewee_id)
+        if running is not None:
+            futures[:0] = [running.future] + [t.future for t in running.coalesced]
+        return [f for f in futures if not f.done()]
+
+    async def _worker(self, worker_no: int) -> None:
+        while True:
+            await self._ready.acquire()
+            lane = self._pick_lane()
+            interviewee_id, _ = self._lanes[lane].popleft()
+            slot = INTERVIEWEE_REGISTRY.get(interviewee_id)
+            if slot is None or not slot.queue:
+                # 준비 큐에 오른 뒤 작업이 모두 취소됨
+                self._release(interviewee_id)
+                continue
+            queue = slot.queue
+
+            task = queue.popleft()
+            started = time.monotonic()
+            # 시작 전에 마감이 지난 작업은 실행하지 않음 (아무도 결과를 읽지 않음)
+            if task.deadline is not None and started >= task.deadline:
+                _drop_task(task, "deadline")
+                self._requeue_or_release(interviewee_id)
+                continue
+
+            self._coalesce(task, queue, started)
+
+            self._running[interviewee_id] = task
+            INTERVIEWEE_REGISTRY.set_running(interviewee_id, True)
+            self._active += 1
+            QUEUE_METRICS.record_start((started - task.enqueued_at) * 1000, task.priority)
+            ok = False
+            batch = [task] + task.coalesced
+            task.runner = asyncio.create_task(task.run())
+            try:
+                # 비동기 작업 실행 (마감 시간까지)
+                timeout = None if task.deadline is None else max(task.deadline - started, 0)
+                await asyncio.wait({task.runner}, timeout=timeout)
+                if not task.runner.done():
+                    task.runner.cancel()
+                    await asyncio.wait({task.runner})
+                    print(f"[QueueExecutor] ⏰ 마감 시간 초과로 중단: interviewee {interviewee_id} ({task.kind})")
+                    for t in batch:
+                        _drop_task(t, "deadline", TimeoutError(f"{task.kind} deadline exceeded"))
+                elif task.runner.cancelled():
+                    print(f"[QueueExecutor] 🛑 실행 중 작업 취소: interviewee {interviewee_id} ({task.kind})")
+                    for t in batch:
+                        _drop_task(t, "cancelled")
+                elif task.runner.exception() is not None:
+                    # 예외 발생 시 로깅 후 다음 작업 계속 진행 (예외는 핸들로 전달)
+                    e = task.runner.exception()
+                    print(f"[QueueExecutor] ❌ Error for interviewee {interviewee_id}: {e}")
+                    for t in batch:
+                        if not t.future.done():
+                            t.future.set_exception(e)
+                else:
+                    ok = True
+                    for t in batch:
+                        if not t.future.done():
+                            t.future.set_result(None)
+            except asyncio.CancelledError:
+                # 워커 자체 종료
+                task.runner.cancel()
+                for t in batch:
+                    t.future.cancel()
+                raise
+            finally:
+                QUEUE_METRICS.record_finish(task.kind, (time.monotonic() - started) * 1000, ok)
+                self._running.pop(interviewee_id, None)
+                self._active -= 1
+                INTERVIEWEE_REGISTRY.set_running(interviewee_id, False)
+                self._requeue_or_release(interviewee_id)
+
+    def _coalesce(self, task: QueuedTask, queue: deque, now: float) -> None:
+        """
+        묶음 핸들러가 있는 영구 작업이면 큐에 연달아 대기 중인 같은 종류/레인 작업을 함께 꺼내
+        task.run을 묶음 실행으로 바꿉니다. 마감이 지난 작업은 버리고, 마감은 가장 이른 값을 따릅니다.
+        """
+        if task.record is None or task.kind not in JOB_BATCH_HANDLERS:
+            return
+        while queue and len(task.coalesced) + 1 < QUEUE_COALESCE_MAX:
+            nxt = queue[0]
+            if nxt.record is None or nxt.kind != task.kind or nxt.priority != task.priority:
+                break
+            queue.popleft()
+            if nxt.deadline is not None and now >= nxt.deadline:
+                _drop_task(nxt, "deadline")
+                continue
+            task.coalesced.append(nxt)
+            if nxt.deadline is not None:
+                task.deadline = nxt.deadline if task.deadline is None else min(task.deadline, nxt.deadline)
+        if task.coalesced:
+            task.run = _batch_job_runner([task.record] + [t.record for t in task.coalesced])
+            QUEUE_METRICS.record_coalesced(len(task.coalesced))
+            print(f"[QueueExecutor] 🧺 작업 {len(task.coalesced) + 1}개 묶음 실행: "
+                  f"interviewee {task.record.interviewee_id} ({task.kind})")
+
+    def _requeue_or_release(self, interviewee_id: int) -> None:
+        # 남은 작업이 있으면 준비 큐 맨 뒤로 (다른 면접자에게 차례 양보)
+        slot = INTERVIEWEE_REGISTRY.get(interviewee_id)
+        if slot is not None and slot.queue:
+            self._push_ready(interviewee_id)
+        else:
+            self._release(interviewee_id)
+
+    def _release(self, interviewee_id: int) -> None:
+        # 남은 작업이 없음 - 스케줄 해제 후 유휴 슬롯 정리 (면접 종료 후 최종 평가가 끝나면 여기서 사라짐)
+        self._scheduled.discard(interviewee_id)
+        INTERVIEWEE_REGISTRY.collect(interviewee_id)
+
+    def settings(self) -> Dict[str, Any]:
+        """스케줄러 설정과 현재 부하 요약"""
+        return {
+            "workers": self.workers,
+            "started": bool(self._worker_tasks),
+            "active": self._active,
+            "lane_weights": dict(self.lane_weights),
+            "starvation_sec": self.starvation_sec,
+            "ready_interviewees": {lane: len(entries) for lane, entries in self._lanes.items()},
+            "pending_tasks": sum(len(slot.queue) for _, slot in INTERVIEWEE_REGISTRY.items()),
+        }
+
+    async def shutdown(self) -> None:
+        """워커 종료 후 남은 작업 취소 기록을 마칩니다 (앱 종료 시 호출, 기록이 빠지면 취소된 작업이 재실행됨)."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        if _PENDING_CANCEL_WRITES:
+            await asyncio.gather(*list(_PENDING_CANCEL_WRITES), return_exceptions=True)
+
+
+# ──────────────── 📦 전역 스케줄러 ────────────────
+QUEUE_SCHEDULER = FairShareScheduler(QUEUE_WORKERS)
+
+
+async def enqueue_task(
+    interviewee_id: int,
+    coro: Callable[[], Coroutine[Any, Any, None]],
+    priority: str = PRIORITY_INGEST,
+    kind: str = "task",
+) -> TaskHandle:
     """
     면접자별 작업 큐에 비동기 작업을 추가합니다.
-    
+
     Args:
         interviewee_id (int): 면접자 고유 ID
         coro (Callable): 실행할 코루틴 함수
-        
+        priority (str): 우선순위 레인 (기본: PRIORITY_INGEST)
+        kind (str): 지표 집계용 작업 종류
+
+    Returns:
+        TaskHandle: 작업 완료 핸들 (await 하지 않아도 됨)
+
     Note:
         - 면접자별 독립적인 큐 관리
-        - 큐가 실행 중이 아니면 자동으로 처리 시작
+        - 전역 워커 풀(QUEUE_WORKERS)이 면접자 간 라운드 로빈으로 처리
         - 동일 면접자의 작업들은 순차적으로 처리됨
-        
+
     Example:
         await enqueue_task(101, lambda: stt_processing(state))
-        await enqueue_task(101, lambda: evaluation_processing(state))
+        await enqueue_task(101, lambda: evaluation_processing(state), priority=PRIORITY_INTERACTIVE)
+    """
+    return QUEUE_SCHEDULER.submit(interviewee_id, coro, kind, priority=priority)
+
+
+async def cancel_interviewee_tasks(interviewee_id: int, include_running: bool = True) -> int:
     """
-    # 면접자별 큐에 작업 추가
-    INTERVIEW_TASK_QUEUES[interviewee_id].append(coro)
+    면접자의 대기 중(및 실행 중) 작업을 취소합니다.
 
-    # 해당 면접자의 큐가 실행 중이 아니면 처리 시작
-    if not INTERVIEW_QUEUE_RUNNING[interviewee_id]:
-        INTERVIEW_QUEUE_RUNNING[interviewee_id] = True
-        # 백그라운드에서 큐 처리 시작 (await 하지 않음)
-        asyncio.create_task(_process_queue(interviewee_id))
+    Args:
+        interviewee_id (int): 면접자 고유 ID
+        include_running (bool): 실행 중인 작업도 중단할지 여부
+
+    Returns:
+        int: 취소한 작업 수
+    """
+    cancelled = QUEUE_SCHEDULER.cancel(interviewee_id, include_running)
+    if cancelled:
+        print(f"[QueueExecutor] 🛑 작업 {cancelled}개 취소: interviewee {interviewee_id}")
+    return cancelled
 
-async def _process_queue(interviewee_id: int):
+
+async def drain_interviewee_queue(interviewee_id: int, timeout: Optional[float] = None) -> bool:
     """
-    특정 면접자의 작업 큐를 순차적으로 처리합니다.
-    
+    면접자의 대기/실행 중 작업이 모두 끝날 때까지 기다립니다.
+
     Args:
-        interviewee_id (int): 처리할 면접자 ID
-        
+        interviewee_id (int): 면접자 고유 ID
+        timeout (float): 최대 대기 시간(초), None이면 무제한
+
+    Returns:
+        bool: 타임아웃 전에 큐가 비었으면 True
+
     Note:
-        - 큐가 비워질 때까지 모든 작업을 순차 실행
-        - 예외 발생 시 해당 작업만 실패하고 다음 작업 계속 진행
-        - 모든 작업 완료 후 실행 상태를 False로 변경
-        
-    처리 과정:
-    1. 큐에서 작업 하나씩 꺼내기
-    2. 작업 실행 (await)
-    3. 예외 발생 시 로깅 후 계속 진행
-    4. 큐가 비워지면 실행 상태 해제
-    """
-    # 큐가 비워질 때까지 반복 처리
-    while INTERVIEW_TASK_QUEUES[interviewee_id]:
-        # 큐에서 다음 작업 가져오기
-        task = INTERVIEW_TASK_QUEUES[interviewee_id].popleft()
-        
+        - 대기 중에 새로 등록된 작업도 함께 기다림
+        - 작업 실패는 큐 처리와 마찬가지로 무시 (완료로 간주)
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        futures = QUEUE_SCHEDULER.pending_futures(interviewee_id)
+        if not futures:
+            return True
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return False
+        await asyncio.wait(futures, timeout=remaining)
+
+
+def get_queue_settings() -> Dict[str, Any]:
+    """스케줄러 설정 및 부하 요약 조회"""
+    return QUEUE_SCHEDULER.settings()
+
+
+def get_queue_snapshot() -> Dict[str, Any]:
+    """
+    큐 상태 스냅샷 (관리자 조회용)
+
+    Returns:
+        Dict[str, Any]: {"scheduler": 설정/부하, "metrics": 지연 히스토그램/카운터,
+                         "interviewees": {id: {"depth", "running", "oldest_wait_sec"}},
+                         "registry": 면접자 슬롯 수/누적 생성·정리 수}
+    """
+    now = time.monotonic()
+    interviewees = {}
+    for interviewee_id, slot in INTERVIEWEE_REGISTRY.items():
+        queue, running = slot.queue, slot.running
+        if not queue and not running:
+            continue
+        interviewees[interviewee_id] = {
+            "depth": len(queue),
+            "running": running,
+            "head_priority": queue[0].priority if queue else None,
+            "oldest_wait_sec": round(now - queue[0].enqueued_at, 3) if queue else 0.0,
+        }
+    return {
+        "scheduler": QUEUE_SCHEDULER.settings(),
+        "metrics": QUEUE_METRICS.to_dict(),
+        "interviewees": interviewees,
+        "registry": INTERVIEWEE_REGISTRY.stats(),
+    }
+
+
+# ──────────────── 💾 영구 작업 (재시작 복구) ────────────────
+def register_job_handler(kind: str, handler: JobHandler,
+                         batch_handler: Optional[JobBatchHandler] = None) -> None:
+    """
+    작업 종류별 핸들러를 등록합니다.
+
+    Args:
+        kind (str): 작업 종류 (예: "stt_pipeline")
+        handler (JobHandler): async handler(interviewee_id, payload)
+        batch_handler (JobBatchHandler): async batch_handler(interviewee_id, [payload, ...])
+            - 있으면 연달아 대기 중인 같은 종류 작업을 묶어 한 번에 실행
+    """
+    JOB_HANDLERS[kind] = handler
+    if batch_handler is not None:
+        JOB_BATCH_HANDLERS[kind] = batch_handler
+    else:
+        JOB_BATCH_HANDLERS.pop(kind, None)
+
+
+def _job_runner(record: JobRecord) -> Callable[[], Coroutine[Any, Any, None]]:
+    """저장된 작업을 실행하고 결과 상태를 기록하는 큐 작업을 만듭니다."""
+    async def run() -> None:
+        handler = JOB_HANDLERS.get(record.kind)
+        if handler is None:
+            print(f"[QueueExecutor] ❌ 등록되지 않은 작업 종류: {record.kind} (job {record.job_id})")
+            await asyncio.to_thread(get_job_store().mark_failed, record.job_id, "unknown job kind")
+            return
+
+        await asyncio.to_thread(get_job_store().mark_running, record.job_id)
+        try:
+            await handler(record.interviewee_id, record.payload)
+        except asyncio.CancelledError:
+            raise  # 취소/마감 초과는 _drop_task에서 기록
+        except Exception as e:
+            await asyncio.to_thread(get_job_store().mark_failed, record.job_id, str(e))
+            raise
+        await asyncio.to_thread(get_job_store().mark_done, record.job_id)
+    return run
+
+
+def _mark_jobs(mark: Callable[..., None], job_ids: List[int], *args: Any) -> None:
+    for job_id in job_ids:
+        mark(job_id, *args)
+
+
+def _batch_job_runner(records: List[JobRecord]) -> Callable[[], Coroutine[Any, Any, None]]:
+    """묶인 작업들을 묶음 핸들러 한 번으로 실행하고 각 작업의 상태를 기록하는 큐 작업을 만듭니다."""
+    async def run() -> None:
+        batch_handler = JOB_BATCH_HANDLERS[records[0].kind]
+        job_ids = [record.job_id for record in records]
+        await asyncio.to_thread(_mark_jobs, get_job_store().mark_running, job_ids)
         try:
-            # 비동기 작업 실행
-            await task()
+            await batch_handler(records[0].interviewee_id, [record.payload for record in records])
+        except asyncio.CancelledError:
+            raise  # 취소/마감 초과는 _drop_task에서 기록
         except Exception as e:
-            # 예외 발생 시 로깅 후 다음 작업 계속 진행
-            print(f"[QueueExecutor] ❌ Error for interviewee {interviewee_id}: {e}")
-            # 개별 작업 실패가 전체 큐 처리를 중단시키지 않음
-    
-    # 모든 작업 완료 후 실행 상태 해제
-    INTERVIEW_QUEUE_RUNNING[interviewee_id] = False
+            await asyncio.to_thread(_mark_jobs, get_job_store().mark_failed, job_ids, str(e))
+            raise
+        await asyncio.to_thread(_mark_jobs, get_job_store().mark_done, job_ids)
+    return run
+
+
+async def enqueue_job(
+    interviewee_id: int,
+    kind: str,
+    payload: Dict[str, Any],
+    deadline_sec: Optional[float] = None,
+    supersede_key: Optional[str] = None,
+    priority: str = PRIORITY_INGEST,
+) -> TaskHandle:
+    """
+    작업을 영구 저장소에 기록한 뒤 면접자 큐에 등록합니다.
+
+    Args:
+        interviewee_id (int): 면접자 고유 ID
+        kind (str): register_job_handler로 등록된 작업 종류
+        payload (Dict): JSON 직렬화 가능한 작업 인자
+        deadline_sec (float): 마감 시간(초) - 재시작 후에도 같은 시각 기준으로 적용
+        supersede_key (str): 같은 키로 대기 중인 이전 작업을 대체
+        priority (str): 우선순위 레인
+
+    Returns:
+        TaskHandle: 작업 완료 핸들 (job_id 포함)
+    """
+    await purge_finished_jobs()
+    deadline_at = None if deadline_sec is None else time.time() + deadline_sec
+    record = await asyncio.to_thread(get_job_store().add, interviewee_id, kind, payload, deadline_at,
+                                    supersede_key, priority)
+    return QUEUE_SCHEDULER.submit(
+        interviewee_id, _job_runner(record), kind,
+        deadline_sec=deadline_sec, supersede_key=supersede_key, job_id=record.job_id, priority=priority,
+        record=record,
+    )
+
+
+_last_purge_at: Optional[float] = None
+
+
+async def purge_finished_jobs(force: bool = False) -> int:
+    """
+    보관 시간(QUEUE_RETENTION_SEC)이 지난 끝난 작업을 작업 저장소에서 삭제합니다.
+
+    Args:
+        force (bool): 정리 주기와 무관하게 바로 실행 (lifespan 시작 시)
+
+    Returns:
+        int: 삭제한 작업 수 (주기가 안 되어 건너뛰면 0)
+    """
+    global _last_purge_at
+    now = time.monotonic()
+    if not force and _last_purge_at is not None and now - _last_purge_at < QUEUE_PURGE_INTERVAL_SEC:
+        return 0
+    _last_purge_at = now
+    purged = await asyncio.to_thread(get_job_store().purge_finished, QUEUE_RETENTION_SEC)
+    if purged:
+        print(f"[QueueExecutor] 🧹 끝난 작업 {purged}개 정리 (보관 {QUEUE_RETENTION_SEC:.0f}s 경과)")
+    return purged
+
+
+async def replay_pending_jobs() -> int:
+    """
+    재시작 전에 끝나지 않은 작업을 다시 큐에 넣습니다 (lifespan 시작 시 호출).
+
+    Returns:
+        int: 다시 등록한 작업 수
+
+    Note:
+        - 실행 도중 중단된 작업(running)도 다시 실행
+        - 소유 워커가 종료된 작업만 점유해 실행 (살아 있는 다른 워커의 작업은 그 워커가 처리)
+        - QUEUE_MAX_ATTEMPTS번 시도한 작업은 실패 처리 (재시작 반복 방지)
+        - 등록 시의 우선순위 레인 유지 (레인 기록 전 행은 ingest)
+    """
+    records = await asyncio.to_thread(get_job_store().claim_unfinished)
+    replayed = 0
+    for record in records:
+        if record.attempts >= QUEUE_MAX_ATTEMPTS:
+            print(f"[QueueExecutor] ⚠️ 최대 시도 횟수 초과 - 실패 처리: job {record.job_id}")
+            await asyncio.to_thread(get_job_store().mark_failed, record.job_id, "max attempts exceeded")
+            continue
+        deadline_sec = None
+        if record.deadline_at is not None:
+            deadline_sec = record.deadline_at - time.time()
+            if deadline_sec <= 0:
+                print(f"[QueueExecutor] ⏰ 재시작 중 마감 시간 경과 - 취소 처리: job {record.job_id}")
+                await asyncio.to_thread(get_job_store().mark_cancelled, record.job_id, "deadline")
+                continue
+        QUEUE_SCHEDULER.submit(
+            record.interviewee_id, _job_runner(record), record.kind,
+            deadline_sec=deadline_sec, supersede_key=record.supersede_key, job_id=record.job_id,
+            priority=record.priority or PRIORITY_INGEST, record=record,
+        )
+        replayed += 1
+    if replayed:
+        print(f"[QueueExecutor] 🔁 미완료 작업 {replayed}개 재실행")
+    return replayed
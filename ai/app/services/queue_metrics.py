@@ -0,0 +1,124 @@
+"""
+SK AXIS AI 면접 작업 큐 지표
+
+이 파일은 queue_executor의 대기/실행 시간과 처리량을 집계하는 모듈입니다.
+주요 기능:
+- 등록 → 실행 시작 대기 시간 히스토그램 (전체 + 우선순위 레인별)
+- 실행 시간 히스토그램 (작업 종류별)
+- 전체 실행 중 작업 수, 완료/실패 카운터
+- 실행하지 않고 버린 작업 수 (사유별: 마감 초과/취소/대체)
+- 앞 작업과 묶여 함께 실행된 작업 수
+
+사용 목적:
+- 워커 수(QUEUE_WORKERS) 산정 근거
+- 면접 종료 요청 전에 쌓인 백로그 확인 (/admin/queues)
+"""
+
+import bisect
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List
+
+# 히스토그램 버킷 상한 (ms) - 마지막 버킷은 그 이상 전부
+LATENCY_BUCKETS_MS: List[float] = [10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000]
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램"""
+
+    def __init__(self, buckets_ms: List[float] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = list(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets_ms, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def percentile(self, q: float) -> float:
+        """버킷 상한 기준 근사 백분위수 (ms)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for upper, n in zip(self.buckets_ms + [self.max_ms], self.counts):
+            seen += n
+            if seen >= target:
+                return min(upper, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{int(b)}" for b in self.buckets_ms] + ["inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class QueueMetrics:
+    """작업 큐 전역 지표 (작업 종류별 히스토그램 + 카운터)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.wait = LatencyHistogram()
+        self.wait_by_lane: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.run: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.in_flight = 0
+        self.enqueued = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped: Dict[str, int] = defaultdict(int)
+        self.coalesced = 0
+
+    def record_enqueue(self) -> None:
+        with self._lock:
+            self.enqueued += 1
+
+    def record_start(self, wait_ms: float, lane: str = "default") -> None:
+        with self._lock:
+            self.wait.observe(wait_ms)
+            self.wait_by_lane[lane].observe(wait_ms)
+            self.in_flight += 1
+
+    def record_finish(self, kind: str, run_ms: float, ok: bool) -> None:
+        with self._lock:
+            self.run[kind].observe(run_ms)
+            self.in_flight -= 1
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def record_drop(self, reason: str) -> None:
+        with self._lock:
+            self.dropped[reason] += 1
+
+    def record_coalesced(self, count: int) -> None:
+        with self._lock:
+            self.coalesced += count
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "enqueued": self.enqueued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "dropped": dict(self.dropped),
+                "coalesced": self.coalesced,
+                "wait": self.wait.to_dict(),
+                "wait_by_lane": {lane: hist.to_dict() for lane, hist in self.wait_by_lane.items()},
+                "run": {kind: hist.to_dict() for kind, hist in self.run.items()},
+            }
+
+
+# ──────────────── 📦 전역 지표 ────────────────
+QUEUE_METRICS = QueueMetrics()
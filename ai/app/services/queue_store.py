@@ -0,0 +1,314 @@
+"""
+SK AXIS AI 면접 작업 큐 영구 저장소
+
+이 파일은 면접자별 파이프라인 작업을 디스크에 기록해 두는 저장소입니다.
+배포/장애로 워커가 재시작되어도 끝나지 않은 작업을 다시 실행할 수 있게 합니다.
+주요 기능:
+- 직렬화 가능한 작업 기술자(면접자 ID, 작업 종류, payload) 저장
+- 작업 상태 추적 (pending → running → done / failed / cancelled)
+- 작업 마감 시각(deadline_at)과 대체 키(supersede_key) 보관 (재시작 후에도 유지)
+- 시작 시 미완료 작업 점유 후 조회 (등록 순서 유지, claim_unfinished)
+- 끝난 작업 정리 (QUEUE_RETENTION_SEC보다 오래된 done/failed/cancelled 행 삭제, 시작 시 + QUEUE_PURGE_INTERVAL_SEC마다)
+
+백엔드:
+- sqlite (기본): 단일 파일 DB, WAL 모드 (QUEUE_DB_PATH, 기본 AI_DATA_DIR/queue/jobs.sqlite3)
+- memory: 프로세스 메모리 (재시작 시 소실, 테스트/로컬용)
+
+작업 소유자 (uvicorn --workers N):
+- 작업 행마다 등록한 워커 프로세스 토큰(owner = "호스트:pid:프로세스 시작 시각")을 기록
+- claim_unfinished()는 소유자가 없거나 이미 종료된 프로세스인 행만 한 트랜잭션(BEGIN IMMEDIATE)으로
+  자기 토큰으로 바꾼 뒤 반환 → 같은 DB를 여는 워커가 여러 개여도 중단된 작업은 한 워커만 재실행
+- 살아 있는 다른 워커의 작업은 건드리지 않음
+- SQLite 파일은 한 호스트 안에서만 공유 (다른 호스트 토큰은 이전 컨테이너의 것으로 보고 점유)
+  → 여러 호스트/레플리카는 QUEUE_SHARED_BACKEND=redis 사용
+
+주의사항:
+- 저장소는 첫 사용 시 생성 (get_job_store) - 모듈 임포트만으로 DB 파일을 만들지 않음
+- payload에는 클로저가 아닌 JSON 직렬화 가능한 값만 저장 (예: {"audio_path": "..."})
+- 호출은 짧은 단일 쿼리이지만 디스크 I/O이므로 이벤트 루프에서는 asyncio.to_thread로 호출
+"""
+
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.constants.data_paths import data_path
+
+# ──────────────── ⚙️ 저장소 설정 ────────────────
+QUEUE_BACKEND = os.getenv("QUEUE_BACKEND", "sqlite")                   # "sqlite" | "memory"
+QUEUE_DB_PATH = os.getenv("QUEUE_DB_PATH", data_path("queue", "jobs.sqlite3"))  # SQLite 파일 경로
+QUEUE_MAX_ATTEMPTS = int(os.getenv("QUEUE_MAX_ATTEMPTS", "3"))         # 재시작 재실행 포함 최대 시도 횟수
+QUEUE_RETENTION_SEC = float(os.getenv("QUEUE_RETENTION_SEC", "86400"))      # 끝난 작업(done/failed/cancelled) 보관 시간
+QUEUE_PURGE_INTERVAL_SEC = float(os.getenv("QUEUE_PURGE_INTERVAL_SEC", "3600"))  # 끝난 작업 정리 주기
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"  # 취소/마감 초과/대체됨
+
+
+def _process_start(pid: int) -> str:
+    """프로세스 시작 시각 (/proc/<pid>/stat 22번째 필드, 없으면 "") - pid 재사용 구분용"""
+    try:
+        with open(f"/proc/{pid}/stat", "r") as f:
+            return f.read().rsplit(")", 1)[1].split()[19]
+    except (OSError, IndexError):
+        return ""
+
+
+def process_owner_token(pid: Optional[int] = None) -> str:
+    """작업 소유자 토큰 "호스트:pid:시작 시각" (기본: 현재 프로세스)"""
+    pid = os.getpid() if pid is None else pid
+    return f"{socket.gethostname()}:{pid}:{_process_start(pid)}"
+
+
+def owner_alive(owner: Optional[str]) -> bool:
+    """토큰의 프로세스가 이 호스트에서 아직 실행 중인지 확인합니다."""
+    if not owner:
+        return False
+    host, _, rest = owner.partition(":")
+    pid, _, started = rest.partition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # 다른 사용자 프로세스 - 존재함
+    # pid가 재사용된 경우 시작 시각이 다름
+    return not started or _process_start(int(pid)) in ("", started)
+
+
+@dataclass
+class JobRecord:
+    """저장된 작업 하나"""
+    job_id: int
+    interviewee_id: int
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    status: str = JOB_PENDING
+    attempts: int = 0
+    created_at: float = 0.0
+    deadline_at: Optional[float] = None    # 벽시계 기준 마감 시각 (epoch 초)
+    supersede_key: Optional[str] = None    # 같은 키의 이전 대기 작업을 대체
+    priority: Optional[str] = None         # 우선순위 레인 (None이면 큐 기본 레인)
+
+
+class MemoryJobStore:
+    """프로세스 메모리 작업 저장소 (재시작 시 소실)"""
+
+    backend = "memory"
+
+    def __init__(self):
+        self._jobs: Dict[int, JobRecord] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def add(self, interviewee_id: int, kind: str, payload: Dict[str, Any],
+            deadline_at: Optional[float] = None, supersede_key: Optional[str] = None,
+            priority: Optional[str] = None) -> JobRecord:
+        with self._lock:
+            record = JobRecord(self._next_id, interviewee_id, kind, dict(payload), created_at=time.time(),
+                               deadline_at=deadline_at, supersede_key=supersede_key, priority=priority)
+            self._jobs[record.job_id] = record
+            self._next_id += 1
+            return record
+
+    def mark_running(self, job_id: int) -> None:
+        with self._lock:
+            record = self._jobs.get(job_id)
+            if record:
+                record.status = JOB_RUNNING
+                record.attempts += 1
+
+    def mark_done(self, job_id: int) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def mark_failed(self, job_id: int, error: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def mark_cancelled(self, job_id: int, reason: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def unfinished(self) -> List[JobRecord]:
+        with self._lock:
+            return [r for r in sorted(self._jobs.values(), key=lambda r: r.job_id)
+                    if r.status in (JOB_PENDING, JOB_RUNNING)]
+
+    def claim_unfinished(self) -> List[JobRecord]:
+        # 프로세스 메모리 저장소는 다른 워커와 공유되지 않음
+        return self.unfinished()
+
+    def purge_finished(self, older_than_sec: float = 0) -> int:
+        return 0
+
+
+# JobRecord 필드 순서와 같은 SELECT 컬럼 목록
+_RECORD_COLUMNS = "id, interviewee_id, kind, payload, status, attempts, created_at, deadline_at, supersede_key, priority"
+
+
+def _record(row: tuple) -> JobRecord:
+    return JobRecord(row[0], row[1], row[2], json.loads(row[3]), *row[4:10])
+
+
+class SQLiteJobStore:
+    """
+    SQLite 작업 저장소
+
+    Note:
+        - WAL + synchronous=NORMAL: 작업 등록 1건당 fsync 부담 최소화
+        - 연결 하나를 스레드 간 공유하고 Lock으로 직렬화
+        - owner: 이 저장소로 등록/점유한 작업에 기록하는 워커 토큰 (기본: 현재 프로세스)
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, db_path: str = QUEUE_DB_PATH, owner: Optional[str] = None):
+        self.db_path = db_path
+        self.owner = owner or process_owner_token()
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                interviewee_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, id)")
+        # 이전 버전 DB 호환: 나중에 추가된 컬럼 보충
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for name, ddl in (("deadline_at", "REAL"), ("supersede_key", "TEXT"), ("owner", "TEXT"), ("priority", "TEXT")):
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {ddl}")
+
+    def add(self, interviewee_id: int, kind: str, payload: Dict[str, Any],
+            deadline_at: Optional[float] = None, supersede_key: Optional[str] = None,
+            priority: Optional[str] = None) -> JobRecord:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (interviewee_id, kind, payload, status, created_at, updated_at, deadline_at, "
+                "supersede_key, owner, priority) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (interviewee_id, kind, json.dumps(payload, ensure_ascii=False), JOB_PENDING, now, now,
+                 deadline_at, supersede_key, self.owner, priority),
+            )
+            return JobRecord(cursor.lastrowid, interviewee_id, kind, dict(payload), created_at=now,
+                             deadline_at=deadline_at, supersede_key=supersede_key, priority=priority)
+
+    def _set_status(self, job_id: int, status: str, error: Optional[str] = None, attempt: bool = False) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, attempts = attempts + ?, updated_at = ? WHERE id = ?",
+                (status, error, 1 if attempt else 0, time.time(), job_id),
+            )
+
+    def mark_running(self, job_id: int) -> None:
+        self._set_status(job_id, JOB_RUNNING, attempt=True)
+
+    def mark_done(self, job_id: int) -> None:
+        self._set_status(job_id, JOB_DONE)
+
+    def mark_failed(self, job_id: int, error: str) -> None:
+        self._set_status(job_id, JOB_FAILED, error=error[:500])
+
+    def mark_cancelled(self, job_id: int, reason: str) -> None:
+        self._set_status(job_id, JOB_CANCELLED, error=reason[:500])
+
+    def unfinished(self) -> List[JobRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_RECORD_COLUMNS} FROM jobs WHERE status IN (?, ?) ORDER BY id",
+                (JOB_PENDING, JOB_RUNNING),
+            ).fetchall()
+        return [_record(row) for row in rows]
+
+    def claim_unfinished(self) -> List[JobRecord]:
+        """
+        소유자가 없거나 종료된 미완료 작업을 이 워커 소유로 바꾸고 반환합니다 (재시작 재실행용).
+
+        Note:
+            - BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡으므로 동시에 시작한 워커끼리 같은 행을 점유하지 않음
+            - 이미 이 워커 소유인 행도 포함
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    f"SELECT {_RECORD_COLUMNS}, owner FROM jobs WHERE status IN (?, ?) ORDER BY id",
+                    (JOB_PENDING, JOB_RUNNING),
+                ).fetchall()
+                claimed = [row for row in rows if row[-1] == self.owner or not owner_alive(row[-1])]
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE jobs SET owner = ?, updated_at = ? WHERE id = ?",
+                    [(self.owner, now, row[0]) for row in claimed],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [_record(row) for row in claimed]
+
+    def purge_finished(self, older_than_sec: float = 0) -> int:
+        """완료/실패/취소 작업 중 older_than_sec보다 오래된 것을 삭제하고 삭제 수를 반환합니다."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?, ?) AND updated_at < ?",
+                (JOB_DONE, JOB_FAILED, JOB_CANCELLED, time.time() - older_than_sec),
+            )
+            return cursor.rowcount
+
+
+def create_job_store(backend: Optional[str] = None):
+    """QUEUE_BACKEND 설정에 맞는 작업 저장소를 생성합니다."""
+    backend = backend or QUEUE_BACKEND
+    if backend == "memory":
+        return MemoryJobStore()
+    if backend == "sqlite":
+        return SQLiteJobStore(QUEUE_DB_PATH)
+    raise ValueError(f"지원하지 않는 QUEUE_BACKEND: {backend}")
+
+
+# ──────────────── 📦 전역 작업 저장소 (지연 생성) ────────────────
+_JOB_STORE = None
+_JOB_STORE_LOCK = threading.Lock()
+
+
+def get_job_store():
+    """전역 작업 저장소를 반환합니다 (첫 호출 시 QUEUE_BACKEND로 생성)."""
+    global _JOB_STORE
+    if _JOB_STORE is None:
+        with _JOB_STORE_LOCK:
+            if _JOB_STORE is None:
+                _JOB_STORE = create_job_store()
+    return _JOB_STORE
+
+
+def set_job_store(store) -> None:
+    """전역 작업 저장소를 교체합니다 (테스트에서 MemoryJobStore 주입 등)."""
+    global _JOB_STORE
+    with _JOB_STORE_LOCK:
+        _JOB_STORE = store
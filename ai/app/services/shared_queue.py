@@ -0,0 +1,308 @@
+"""
+SK AXIS AI 면접 프로세스 간 공유 작업 큐
+
+이 파일은 uvicorn --workers N / 여러 API 레플리카 배포에서 면접자별 작업 순서를
+보장하기 위한 Redis 기반 공유 큐입니다.
+주요 기능:
+- 면접자별 작업 리스트 (Redis LIST, 등록 순서 = 실행 순서)
+- 리스(lease) 기반 면접자 점유: SET NX PX로 한 워커 프로세스만 해당 면접자 작업 실행
+- 실행 중 리스 갱신, 프로세스가 죽으면 리스 만료 후 다른 워커가 이어서 처리
+- 완료 후 제거(ack): 실행 도중 죽은 작업은 다음 점유자가 다시 실행 (at-least-once)
+- 점유한 작업은 프로세스 내 스케줄러(QUEUE_SCHEDULER)로 실행 → 워커 수 상한/레인/지표 그대로 적용
+
+Redis 키 구조 (QUEUE_SHARED_PREFIX 기준):
+- {prefix}:jobs:{interviewee_id}  작업 기술자 JSON 리스트
+- {prefix}:ready                  대기 작업이 있는 면접자 ID 집합
+- {prefix}:lease:{interviewee_id} 점유 중인 워커 토큰 (PX 만료)
+
+백엔드 (QUEUE_SHARED_BACKEND):
+- "" (기본): 공유 큐 사용 안 함, 프로세스 내 영구 큐(enqueue_job) 사용
+- redis: REDIS_URL의 Redis (다중 워커/노드)
+- local: LocalRedis (단일 프로세스 개발/테스트)
+
+주의사항:
+- 리스 갱신/해제는 GET 비교 후 PEXPIRE/DEL (리스가 만료되는 순간과 겹치는 아주 짧은 경쟁 구간 존재,
+  리스 시간을 작업 시간보다 충분히 길게 두고 QUEUE_LEASE_MS/3마다 갱신)
+- 다른 프로세스에서 실행 중인 작업은 중단할 수 없음 (cancel은 대기 작업만 제거)
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import asyncio
+from typing import Any, Dict, Optional
+
+from app.services.local_redis import create_redis_client
+from app.services.queue_metrics import QUEUE_METRICS
+from app.services.queue_executor import (
+    JOB_HANDLERS,
+    PRIORITY_INGEST,
+    QUEUE_SCHEDULER,
+    QUEUE_WORKERS,
+    FairShareScheduler,
+    cancel_interviewee_tasks,
+    drain_interviewee_queue,
+    enqueue_job,
+)
+
+# ──────────────── ⚙️ 공유 큐 설정 ────────────────
+QUEUE_SHARED_BACKEND = os.getenv("QUEUE_SHARED_BACKEND", "")                      # "" | "redis" | "local"
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+QUEUE_SHARED_PREFIX = os.getenv("QUEUE_SHARED_PREFIX", "skaxis:queue")
+QUEUE_LEASE_MS = int(os.getenv("QUEUE_LEASE_MS", "30000"))                        # 면접자 점유 리스 시간
+QUEUE_SHARED_POLL_SEC = float(os.getenv("QUEUE_SHARED_POLL_SEC", "0.2"))          # 대기 면접자 조회 주기
+QUEUE_SHARED_MAX_CLAIMS = int(os.getenv("QUEUE_SHARED_MAX_CLAIMS", str(QUEUE_WORKERS)))  # 프로세스당 동시 점유 면접자 수
+
+
+def _text(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+class SharedJobQueue:
+    """
+    Redis 공유 큐 + 리스 기반 디스패처
+
+    Note:
+        - push()는 어느 프로세스에서나 호출 가능 (업로드를 받은 워커)
+        - start()한 프로세스마다 디스패처가 대기 면접자를 점유해 순서대로 실행
+        - 한 면접자는 리스를 가진 프로세스 하나에서만, 한 번에 작업 하나씩 실행
+    """
+
+    def __init__(
+        self,
+        client,
+        prefix: str = QUEUE_SHARED_PREFIX,
+        lease_ms: int = QUEUE_LEASE_MS,
+        poll_sec: float = QUEUE_SHARED_POLL_SEC,
+        max_claims: int = QUEUE_SHARED_MAX_CLAIMS,
+        scheduler: FairShareScheduler = QUEUE_SCHEDULER,
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.lease_ms = lease_ms
+        self.poll_sec = poll_sec
+        self.max_claims = max(1, max_claims)
+        self.scheduler = scheduler
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._claims: Dict[int, asyncio.Task] = {}
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    # ─── 키 ───
+    def _jobs_key(self, interviewee_id: int) -> str:
+        return f"{self.prefix}:jobs:{interviewee_id}"
+
+    def _lease_key(self, interviewee_id: int) -> str:
+        return f"{self.prefix}:lease:{interviewee_id}"
+
+    @property
+    def _ready_key(self) -> str:
+        return f"{self.prefix}:ready"
+
+    # ─── 등록/취소/대기 ───
+    async def push(
+        self,
+        interviewee_id: int,
+        kind: str,
+        payload: Dict[str, Any],
+        deadline_sec: Optional[float] = None,
+        supersede_key: Optional[str] = None,
+        priority: str = PRIORITY_INGEST,
+    ) -> str:
+        """
+        작업 기술자를 면접자 리스트 끝에 추가하고 작업 ID를 반환합니다.
+
+        Note:
+            - supersede_key가 같은 대기 작업은 제거 (맨 앞 작업은 실행 중일 수 있으므로 제외)
+        """
+        key = self._jobs_key(interviewee_id)
+        if supersede_key is not None:
+            for raw in await self.client.lrange(key, 1, -1):
+                if json.loads(raw).get("supersede_key") == supersede_key:
+                    if await self.client.lrem(key, 1, raw):
+                        QUEUE_METRICS.record_drop("superseded")
+
+        job = {
+            "id": uuid.uuid4().hex,
+            "kind": kind,
+            "payload": payload,
+            "priority": priority,
+            "created_at": time.time(),
+            "deadline_at": None if deadline_sec is None else time.time() + deadline_sec,
+            "supersede_key": supersede_key,
+        }
+        await self.client.rpush(key, json.dumps(job, ensure_ascii=False))
+        await self.client.sadd(self._ready_key, interviewee_id)
+        return job["id"]
+
+    async def cancel(self, interviewee_id: int) -> int:
+        """면접자의 대기 작업을 모두 제거하고 제거한 수를 반환합니다 (다른 프로세스의 실행 중 작업은 제외)."""
+        key = self._jobs_key(interviewee_id)
+        pending = await self.client.llen(key)
+        await self.client.delete(key)
+        await self.client.srem(self._ready_key, interviewee_id)
+        for _ in range(pending):
+            QUEUE_METRICS.record_drop("cancelled")
+        return pending
+
+    async def drain(self, interviewee_id: int, timeout: Optional[float] = None) -> bool:
+        """면접자의 공유 대기 작업이 모두 끝날 때까지(리스트가 비고 점유가 풀릴 때까지) 기다립니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if not await self.client.llen(self._jobs_key(interviewee_id)) \
+                    and not await self.client.exists(self._lease_key(interviewee_id)):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.poll_sec)
+
+    # ─── 디스패처 ───
+    def start(self) -> None:
+        """현재 이벤트 루프에서 디스패처를 시작합니다 (lifespan 시작 시 호출)."""
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch_loop(), name="shared-queue-dispatcher")
+            print(f"[SharedQueue] 🚀 디스패처 시작: {self.token} (최대 점유 {self.max_claims}명)")
+
+    async def stop(self) -> None:
+        """디스패처와 점유 중인 면접자 처리를 중단하고 리스를 반납합니다."""
+        tasks = [t for t in [self._dispatcher, *self._claims.values()] if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+        self._claims.clear()
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            try:
+                for raw in await self.client.smembers(self._ready_key):
+                    interviewee_id = int(_text(raw))
+                    if interviewee_id in self._claims or len(self._claims) >= self.max_claims:
+                        continue
+                    if await self.client.set(self._lease_key(interviewee_id), self.token, nx=True, px=self.lease_ms):
+                        task = asyncio.create_task(self._process(interviewee_id))
+                        self._claims[interviewee_id] = task
+                        task.add_done_callback(lambda _, iid=interviewee_id: self._claims.pop(iid, None))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[SharedQueue] ⚠️ 대기 면접자 조회 실패: {e}")
+            await asyncio.sleep(self.poll_sec)
+
+    async def _renew_lease(self, interviewee_id: int) -> None:
+        """리스를 주기적으로 갱신하고, 다른 워커에게 넘어가면 종료합니다."""
+        key = self._lease_key(interviewee_id)
+        while True:
+            await asyncio.sleep(self.lease_ms / 3000)
+            if _text(await self.client.get(key) or b"") != self.token:
+                print(f"[SharedQueue] ⚠️ 리스 상실: interviewee {interviewee_id}")
+                return
+            await self.client.pexpire(key, self.lease_ms)
+
+    async def _release_lease(self, interviewee_id: int) -> None:
+        key = self._lease_key(interviewee_id)
+        if _text(await self.client.get(key) or b"") == self.token:
+            await self.client.delete(key)
+
+    async def _process(self, interviewee_id: int) -> None:
+        """점유한 면접자의 작업을 리스트 순서대로 하나씩 실행합니다."""
+        key = self._jobs_key(interviewee_id)
+        renewer = asyncio.create_task(self._renew_lease(interviewee_id))
+        try:
+            while not renewer.done():
+                raw = await self.client.lindex(key, 0)
+                if raw is None:
+                    # 준비 집합에서 뺀 직후 새로 들어온 작업이 있으면 다시 표시
+                    await self.client.srem(self._ready_key, interviewee_id)
+                    if await self.client.llen(key):
+                        await self.client.sadd(self._ready_key, interviewee_id)
+                        continue
+                    return
+                await self._run(interviewee_id, json.loads(raw))
+                # 완료 후 제거 (같은 기술자만 제거 - 그 사이 취소/재등록된 리스트는 건드리지 않음)
+                await self.client.lrem(key, 1, raw)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[SharedQueue] ❌ 면접자 작업 처리 오류: interviewee {interviewee_id} - {e}")
+        finally:
+            renewer.cancel()
+            await self._release_lease(interviewee_id)
+
+    async def _run(self, interviewee_id: int, job: Dict[str, Any]) -> None:
+        """작업 하나를 프로세스 내 스케줄러로 실행하고 끝날 때까지 기다립니다."""
+        deadline_sec = None
+        if job.get("deadline_at") is not None:
+            deadline_sec = job["deadline_at"] - time.time()
+            if deadline_sec <= 0:
+                print(f"[SharedQueue] ⏰ 마감 시간 경과 - 작업 생략: interviewee {interviewee_id} ({job['kind']})")
+                QUEUE_METRICS.record_drop("deadline")
+                return
+
+        handler = JOB_HANDLERS.get(job["kind"])
+        if handler is None:
+            print(f"[SharedQueue] ❌ 등록되지 않은 작업 종류: {job['kind']} (job {job['id']})")
+            return
+
+        handle = self.scheduler.submit(
+            interviewee_id, lambda: handler(interviewee_id, job["payload"]), job["kind"],
+            deadline_sec=deadline_sec, priority=job.get("priority", PRIORITY_INGEST),
+        )
+        await handle.wait()
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """공유 큐 요약 (관리자 조회용)"""
+        ready = await self.client.smembers(self._ready_key)
+        return {
+            "token": self.token,
+            "lease_ms": self.lease_ms,
+            "claimed_here": sorted(self._claims),
+            "ready_interviewees": sorted(int(_text(r)) for r in ready),
+        }
+
+
+# ──────────────── 📦 전역 공유 큐 (QUEUE_SHARED_BACKEND 설정 시) ────────────────
+SHARED_QUEUE: Optional[SharedJobQueue] = (
+    SharedJobQueue(create_redis_client(QUEUE_SHARED_BACKEND, REDIS_URL)) if QUEUE_SHARED_BACKEND else None
+)
+
+
+async def submit_job(
+    interviewee_id: int,
+    kind: str,
+    payload: Dict[str, Any],
+    deadline_sec: Optional[float] = None,
+    supersede_key: Optional[str] = None,
+    priority: str = PRIORITY_INGEST,
+) -> str:
+    """
+    작업을 등록합니다. 공유 큐가 설정되어 있으면 공유 큐에, 아니면 프로세스 내 영구 큐에 넣습니다.
+
+    Returns:
+        str: 작업 ID
+    """
+    if SHARED_QUEUE is not None:
+        return await SHARED_QUEUE.push(interviewee_id, kind, payload, deadline_sec, supersede_key, priority)
+    handle = await enqueue_job(interviewee_id, kind, payload, deadline_sec, supersede_key, priority)
+    return str(handle.job_id)
+
+
+async def drain_interviewee(interviewee_id: int, timeout: Optional[float] = None) -> bool:
+    """
+    면접자의 공유 대기 작업과 이 프로세스의 대기/실행 중 작업이 모두 끝날 때까지 기다립니다.
+
+    Returns:
+        bool: 타임아웃 전에 모두 끝났으면 True
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    if SHARED_QUEUE is not None and not await SHARED_QUEUE.drain(interviewee_id, timeout):
+        return False
+    remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+    return await drain_interviewee_queue(interviewee_id, remaining)
+
+
+async def cancel_interviewee(interviewee_id: int, include_running: bool = True) -> int:
+    """면접자의 공유 대기 작업과 이 프로세스의 작업을 취소하고 취소한 수를 반환합니다."""
+    cancelled = await SHARED_QUEUE.cancel(interviewee_id) if SHARED_QUEUE is not None else 0
+    return cancelled + await cancel_interviewee_tasks(interviewee_id, include_running)
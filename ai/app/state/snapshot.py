@@ -0,0 +1,329 @@
+"""
+SK AXIS AI 면접 상태 스냅샷
+
+이 파일은 memory 백엔드 상태 저장소를 주기적으로 디스크에 저장하고
+재시작 시 다시 읽어 들이는 모듈입니다.
+주요 기능:
+- STATE_SNAPSHOT_INTERVAL_SEC마다 바뀐 면접자 상태만 델타 파일에 추가 (증분 기록)
+- 델타 기록이 STATE_SNAPSHOT_COMPACT_EVERY번 쌓이면 전체 스냅샷으로 합치고 델타 비움
+- 시작 시 스냅샷 + 델타를 읽어 상태 저장소 복원 (재시작 중에도 진행 중 면접의 전사/점수 유지)
+- 종료 시 마지막 변경분 기록
+- 디렉토리 배타 잠금 (state.lock, fcntl.flock): 같은 디렉토리는 한 프로세스만 읽고 씀
+
+파일 구성 (STATE_SNAPSHOT_DIR, 기본 AI_DATA_DIR/state_snapshot):
+- state.snapshot: pickle {"format": 1, "states": {interviewee_id: 상태 pickle bytes}}
+- state.delta: (interviewee_id, 상태 pickle bytes 또는 None=삭제) pickle 프레임을 이어 붙인 파일
+- state.lock: 사용 중인 프로세스가 잡는 잠금 파일 (내용 없음)
+
+사용 목적:
+- Redis 없이 단일 워커로 운영할 때 롤링 재시작으로 면접 상태가 사라지는 문제 방지
+
+주의사항:
+- 상태 pickle은 이벤트 루프에서 면접자별로 나눠 수행 (바뀐 상태만, 상태 사이마다 양보),
+  파일 쓰기/합치기/읽기는 asyncio.to_thread로 실행 → 이벤트 루프 비차단
+- 델타 파일 끝의 잘린 프레임(기록 중 종료)은 무시
+- pickle은 신뢰할 수 있는 입력에만 사용 → 디렉토리는 0700으로 만들고, 다른 사용자 소유이거나
+  그룹/다른 사용자가 쓸 수 있는 디렉토리/파일이면 복원하지 않음 (공유/외부 쓰기 가능 마운트에 두지 말 것)
+- 여러 워커가 같은 디렉토리를 가리키면 잠금을 먼저 잡은 워커만 스냅샷을 사용하고
+  나머지는 경고 후 스냅샷을 끔 (파일을 읽지도 쓰지도 않음) → 다중 워커는 redis 백엔드 사용 권장
+- redis/local 백엔드는 상태가 이미 프로세스 밖에 있으므로 사용하지 않음
+"""
+
+import os
+import time
+import fcntl
+import pickle
+import stat
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.constants.data_paths import data_path
+from app.state.store import INTERVIEW_STATE_STORE, InMemoryStateStore
+
+# ──────────────── ⚙️ 스냅샷 설정 ────────────────
+STATE_SNAPSHOT_DIR = os.getenv("STATE_SNAPSHOT_DIR", data_path("state_snapshot"))        # "" 이면 스냅샷 사용 안 함
+STATE_SNAPSHOT_INTERVAL_SEC = float(os.getenv("STATE_SNAPSHOT_INTERVAL_SEC", "5"))      # 증분 기록 주기
+STATE_SNAPSHOT_COMPACT_EVERY = int(os.getenv("STATE_SNAPSHOT_COMPACT_EVERY", "60"))     # 델타 기록 N번마다 전체 스냅샷으로 합침
+
+SNAPSHOT_FORMAT = 1
+
+Frame = Tuple[int, Optional[bytes]]
+
+
+def _read_files(directory: str) -> Dict[int, bytes]:
+    """
+    스냅샷과 델타를 읽어 면접자별 최신 상태 pickle bytes를 반환합니다.
+
+    Raises:
+        PermissionError: 다른 사용자가 바꿀 수 있는 위치 (pickle을 읽지 않음)
+    """
+    reason = _unsafe_reason(directory)
+    if reason is not None:
+        raise PermissionError(f"안전하지 않은 스냅샷 위치 ({reason})")
+    blobs: Dict[int, bytes] = {}
+    try:
+        with open(os.path.join(directory, "state.snapshot"), "rb") as f:
+            snapshot = pickle.load(f)
+        if snapshot.get("format") == SNAPSHOT_FORMAT:
+            blobs.update(snapshot["states"])
+    except FileNotFoundError:
+        pass
+    try:
+        with open(os.path.join(directory, "state.delta"), "rb") as f:
+            while True:
+                try:
+                    interviewee_id, blob = pickle.load(f)
+                except EOFError:
+                    break
+                except (pickle.UnpicklingError, ValueError):
+                    print("[StateSnapshot] ⚠️ 델타 파일 끝의 잘린 기록 무시")
+                    break
+                if blob is None:
+                    blobs.pop(interviewee_id, None)
+                else:
+                    blobs[interviewee_id] = blob
+    except FileNotFoundError:
+        pass
+    return blobs
+
+
+def _unsafe_reason(directory: str) -> Optional[str]:
+    """스냅샷 디렉토리/파일을 다른 사용자가 바꿀 수 있으면 그 이유를 반환합니다 (pickle 로딩 전 확인)."""
+    for name in ("", "state.snapshot", "state.delta"):
+        path = os.path.join(directory, name) if name else directory
+        try:
+            info = os.stat(path)
+        except FileNotFoundError:
+            continue
+        if hasattr(os, "getuid") and info.st_uid != os.getuid():
+            return f"다른 사용자 소유: {path}"
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return f"그룹/다른 사용자 쓰기 가능: {path}"
+    return None
+
+
+def _ensure_dir(directory: str) -> None:
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+
+def _acquire_lock(directory: str) -> Optional[int]:
+    """
+    디렉토리 잠금 파일에 배타 flock을 잡고 fd를 반환합니다.
+    다른 프로세스가 이미 잡고 있으면 None (기다리지 않음).
+    """
+    _ensure_dir(directory)
+    fd = os.open(os.path.join(directory, "state.lock"), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _release_lock(fd: int) -> None:
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _append_delta(directory: str, frames: List[Frame]) -> None:
+    _ensure_dir(directory)
+    with open(os.path.join(directory, "state.delta"), "ab") as f:
+        for frame in frames:
+            pickle.dump(frame, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _compact(directory: str) -> int:
+    """델타를 스냅샷에 합쳐 새 스냅샷을 쓰고 델타를 비웁니다. 저장된 면접자 수를 반환."""
+    _ensure_dir(directory)
+    blobs = _read_files(directory)
+    path = os.path.join(directory, "state.snapshot")
+    with open(f"{path}.tmp", "wb") as f:
+        pickle.dump({"format": SNAPSHOT_FORMAT, "saved_at": time.time(), "states": blobs}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(f"{path}.tmp", path)
+    open(os.path.join(directory, "state.delta"), "wb").close()
+    return len(blobs)
+
+
+def _load_states(directory: str) -> Dict[int, Any]:
+    try:
+        blobs = _read_files(directory)
+    except PermissionError as e:
+        print(f"[StateSnapshot] ⚠️ 복원하지 않음: {e}")
+        return {}
+    states = {}
+    for interviewee_id, blob in blobs.items():
+        try:
+            states[interviewee_id] = pickle.loads(blob)
+        except Exception as e:
+            print(f"[StateSnapshot] ⚠️ 상태 복원 실패 - 건너뜀: {interviewee_id} - {e}")
+    return states
+
+
+class StateSnapshotter:
+    """
+    InMemoryStateStore 주기 스냅샷 작업
+
+    Note:
+        - 기록/합치기는 이 작업 하나에서만 순서대로 실행하고, 디렉토리 잠금으로 다른 프로세스와의
+          동시 접근도 막음 (load/start/flush 시 잠금 획득, stop 시 반납)
+        - 잠금을 얻지 못하면 disabled 상태가 되어 복원/기록을 모두 건너뜀
+        - 기록 실패 시 해당 면접자를 다음 주기에 다시 기록
+    """
+
+    def __init__(self, store: InMemoryStateStore, directory: str = STATE_SNAPSHOT_DIR,
+                 interval_sec: float = STATE_SNAPSHOT_INTERVAL_SEC,
+                 compact_every: int = STATE_SNAPSHOT_COMPACT_EVERY):
+        self.store = store
+        self.directory = directory
+        self.interval_sec = interval_sec
+        self.compact_every = max(1, compact_every)
+        self._task: Optional[asyncio.Task] = None
+        self._deltas_since_compact = 0
+        self._lock_fd: Optional[int] = None
+        self.disabled = False
+        self.stats_counters = {"restored": 0, "delta_writes": 0, "states_written": 0, "compactions": 0, "failures": 0}
+
+    def _claim(self) -> bool:
+        """디렉토리 잠금을 잡고 있으면 True. 처음 실패하면 경고 후 스냅샷을 끕니다."""
+        if self._lock_fd is not None:
+            return True
+        if self.disabled:
+            return False
+        try:
+            self._lock_fd = _acquire_lock(self.directory)
+        except OSError as e:
+            print(f"[StateSnapshot] ⚠️ 잠금 파일을 열 수 없음 - 이번 기록 건너뜀: {e}")
+            return False
+        if self._lock_fd is None:
+            self.disabled = True
+            print(f"[StateSnapshot] ⚠️ 다른 프로세스가 사용 중인 스냅샷 디렉토리 - 이 워커는 스냅샷 사용 안 함: "
+                  f"{self.directory}")
+            return False
+        return True
+
+    def release(self) -> None:
+        """디렉토리 잠금을 반납합니다 (stop에서 호출)."""
+        if self._lock_fd is not None:
+            _release_lock(self._lock_fd)
+            self._lock_fd = None
+
+    async def load(self) -> int:
+        """
+        스냅샷을 읽어 상태 저장소에 복원합니다 (앱 시작 시, 작업 재실행 전에 호출).
+
+        Returns:
+            int: 복원한 면접자 수 (잠금을 얻지 못하면 0)
+        """
+        if not self._claim():
+            return 0
+        states = await asyncio.to_thread(_load_states, self.directory)
+        for interviewee_id, state in states.items():
+            await self.store.put(interviewee_id, state)
+        self.store.take_dirty()  # 방금 읽은 내용은 이미 디스크에 있음
+        self.stats_counters["restored"] = len(states)
+        if states:
+            print(f"[StateSnapshot] ♻️ 상태 복원: {len(states)}명 ({self.directory})")
+        return len(states)
+
+    async def flush(self) -> int:
+        """
+        마지막 기록 이후 바뀐 상태를 델타 파일에 추가합니다.
+
+        Returns:
+            int: 기록한 면접자 수
+        """
+        if not self._claim():
+            self.store.take_dirty()  # 기록하지 않는 변경분이 쌓이지 않도록 비움
+            return 0
+        dirty = self.store.take_dirty()
+        if not dirty:
+            return 0
+        frames: List[Frame] = []
+        for interviewee_id, state in dirty.items():
+            try:
+                frames.append((interviewee_id, None if state is None
+                               else pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)))
+            except Exception as e:
+                print(f"[StateSnapshot] ⚠️ 상태 직렬화 실패 - 건너뜀: {interviewee_id} - {e}")
+            await asyncio.sleep(0)  # 상태 사이마다 다른 요청 처리
+        try:
+            await asyncio.to_thread(_append_delta, self.directory, frames)
+        except OSError as e:
+            print(f"[StateSnapshot] ⚠️ 델타 기록 실패 - 다음 주기에 재시도: {e}")
+            self.store.mark_dirty(dirty)
+            self.stats_counters["failures"] += 1
+            return 0
+        self.stats_counters["delta_writes"] += 1
+        self.stats_counters["states_written"] += len(frames)
+        self._deltas_since_compact += 1
+        if self._deltas_since_compact >= self.compact_every:
+            await self.compact()
+        return len(frames)
+
+    async def compact(self) -> None:
+        if not self._claim():
+            return
+        try:
+            count = await asyncio.to_thread(_compact, self.directory)
+        except OSError as e:
+            print(f"[StateSnapshot] ⚠️ 스냅샷 합치기 실패: {e}")
+            self.stats_counters["failures"] += 1
+            return
+        self._deltas_since_compact = 0
+        self.stats_counters["compactions"] += 1
+        print(f"[StateSnapshot] 💾 전체 스냅샷 저장: {count}명")
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_sec)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"[StateSnapshot] ❌ 스냅샷 주기 작업 오류: {e}")
+
+    def start(self) -> None:
+        if self._task is None and self._claim():
+            self._task = asyncio.create_task(self._loop())
+            print(f"[StateSnapshot] 🚀 스냅샷 시작: {self.directory} (주기 {self.interval_sec}s)")
+
+    async def stop(self) -> None:
+        """주기 작업을 멈추고 남은 변경분을 기록한 뒤 전체 스냅샷으로 합치고 잠금을 반납합니다 (앱 종료 시)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.disabled:
+            return
+        try:
+            await self.flush()
+            await self.compact()
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "interval_sec": self.interval_sec,
+            "compact_every": self.compact_every,
+            "running": self._task is not None,
+            "disabled": self.disabled,
+            **self.stats_counters,
+        }
+
+
+# ──────────────── 📦 전역 스냅샷 작업 ────────────────
+STATE_SNAPSHOTTER: Optional[StateSnapshotter] = (
+    StateSnapshotter(INTERVIEW_STATE_STORE)
+    if STATE_SNAPSHOT_DIR and isinstance(INTERVIEW_STATE_STORE, InMemoryStateStore) else None
+)
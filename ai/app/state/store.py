@@ -1,39 +1,526 @@
 """
-SK AXIS AI 면접 상태 전역 메모리 저장소
+SK AXIS AI 면접 상태 저장소
 
-이 파일은 면접 진행 상태를 메모리에 저장하는 전역 저장소입니다.
+이 파일은 면접 진행 상태를 저장하는 전역 저장소입니다.
 주요 기능:
-- 면접자별 상태 정보 임시 저장
+- 면접자별 상태 정보 저장 (get / put / update / delete / scan)
 - 파이프라인 단계별 처리 결과 보관
 - API 간 상태 공유 및 조회 지원
+- 백엔드 교체 가능 (프로세스 메모리 / Redis)
+- 메모리 상한: 완료(done) 후 TTL 경과 시 제거, 바이트 예산 초과 시 LRU 제거
+- 제거된 상태는 gzip JSON 아카이브로 내보내고 get()에서 투명하게 다시 읽음
+- 낙관적 동시성 제어: 면접자별 버전 번호 + compare_and_put / commit (필드 단위 병합)
 
 저장소 구조:
 - 키: interviewee_id (정수) - 면접자 고유 식별자
 - 값: InterviewState (딕셔너리) - 해당 면접의 전체 상태
 
+백엔드 (STATE_BACKEND):
+- memory (기본): 프로세스 메모리 dict (재시작 시 소실, 단일 워커)
+- redis: STATE_REDIS_URL의 Redis에 JSON으로 저장 (여러 워커/레플리카가 상태 공유)
+- local: LocalRedis (Redis 백엔드 직렬화 경로를 단일 프로세스에서 검증)
+
 사용 패턴:
 1. 면접 시작 시 초기 상태 생성 및 저장
-2. 각 파이프라인 단계에서 상태 업데이트
+2. 파이프라인은 get_versioned()로 사본과 버전을 읽고, LLM 호출 후 commit()으로 변경 필드만 반영
 3. API에서 상태 조회 및 결과 반환
 4. 면접 완료 후 상태 정리 (선택적)
 
+메모리 정책 (STATE_DONE_TTL_SEC / STATE_MAX_BYTES / STATE_ARCHIVE_DIR):
+- 완료된 면접 상태는 완료 시점부터 TTL이 지나면 메모리에서 제거 (Redis는 키 만료)
+- memory 백엔드는 상태 JSON 크기 합계가 예산을 넘으면 가장 오래 사용하지 않은 상태부터 제거
+- 아카이브 디렉토리가 설정되어 있으면 제거 전에 {interviewee_id}.json.gz로 저장 (Redis는 완료 시 저장)
+- 아카이브에서 읽은 완료 상태는 메모리에 다시 올리지 않음 (진행 중 상태는 다시 올림)
+
+동시성 (STATE_CAS_RETRIES):
+- 모든 쓰기는 저장소 전체에서 증가하는 순번을 새 버전으로 받음 (상태 없음 = 버전 0)
+  → 제거/삭제 후 다시 저장되어도 예전 버전 번호가 다시 나오지 않음 (ABA 방지)
+- 버전 번호는 메모리 제거(TTL/LRU)·Redis 키 만료 후에도 유지 (아카이브에서 읽은 상태도 같은 버전)
+- compare_and_put(id, state, version): 저장된 버전이 그대로일 때만 저장 (LLM 호출 동안 잠금을 잡지 않음)
+- commit(id, base, new, version): 버전이 바뀌었으면 최신 상태에 base 대비 바뀐 필드만 덮어써 재시도
+  → 늦게 끝난 STT 작업이 면접 종료(최종 평가) 결과를 되돌리지 않음
+
 주의사항:
-- 메모리 기반 저장소로 서버 재시작 시 데이터 소실
-- 운영 환경에서는 Redis 등 영구 저장소 고려 필요
-- 동시성 제어는 Python GIL에 의존
+- 모든 메서드는 async (Redis 왕복 동안 이벤트 루프를 막지 않음)
+- memory 백엔드의 get()은 저장된 객체 자체를 반환하지만, Redis 백엔드는 매번 새 사본을 반환
+  → 상태를 수정했으면 백엔드와 무관하게 반드시 put()/update()로 저장
 """
 
-from typing import Dict
+import os
+import gzip
+import json
+import time
+import copy
+import asyncio
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from app.constants.data_paths import data_path
 from app.schemas.state import InterviewState
+from app.services.local_redis import LocalRedis, Value, create_redis_client, local_script
+from app.services.interviewee_registry import INTERVIEWEE_REGISTRY
 
-# ──────────────── 📦 전역 메모리 저장소 ────────────────
-# 인터뷰 상태를 메모리에 저장하는 전역 스토어
-# 키: interviewee_id (정수), 값: 해당 인터뷰의 상태 객체
-INTERVIEW_STATE_STORE: Dict[int, InterviewState] = {}
+# ──────────────── ⚙️ 저장소 설정 ────────────────
+STATE_BACKEND = os.getenv("STATE_BACKEND", "memory")                                  # "memory" | "redis" | "local"
+STATE_REDIS_URL = os.getenv("STATE_REDIS_URL", os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+STATE_KEY_PREFIX = os.getenv("STATE_KEY_PREFIX", "skaxis:state")
+STATE_DONE_TTL_SEC = float(os.getenv("STATE_DONE_TTL_SEC", "21600"))                 # 완료 후 메모리 보관 시간 (0이면 무제한)
+STATE_MAX_BYTES = int(os.getenv("STATE_MAX_MB", "256")) * 1024 * 1024                # memory 백엔드 상태 크기 예산 (0이면 무제한)
+STATE_ARCHIVE_DIR = os.getenv("STATE_ARCHIVE_DIR", data_path("state_archive"))        # 제거된 상태 보관 위치 ("" 이면 보관 안 함)
+STATE_CAS_RETRIES = int(os.getenv("STATE_CAS_RETRIES", "5"))                          # 버전 충돌 시 update()/commit() 재시도 횟수
 
-# ──────────────── 🔧 사용 예시 ────────────────
-# 상태 저장: INTERVIEW_STATE_STORE[101] = initial_state
-# 상태 조회: state = INTERVIEW_STATE_STORE.get(101)
-# 상태 업데이트: INTERVIEW_STATE_STORE[101]["stt"]["done"] = True
-# 상태 삭제: del INTERVIEW_STATE_STORE[101]  # 선택적
+StateUpdater = Callable[[Optional[InterviewState]], Optional[InterviewState]]
+
+
+class StateStore(ABC):
+    """
+    면접 상태 저장소 인터페이스
+
+    Note:
+        - update(fn)는 읽기 → fn(state) → 버전 비교 저장을 충돌이 없을 때까지 반복
+          (fn이 None을 반환하면 저장하지 않음, fn은 재실행될 수 있으므로 LLM 호출 등 부수효과 금지)
+        - scan()은 저장된 면접자 ID를 순회
+        - 백엔드는 get / get_versioned / put / compare_and_put / delete / scan을 구현 (추상 메서드)
+    """
+    backend = "base"
+
+    @abstractmethod
+    async def get(self, interviewee_id: int) -> Optional[InterviewState]:
+        """상태를 반환합니다 (없으면 None)."""
+
+    @abstractmethod
+    async def get_versioned(self, interviewee_id: int) -> Tuple[Optional[InterviewState], int]:
+        """상태 사본과 현재 버전을 반환합니다 (상태 없음 = (None, 0))."""
+
+    @abstractmethod
+    async def put(self, interviewee_id: int, state: InterviewState) -> None:
+        """버전과 무관하게 저장합니다 (새 버전 발급)."""
+
+    @abstractmethod
+    async def compare_and_put(self, interviewee_id: int, state: InterviewState, version: int) -> bool:
+        """저장된 버전이 version일 때만 저장합니다 (새 버전 발급). 저장 여부를 반환."""
+
+    async def update(self, interviewee_id: int, fn: StateUpdater,
+                     retries: int = STATE_CAS_RETRIES) -> Optional[InterviewState]:
+        for _ in range(retries + 1):
+            current, version = await self.get_versioned(interviewee_id)
+            state = fn(current)
+            if state is None:
+                return None
+            if await self.compare_and_put(interviewee_id, state, version):
+                return state
+            await asyncio.sleep(0)
+        print(f"[StateStore] ⚠️ 버전 충돌 재시도 초과 - 저장 포기: {interviewee_id}")
+        return None
+
+    async def commit(self, interviewee_id: int, base: Optional[InterviewState], new: InterviewState,
+                     version: int, skip_if_done: bool = False) -> Optional[InterviewState]:
+        """
+        get_versioned()로 읽은 뒤 오래 걸린 처리(LLM 파이프라인) 결과를 저장합니다.
+
+        Args:
+            base: 처리 전 상태 사본 (get_versioned 결과)
+            new: 처리 후 상태
+            version: base를 읽을 때의 버전
+            skip_if_done: 그 사이 면접이 완료(done)되었으면 저장하지 않음 (늦은 STT 결과용)
+
+        Returns:
+            Optional[InterviewState]: 저장된 상태 (저장하지 않았으면 None)
+
+        Note:
+            - 버전이 그대로면 new를 그대로 저장
+            - 바뀌었으면 최신 상태에 base 대비 new에서 바뀐 필드만 덮어씀 (merge_state_changes)
+        """
+        if await self.compare_and_put(interviewee_id, new, version):
+            return new
+
+        def merge(current: Optional[InterviewState]) -> Optional[InterviewState]:
+            if current is None:
+                return new
+            if skip_if_done and current.get("done"):
+                print(f"[StateStore] ⏭ 완료된 면접에 늦은 쓰기 - 저장 생략: {interviewee_id}")
+                return None
+            return merge_state_changes(base or {}, new, current)
+
+        print(f"[StateStore] 🔀 버전 충돌 - 필드 단위 병합: {interviewee_id}")
+        return await self.update(interviewee_id, merge)
+
+    @abstractmethod
+    async def delete(self, interviewee_id: int) -> bool:
+        """상태(아카이브 포함)를 삭제하고 존재 여부를 반환합니다."""
+
+    @abstractmethod
+    def scan(self) -> AsyncIterator[int]:
+        """저장된 면접자 ID를 순회합니다."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend}
+
+
+def _dumps(state: InterviewState) -> str:
+    return json.dumps(state, ensure_ascii=False, default=str)
+
+
+_MISSING = object()
+
+
+def merge_state_changes(base: InterviewState, new: InterviewState, current: InterviewState) -> InterviewState:
+    """
+    base → new 사이에 바뀐 최상위 필드만 current에 덮어쓴 상태를 반환합니다.
+
+    Note:
+        - 양쪽이 같은 필드를 바꿨으면 new가 우선 (충돌 필드는 로그 출력)
+        - new에서 사라진 필드는 current에서도 제거
+    """
+    merged = dict(current)
+    conflicts = []
+    for key in set(base) | set(new):
+        if key in new and base.get(key, _MISSING) == new[key]:
+            continue
+        if key in current and current.get(key) != base.get(key, _MISSING) and current.get(key) != new.get(key, _MISSING):
+            conflicts.append(key)
+        if key in new:
+            merged[key] = new[key]
+        else:
+            merged.pop(key, None)
+    if conflicts:
+        print(f"[StateStore] ⚠️ 양쪽에서 바뀐 필드 (새 값 우선): {sorted(conflicts)}")
+    return merged
+
+
+class StateArchive:
+    """
+    제거된 면접 상태의 디스크 보관소 (면접자별 gzip JSON 파일)
+
+    Note:
+        - 동기 파일 I/O이므로 이벤트 루프에서는 asyncio.to_thread로 호출
+        - 임시 파일에 쓴 뒤 교체 (쓰는 도중 읽어도 깨진 파일을 보지 않음)
+    """
+
+    def __init__(self, directory: str = STATE_ARCHIVE_DIR):
+        self.directory = directory
+
+    def _path(self, interviewee_id: int) -> str:
+        return os.path.join(self.directory, f"{interviewee_id}.json.gz")
+
+    def write(self, interviewee_id: int, state: InterviewState) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(interviewee_id)
+        with gzip.open(f"{path}.tmp", "wt", encoding="utf-8") as f:
+            f.write(_dumps(state))
+        os.replace(f"{path}.tmp", path)
+
+    def read(self, interviewee_id: int) -> Optional[InterviewState]:
+        try:
+            with gzip.open(self._path(interviewee_id), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"[StateStore] ⚠️ 아카이브 읽기 실패: {interviewee_id} - {e}")
+            return None
+
+    def delete(self, interviewee_id: int) -> bool:
+        try:
+            os.remove(self._path(interviewee_id))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def ids(self) -> List[int]:
+        if not os.path.isdir(self.directory):
+            return []
+        names = (name[:-len(".json.gz")] for name in os.listdir(self.directory) if name.endswith(".json.gz"))
+        return [int(name) for name in names if name.isdigit()]
+
+
+class InMemoryStateStore(StateStore):
+    """
+    프로세스 메모리 상태 저장소 (완료 후 TTL + 바이트 예산 LRU + 아카이브)
+
+    Note:
+        - 상태 크기는 put() 시점의 JSON(UTF-8) 바이트 수로 추정
+        - get()으로 꺼낸 객체를 put() 없이 수정하면 크기 추정에는 다음 put()부터 반영
+    """
+    backend = "memory"
 
+    def __init__(self, done_ttl_sec: float = STATE_DONE_TTL_SEC, max_bytes: int = STATE_MAX_BYTES,
+                 archive_dir: str = STATE_ARCHIVE_DIR):
+        self._states: "OrderedDict[int, InterviewState]" = OrderedDict()  # 최근 사용 순 (뒤가 최신)
+        self._sizes: Dict[int, int] = {}
+        self._done_at: "OrderedDict[int, float]" = OrderedDict()           # 완료 시각 순
+        self.bytes = 0
+        self.done_ttl_sec = done_ttl_sec
+        self.max_bytes = max_bytes
+        self.archive = StateArchive(archive_dir) if archive_dir else None
+        self.evicted = {"ttl": 0, "lru": 0}
+        self._versions: Dict[int, int] = {}  # 제거(아카이브)된 면접자도 유지 - 면접자당 정수 하나
+        self._version_seq = 0
+        self._dirty: Set[int] = set()  # 마지막 스냅샷 이후 바뀐(저장/삭제/제거된) 면접자 ID
+
+    async def get(self, interviewee_id: int) -> Optional[InterviewState]:
+        await self._evict_expired()
+        state = self._states.get(interviewee_id)
+        if state is not None:
+            self._states.move_to_end(interviewee_id)
+            return state
+        if self.archive is None:
+            return None
+        state = await asyncio.to_thread(self.archive.read, interviewee_id)
+        if state is not None and not state.get("done"):
+            # 예산 초과로 밀려난 진행 중 면접 - 파이프라인이 이어서 쓰므로 메모리로 복귀
+            await self.put(interviewee_id, state)
+        return state
+
+    async def get_versioned(self, interviewee_id: int) -> Tuple[Optional[InterviewState], int]:
+        state = await self.get(interviewee_id)
+        # 사본 반환 - 파이프라인이 수정하는 동안 저장된 상태는 그대로 유지
+        return copy.deepcopy(state), self._versions.get(interviewee_id, 0)
+
+    async def compare_and_put(self, interviewee_id: int, state: InterviewState, version: int) -> bool:
+        # 비교와 저장 사이에 await 지점이 없으므로 이벤트 루프 안에서 원자적
+        if self._versions.get(interviewee_id, 0) != version:
+            return False
+        await self.put(interviewee_id, state)
+        return True
+
+    async def put(self, interviewee_id: int, state: InterviewState) -> None:
+        done_at = self._done_at.get(interviewee_id)  # 완료 후 다시 저장해도 TTL은 처음 완료 시각 기준
+        self._discard(interviewee_id)
+        self._version_seq += 1
+        self._versions[interviewee_id] = self._version_seq
+        self._dirty.add(interviewee_id)
+        size = len(_dumps(state).encode("utf-8")) if self.max_bytes else 0
+        self._states[interviewee_id] = state
+        self._sizes[interviewee_id] = size
+        self.bytes += size
+        if state.get("done"):
+            self._done_at[interviewee_id] = done_at or time.monotonic()
+        await self._evict_expired()
+        await self._evict_over_budget(keep=interviewee_id)
+
+    async def delete(self, interviewee_id: int) -> bool:
+        found = self._discard(interviewee_id) is not None
+        self._versions.pop(interviewee_id, None)
+        self._dirty.add(interviewee_id)
+        if self.archive is not None:
+            found = await asyncio.to_thread(self.archive.delete, interviewee_id) or found
+        return found
+
+    async def scan(self) -> AsyncIterator[int]:
+        archived = await asyncio.to_thread(self.archive.ids) if self.archive is not None else []
+        for interviewee_id in list(self._states):
+            yield interviewee_id
+        for interviewee_id in archived:
+            if interviewee_id not in self._states:
+                yield interviewee_id
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def take_dirty(self) -> Dict[int, Optional[InterviewState]]:
+        """
+        마지막 호출 이후 바뀐 면접자의 현재 상태를 반환하고 변경 표시를 지웁니다 (스냅샷용).
+
+        Returns:
+            Dict[int, Optional[InterviewState]]: 메모리에 없는(삭제/제거된) 면접자는 None
+        """
+        dirty, self._dirty = self._dirty, set()
+        return {interviewee_id: self._states.get(interviewee_id) for interviewee_id in dirty}
+
+    def mark_dirty(self, interviewee_ids) -> None:
+        """스냅샷 기록에 실패한 면접자를 다음 스냅샷에 다시 포함합니다."""
+        self._dirty.update(interviewee_ids)
+
+    def _discard(self, interviewee_id: int) -> Optional[InterviewState]:
+        state = self._states.pop(interviewee_id, None)
+        self.bytes -= self._sizes.pop(interviewee_id, 0)
+        self._done_at.pop(interviewee_id, None)
+        return state
+
+    async def _evict(self, interviewee_id: int, reason: str) -> None:
+        state = self._discard(interviewee_id)
+        self._dirty.add(interviewee_id)
+        self.evicted[reason] += 1
+        if state is not None and self.archive is not None:
+            await asyncio.to_thread(self.archive.write, interviewee_id, state)
+
+    async def _evict_expired(self) -> None:
+        if not self.done_ttl_sec:
+            return
+        cutoff = time.monotonic() - self.done_ttl_sec
+        while self._done_at:
+            interviewee_id, done_at = next(iter(self._done_at.items()))
+            if done_at > cutoff:
+                break
+            await self._evict(interviewee_id, "ttl")
+
+    async def _evict_over_budget(self, keep: int) -> None:
+        while self.max_bytes and self.bytes > self.max_bytes and len(self._states) > 1:
+            oldest = next(iter(self._states))
+            if oldest == keep:
+                break
+            print(f"[StateStore] 📦 메모리 예산 초과 - 상태 제거: {oldest} ({self.bytes}/{self.max_bytes}B)")
+            await self._evict(oldest, "lru")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "states": len(self._states),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "done_ttl_sec": self.done_ttl_sec,
+            "evicted": dict(self.evicted),
+            "archive_dir": self.archive.directory if self.archive else None,
+        }
+
+
+# 버전 비교 → 상태 저장 → 새 버전 발급을 Redis 안에서 한 번에 실행 (잠금 없이 여러 워커 간 원자적)
+# KEYS: 상태 키, 버전 키, 버전 순번 키 / ARGV: 기대 버전("" 이면 비교 안 함), 상태 JSON, TTL ms(0이면 없음)
+# 반환: 새 버전 (버전이 달라 저장하지 않았으면 0)
+_COMPARE_AND_SET_LUA = """
+local current = tonumber(redis.call('GET', KEYS[2]) or '0')
+if ARGV[1] ~= '' and current ~= tonumber(ARGV[1]) then
+    return 0
+end
+if tonumber(ARGV[3]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+else
+    redis.call('SET', KEYS[1], ARGV[2])
+end
+local version = redis.call('INCR', KEYS[3])
+redis.call('SET', KEYS[2], version)
+return version
+"""
+
+
+@local_script(_COMPARE_AND_SET_LUA)
+async def _compare_and_set_local(client: LocalRedis, keys: List[str], args: List[Value]) -> int:
+    key, ver_key, seq_key = keys
+    expected, payload, ttl_ms = str(args[0]), args[1], int(args[2])
+    if expected and int(await client.get(ver_key) or 0) != int(expected):
+        return 0
+    await client.set(key, payload, px=ttl_ms or None)
+    version = await client.incr(seq_key)
+    await client.set(ver_key, version)
+    return version
+
+
+class RedisStateStore(StateStore):
+    """
+    Redis 상태 저장소 (면접자별 키에 JSON 문자열로 저장)
+
+    Note:
+        - 키: {STATE_KEY_PREFIX}:{interviewee_id}, 버전: ...:{interviewee_id}:ver
+        - 버전 값은 {STATE_KEY_PREFIX}:version_seq INCR로 발급, 버전 키는 상태 키가 만료되어도 유지 (delete 시 삭제)
+        - JSON으로 표현되지 않는 값(datetime 등)은 문자열로 저장
+        - 쓰기(버전 비교 → 저장 → 버전 증가)는 Lua 스크립트 하나로 실행 → 잠금 없이 여러 워커 간에도 원자적
+          (만료되는 잠금이 없으므로 저장이 오래 걸려도 compare-and-put 보장이 깨지지 않음)
+        - 완료된 상태는 키에 TTL을 설정하고, 저장에 성공한 뒤 아카이브에 기록 → 만료 후 get()은 아카이브에서 읽음
+          (아카이브 기록은 Redis 쓰기와 별개 - 여러 워커가 동시에 완료 상태를 쓰면 아카이브는 마지막 기록 기준)
+    """
+    backend = "redis"
+
+    def __init__(self, client, prefix: str = STATE_KEY_PREFIX, done_ttl_sec: float = STATE_DONE_TTL_SEC,
+                 archive_dir: str = STATE_ARCHIVE_DIR):
+        self.client = client
+        self.prefix = prefix
+        self.done_ttl_sec = done_ttl_sec
+        self.archive = StateArchive(archive_dir) if archive_dir else None
+        self._compare_and_set = client.register_script(_COMPARE_AND_SET_LUA)
+
+    def _key(self, interviewee_id: int) -> str:
+        return f"{self.prefix}:{interviewee_id}"
+
+    async def _version(self, interviewee_id: int) -> int:
+        return int(await self.client.get(f"{self._key(interviewee_id)}:ver") or 0)
+
+    async def get(self, interviewee_id: int) -> Optional[InterviewState]:
+        raw = await self.client.get(self._key(interviewee_id))
+        if raw is not None:
+            return json.loads(raw)
+        if self.archive is None:
+            return None
+        return await asyncio.to_thread(self.archive.read, interviewee_id)
+
+    async def get_versioned(self, interviewee_id: int) -> Tuple[Optional[InterviewState], int]:
+        # 버전을 먼저 읽음 - 그 사이 쓰기가 끼어들면 버전이 달라져 compare_and_put이 실패 (안전한 방향)
+        version = await self._version(interviewee_id)
+        return await self.get(interviewee_id), version
+
+    async def put(self, interviewee_id: int, state: InterviewState) -> None:
+        await self._write(interviewee_id, state, None)
+
+    async def compare_and_put(self, interviewee_id: int, state: InterviewState, version: int) -> bool:
+        return await self._write(interviewee_id, state, version)
+
+    async def _write(self, interviewee_id: int, state: InterviewState, expected: Optional[int]) -> bool:
+        key = self._key(interviewee_id)
+        done = bool(state.get("done"))
+        ttl_ms = int(self.done_ttl_sec * 1000) if done and self.done_ttl_sec else 0
+        # 같은 프로세스 안의 쓰기는 순서대로 (아카이브 기록 순서 보장, 잠금은 면접자 레지스트리 슬롯과 함께 정리)
+        async with INTERVIEWEE_REGISTRY.locked(interviewee_id, "state_write"):
+            version = await self._compare_and_set(
+                keys=[key, f"{key}:ver", f"{self.prefix}:version_seq"],
+                args=["" if expected is None else expected, _dumps(state), ttl_ms],
+            )
+            if not int(version):
+                return False
+            if done and self.archive is not None:
+                try:
+                    await asyncio.to_thread(self.archive.write, interviewee_id, state)
+                except OSError as e:
+                    # 상태는 이미 저장됨 - TTL 만료 전까지는 Redis에서 읽을 수 있음
+                    print(f"[StateStore] ⚠️ 완료 상태 아카이브 실패: {interviewee_id} - {e}")
+            return True
+
+    async def delete(self, interviewee_id: int) -> bool:
+        key = self._key(interviewee_id)
+        found = bool(await self.client.delete(key, f"{key}:ver"))
+        if self.archive is not None:
+            found = await asyncio.to_thread(self.archive.delete, interviewee_id) or found
+        return found
+
+    async def scan(self) -> AsyncIterator[int]:
+        start = len(self.prefix) + 1
+        seen = set()
+        async for key in self.client.scan_iter(match=f"{self.prefix}:*"):
+            key = key.decode("utf-8") if isinstance(key, bytes) else key
+            if key[start:].isdigit():
+                seen.add(int(key[start:]))
+                yield int(key[start:])
+        archived = await asyncio.to_thread(self.archive.ids) if self.archive is not None else []
+        for interviewee_id in archived:
+            if interviewee_id not in seen:
+                yield interviewee_id
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "done_ttl_sec": self.done_ttl_sec,
+            "archive_dir": self.archive.directory if self.archive else None,
+        }
+
+
+def create_state_store(backend: Optional[str] = None) -> StateStore:
+    """STATE_BACKEND 설정에 맞는 상태 저장소를 생성합니다."""
+    backend = backend or STATE_BACKEND
+    if backend == "memory":
+        return InMemoryStateStore()
+    if backend in ("redis", "local"):
+        return RedisStateStore(create_redis_client(backend, STATE_REDIS_URL))
+    raise ValueError(f"지원하지 않는 STATE_BACKEND: {backend}")
+
+
+# ──────────────── 📦 전역 상태 저장소 ────────────────
+INTERVIEW_STATE_STORE: StateStore = create_state_store()
+
+# ──────────────── 🔧 사용 예시 ────────────────
+# 상태 저장: await INTERVIEW_STATE_STORE.put(101, initial_state)
+# 상태 조회: state = await INTERVIEW_STATE_STORE.get(101)
+# 상태 업데이트: await INTERVIEW_STATE_STORE.update(101, lambda s: {**s, "done": True})
+# 긴 처리 후 저장: state, version = await INTERVIEW_STATE_STORE.get_versioned(101)
+#                 new_state = await pipeline(copy.deepcopy(state))
+#                 await INTERVIEW_STATE_STORE.commit(101, state, new_state, version)
+# 상태 삭제: await INTERVIEW_STATE_STORE.delete(101)  # 선택적
@@ -0,0 +1,18 @@
+import os
+import tempfile
+
+import pytest
+
+# 앱 모듈 임포트 전에 런타임 데이터 디렉토리를 임시 위치로 (작업 트리에 파일을 남기지 않음)
+os.environ.setdefault("AI_DATA_DIR", tempfile.mkdtemp(prefix="skaxis-test-data-"))
+
+
+@pytest.fixture(autouse=True)
+def memory_job_store():
+    """테스트마다 새 메모리 작업 저장소 사용 (SQLite 파일 생성 방지)"""
+    from app.services.queue_store import MemoryJobStore, set_job_store
+
+    store = MemoryJobStore()
+    set_job_store(store)
+    yield store
+    set_job_store(None)
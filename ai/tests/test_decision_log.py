@@ -0,0 +1,43 @@
+from app.schemas.state import DECISION_LOG_STATE_TAIL, bounded_log_merge
+from app.services.decision_log import DecisionLogSink
+
+
+def test_sink_keeps_full_log_while_state_keeps_tail(tmp_path, monkeypatch):
+    import app.services.decision_log as decision_log
+
+    sink = DecisionLogSink(str(tmp_path))
+    monkeypatch.setattr(decision_log, "DECISION_LOG", sink)
+    state = {"interviewee_id": 101, "decision_log": []}
+    total = DECISION_LOG_STATE_TAIL + 7
+    for n in range(total):
+        decision_log.log_decision(state, {"step": "rewrite_agent" if n % 2 else "stt_node", "result": n})
+
+    assert [e["result"] for e in state["decision_log"]] == list(range(7, total))
+    full = decision_log.read_decision_log(101)
+    assert [e["result"] for e in full] == list(range(total)) and all("time" in e for e in full)
+    assert [e["result"] for e in decision_log.read_decision_log(101, step="stt_node", limit=2)] == [total - 3, total - 1]
+    assert not sink._rings  # 파일 기록 시 메모리에 남기지 않음
+
+    ring = DecisionLogSink(None, ring_size=5)
+    for n in range(8):
+        ring.append(102, {"result": n})
+    assert [e["result"] for e in ring.read(102)] == [3, 4, 5, 6, 7]
+
+
+def test_memory_rings_keep_only_recently_used_interviewees():
+    sink = DecisionLogSink(None, ring_size=3, max_rings=2)
+    sink.append(101, {"result": "a"})
+    sink.append(102, {"result": "b"})
+    sink.read(101)  # 101을 최근 사용으로
+    sink.append(103, {"result": "c"})  # 가장 오래 사용하지 않은 102 제거
+
+    assert sorted(sink._rings) == [101, 103]
+    assert sink.read(102) == [] and sink.read(101) == [{"result": "a"}]
+
+
+def test_bounded_log_merge_does_not_duplicate_appended_state_log():
+    old = [{"step": "a"}]
+    returned = old + [{"step": "b"}]  # 노드가 상태 전체를 반환한 경우
+    assert bounded_log_merge(old, returned) == [{"step": "a"}, {"step": "b"}]
+    assert bounded_log_merge(old, [{"step": "c"}]) == [{"step": "a"}, {"step": "c"}]
+    assert len(bounded_log_merge([], [{"n": n} for n in range(DECISION_LOG_STATE_TAIL * 2)])) == DECISION_LOG_STATE_TAIL
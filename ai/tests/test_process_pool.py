@@ -0,0 +1,41 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.services.process_pool import CPUBoundPool
+
+
+def test_cpu_bound_work_runs_in_worker_process_and_thread_fallback():
+    async def scenario(workers):
+        pool = CPUBoundPool(workers)
+        try:
+            return await asyncio.gather(pool.run(pow, 3, 4), pool.run(os.getpid)), pool.settings()
+        finally:
+            pool.shutdown()
+
+    (result, pid), settings = asyncio.run(scenario(1))
+    assert result == 81
+    assert pid != os.getpid()
+    assert settings["submitted"] == 2
+
+    (result, pid), settings = asyncio.run(scenario(0))
+    assert result == 81
+    assert pid == os.getpid()
+    assert settings["started"] is False
+
+
+def test_broken_pool_is_rebuilt_once_and_never_runs_the_task_in_process():
+    async def scenario():
+        pool = CPUBoundPool(1)
+        try:
+            with pytest.raises(BrokenProcessPool):
+                await pool.run(os._exit, 1)  # 워커 프로세스가 매번 죽음
+            return await pool.run(os.getpid), pool.settings()
+        finally:
+            pool.shutdown()
+
+    pid, settings = asyncio.run(scenario())
+    assert pid != os.getpid()  # 다음 작업은 새 풀에서 실행
+    assert settings["restarts"] == 2
@@ -0,0 +1,323 @@
+import asyncio
+
+from app.services.queue_executor import FairShareScheduler
+
+
+def test_round_robin_with_global_cap_and_per_interviewee_order():
+    async def scenario():
+        scheduler = FairShareScheduler(workers=2)
+        order, running, peak = [], 0, 0
+
+        def job(interviewee_id, n):
+            async def run():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                order.append((interviewee_id, n))
+                running -= 1
+            return run
+
+        for n in range(3):
+            scheduler.submit(9001, job(9001, n))
+        scheduler.submit(9002, job(9002, 0))
+        scheduler.submit(9003, job(9003, 0))
+
+        while scheduler.settings()["pending_tasks"] or scheduler.settings()["active"]:
+            await asyncio.sleep(0.005)
+        await scheduler.shutdown()
+        return order, peak
+
+    order, peak = asyncio.run(scenario())
+    assert peak <= 2
+    assert [n for i, n in order if i == 9001] == [0, 1, 2]
+    # 9001의 작업 3개가 끝나기 전에 다른 면접자 작업이 처리됨 (독점 없음)
+    assert order.index((9003, 0)) < order.index((9001, 2))
+
+
+def test_snapshot_reports_depth_and_latency_histograms():
+    from app.services.queue_executor import QUEUE_METRICS, get_queue_snapshot
+
+    async def scenario():
+        scheduler = FairShareScheduler(workers=1)
+        gate = asyncio.Event()
+
+        async def blocked():
+            await gate.wait()
+
+        async def quick():
+            return None
+
+        before = QUEUE_METRICS.to_dict()["completed"]
+        scheduler.submit(9101, blocked, kind="stt_pipeline")
+        scheduler.submit(9101, quick, kind="stt_pipeline")
+        await asyncio.sleep(0.01)
+        snapshot = get_queue_snapshot()["interviewees"][9101]
+
+        gate.set()
+        while scheduler.settings()["pending_tasks"] or scheduler.settings()["active"]:
+            await asyncio.sleep(0.005)
+        await scheduler.shutdown()
+        return snapshot, QUEUE_METRICS.to_dict(), before
+
+    snapshot, metrics, before = asyncio.run(scenario())
+    assert snapshot["depth"] == 1 and snapshot["running"]
+    assert metrics["completed"] - before == 2
+    assert metrics["in_flight"] == 0
+    assert metrics["run"]["stt_pipeline"]["count"] >= 2
+
+
+def test_handles_and_drain_wait_for_pending_work():
+    from app.services import queue_executor
+
+    async def scenario():
+        done = []
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            done.append("slow")
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        first = await queue_executor.enqueue_task(9201, slow)
+        second = await queue_executor.enqueue_task(9201, failing)
+        assert not await queue_executor.drain_interviewee_queue(9201, timeout=0.001)
+        assert await queue_executor.drain_interviewee_queue(9201, timeout=1.0)
+
+        await first
+        try:
+            await second
+        except RuntimeError as e:
+            error = str(e)
+        await queue_executor.QUEUE_SCHEDULER.shutdown()
+        return done, error
+
+    done, error = asyncio.run(scenario())
+    assert done == ["slow"] and error == "boom"
+
+
+def test_deadline_cancel_and_supersede_drop_unneeded_work():
+    from app.services import queue_executor
+
+    async def scenario():
+        scheduler = FairShareScheduler(workers=2)
+        ran = []
+
+        def job(name, delay=0.0):
+            async def run():
+                await asyncio.sleep(delay)
+                ran.append(name)
+            return run
+
+        blocker = scheduler.submit(9301, job("blocker", 0.05))
+        expired = scheduler.submit(9301, job("expired"), deadline_sec=0.01)
+        old = scheduler.submit(9301, job("old"), supersede_key="audio:abc")
+        new = scheduler.submit(9301, job("new"), supersede_key="audio:abc")
+        slow = scheduler.submit(9302, job("slow", 1.0), deadline_sec=0.02)
+        await asyncio.gather(blocker, new, return_exceptions=True)
+        try:
+            await slow
+        except TimeoutError:
+            slow_timed_out = True
+
+        running = scheduler.submit(9303, job("running", 1.0))
+        scheduler.submit(9303, job("queued"))
+        await asyncio.sleep(0.01)
+        cancelled = scheduler.cancel(9303)
+        await asyncio.sleep(0.01)
+        await scheduler.shutdown()
+        return ran, expired, old, running, cancelled, slow_timed_out
+
+    ran, expired, old, running, cancelled, slow_timed_out = asyncio.run(scenario())
+    assert ran == ["blocker", "new"]
+    assert expired.future.cancelled() and old.future.cancelled() and running.future.cancelled()
+    assert cancelled == 2 and slow_timed_out
+
+
+def test_interactive_lane_is_preferred_but_ingest_is_not_starved():
+    from app.services.queue_executor import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
+    async def scenario():
+        scheduler = FairShareScheduler(workers=1, lane_weights={"interactive": 6, "ingest": 3, "background": 1},
+                                       starvation_sec=60)
+        order = []
+        gate = asyncio.Event()
+
+        def job(name):
+            return job_into(order, name)
+
+        def job_into(target, name):
+            async def run():
+                target.append(name)
+            return run
+
+        async def hold():
+            await gate.wait()
+
+        # 워커는 첫 await 전까지 실행되지 않으므로 아래 작업은 모두 준비 큐에 쌓인 상태에서 시작
+        for i in range(6):
+            scheduler.submit(9410 + i, job(f"ingest{i}"))
+        for i in range(3):
+            scheduler.submit(9420 + i, job(f"final{i}"), priority=PRIORITY_INTERACTIVE)
+        scheduler.submit(9430, job("rescore"), priority=PRIORITY_BACKGROUND)
+        while scheduler.settings()["pending_tasks"] or scheduler.settings()["active"]:
+            await asyncio.sleep(0.005)
+
+        # 기아 방지: 오래 기다린 background 작업이 가중치보다 먼저 처리됨
+        aged = FairShareScheduler(workers=1, starvation_sec=0.01)
+        aged_order = []
+        aged.submit(9440, hold)
+        aged.submit(9441, job_into(aged_order, "rescore"), priority=PRIORITY_BACKGROUND)
+        await asyncio.sleep(0.02)
+        aged.submit(9442, job_into(aged_order, "final"), priority=PRIORITY_INTERACTIVE)
+        gate.set()
+        while aged.settings()["pending_tasks"] or aged.settings()["active"]:
+            await asyncio.sleep(0.005)
+        await scheduler.shutdown()
+        await aged.shutdown()
+        return order, aged_order
+
+    order, aged_order = asyncio.run(scenario())
+    assert order.index("final2") < order.index("ingest3")
+    assert order.index("ingest0") < order.index("final2")  # 가중치 6:3 - ingest도 함께 진행
+    assert order.index("final2") < order.index("rescore")
+    assert aged_order == ["rescore", "final"]
+
+
+def test_consecutive_jobs_with_batch_handler_run_as_one_call():
+    from app.services.queue_executor import _job_runner, get_job_store, register_job_handler
+
+    async def scenario():
+        scheduler = FairShareScheduler(workers=1)
+        single_calls, batch_calls = [], []
+
+        async def handler(interviewee_id, payload):
+            single_calls.append(payload["n"])
+
+        async def batch_handler(interviewee_id, payloads):
+            batch_calls.append([p["n"] for p in payloads])
+
+        register_job_handler("coalesce_test", handler, batch_handler=batch_handler)
+        release = asyncio.Event()
+
+        async def hold():
+            await release.wait()
+
+        scheduler.submit(9301, hold)
+        handles = []
+        for n in range(3):
+            record = await asyncio.to_thread(get_job_store().add, 9301, "coalesce_test", {"n": n})
+            handles.append(scheduler.submit(9301, _job_runner(record), "coalesce_test",
+                                            job_id=record.job_id, record=record))
+        tail = scheduler.submit(9301, hold, kind="other")
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(*handles, tail)
+        unfinished = {r.job_id for r in await asyncio.to_thread(get_job_store().unfinished)}
+        await scheduler.shutdown()
+        return single_calls, batch_calls, unfinished, [h.job_id for h in handles]
+
+    single_calls, batch_calls, unfinished, job_ids = asyncio.run(scenario())
+    assert batch_calls == [[0, 1, 2]]
+    assert single_calls == []
+    assert not unfinished & set(job_ids)
+
+
+def test_interviewee_slots_are_collected_once_idle():
+    from app.services.interviewee_registry import INTERVIEWEE_REGISTRY, IntervieweeRegistry
+
+    async def scenario():
+        scheduler = FairShareScheduler(workers=2)
+        gate = asyncio.Event()
+
+        async def blocked():
+            await gate.wait()
+
+        for interviewee_id in (9301, 9302):
+            scheduler.submit(interviewee_id, blocked)
+        await asyncio.sleep(0.01)
+        live = INTERVIEWEE_REGISTRY.get(9301) is not None and INTERVIEWEE_REGISTRY.get(9302) is not None
+
+        gate.set()
+        while scheduler.settings()["pending_tasks"] or scheduler.settings()["active"]:
+            await asyncio.sleep(0.005)
+        await scheduler.shutdown()
+        collected = INTERVIEWEE_REGISTRY.get(9301) is None and INTERVIEWEE_REGISTRY.get(9302) is None
+
+        registry = IntervieweeRegistry()
+        order = []
+
+        async def upload(n):
+            async with registry.locked(7, "upload"):
+                order.append(("in", n))
+                await asyncio.sleep(0.005)
+                order.append(("out", n))
+
+        waiting = asyncio.gather(upload(0), upload(1))
+        await asyncio.sleep(0.001)
+        held = registry.stats()
+        await waiting
+        return live, collected, order, held, registry.stats()
+
+    live, collected, order, held, after = asyncio.run(scenario())
+    assert live and collected
+    assert order == [("in", 0), ("out", 0), ("in", 1), ("out", 1)]
+    assert held["slots"] == 1 and held["referenced"] == 1
+    assert after == {"slots": 0, "created": 1, "collected": 1, "referenced": 0}
+
+
+def test_replayed_jobs_keep_their_priority_lane(tmp_path, monkeypatch):
+    from app.services import queue_executor
+    from app.services.queue_store import SQLiteJobStore, set_job_store
+
+    store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    store.add(101, "final_report", {}, priority=queue_executor.PRIORITY_INTERACTIVE)
+    store.add(102, "stt_pipeline", {})
+    set_job_store(store)
+    submitted = []
+    monkeypatch.setattr(queue_executor.QUEUE_SCHEDULER, "submit",
+                        lambda interviewee_id, *args, **kwargs: submitted.append((interviewee_id, kwargs["priority"])))
+
+    assert asyncio.run(queue_executor.replay_pending_jobs()) == 2
+    assert submitted == [(101, queue_executor.PRIORITY_INTERACTIVE), (102, queue_executor.PRIORITY_INGEST)]
+
+
+def test_cancelled_job_rows_are_written_before_shutdown_and_failures_are_logged(capsys):
+    import time
+
+    from app.services.queue_executor import _job_runner
+    from app.services.queue_store import MemoryJobStore, set_job_store
+
+    class SlowFlakyStore(MemoryJobStore):
+        fail_job_id = None
+
+        def mark_cancelled(self, job_id, reason):
+            if job_id == self.fail_job_id:
+                raise OSError("disk I/O error")
+            time.sleep(0.05)  # 종료 시점까지 기록이 끝나지 않은 상태
+            super().mark_cancelled(job_id, reason)
+
+    store = SlowFlakyStore()
+    set_job_store(store)
+    failing = store.add(9501, "cancel_test", {})
+    kept = store.add(9501, "cancel_test", {})
+    store.fail_job_id = failing.job_id
+
+    async def scenario():
+        scheduler = FairShareScheduler(workers=1)
+        release = asyncio.Event()
+
+        async def hold():
+            await release.wait()
+
+        scheduler.submit(9501, hold)
+        for record in (failing, kept):
+            scheduler.submit(9501, _job_runner(record), "cancel_test", job_id=record.job_id, record=record)
+        scheduler.cancel(9501)
+        await scheduler.shutdown()
+        return {r.job_id for r in store.unfinished()}
+
+    unfinished = asyncio.run(scenario())
+    assert unfinished == {failing.job_id}
+    assert f"작업 취소 기록 실패 - 재시작 시 다시 실행될 수 있음: job {failing.job_id}" in capsys.readouterr().out
@@ -0,0 +1,90 @@
+from app.services.queue_store import JOB_DONE, SQLiteJobStore
+
+
+def test_unfinished_jobs_survive_reopen(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite3")
+    store = SQLiteJobStore(db_path)
+    first = store.add(101, "stt_pipeline", {"audio_path": "a.webm"})
+    second = store.add(101, "stt_pipeline", {"audio_path": "b.webm"})
+    third = store.add(102, "stt_pipeline", {"audio_path": "c.webm"})
+    store.mark_running(first.job_id)
+    store.mark_done(first.job_id)
+    store.mark_running(second.job_id)  # 실행 도중 재시작
+
+    reopened = SQLiteJobStore(db_path)
+    pending = reopened.unfinished()
+    assert [r.job_id for r in pending] == [second.job_id, third.job_id]
+    assert pending[0].payload == {"audio_path": "b.webm"} and pending[0].attempts == 1
+    assert reopened.purge_finished() == 1
+    assert all(r.status != JOB_DONE for r in reopened.unfinished())
+
+
+def test_purge_finished_jobs_keeps_recent_and_unfinished_rows(tmp_path, monkeypatch):
+    import asyncio
+    import sqlite3
+
+    from app.services import queue_executor
+    from app.services.queue_store import set_job_store
+
+    store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    set_job_store(store)
+    old, recent, pending = (store.add(101, "stt_pipeline", {"n": n}) for n in range(3))
+    store.mark_done(old.job_id)
+    store.mark_cancelled(recent.job_id, "superseded")
+    with sqlite3.connect(store.db_path) as conn:
+        conn.execute("UPDATE jobs SET updated_at = updated_at - 7200 WHERE id = ?", (old.job_id,))
+    monkeypatch.setattr(queue_executor, "QUEUE_RETENTION_SEC", 3600)
+
+    first = asyncio.run(queue_executor.purge_finished_jobs(force=True))
+    throttled = asyncio.run(queue_executor.purge_finished_jobs())
+    assert (first, throttled) == (1, 0)
+    assert [r.job_id for r in store.unfinished()] == [pending.job_id]
+    assert store.purge_finished() == 1  # 최근에 끝난 작업은 보관 시간까지 유지됨
+
+
+def test_only_one_worker_claims_jobs_of_a_dead_owner(tmp_path):
+    import subprocess
+    import sys
+
+    from app.services.queue_store import owner_alive, process_owner_token
+
+    db_path = str(tmp_path / "jobs.sqlite3")
+    finished = subprocess.Popen([sys.executable, "-c", "pass"])
+    finished.wait()
+    sibling = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+    try:
+        dead_owner, live_owner = process_owner_token(finished.pid), process_owner_token(sibling.pid)
+        orphan = SQLiteJobStore(db_path, owner=dead_owner).add(101, "stt_pipeline", {"audio_path": "a.webm"})
+        busy = SQLiteJobStore(db_path, owner=live_owner).add(102, "stt_pipeline", {"audio_path": "b.webm"})
+
+        first = SQLiteJobStore(db_path).claim_unfinished()
+        second = SQLiteJobStore(db_path, owner=dead_owner).claim_unfinished()
+        assert not owner_alive(dead_owner) and owner_alive(live_owner)
+        assert [r.job_id for r in first] == [orphan.job_id]
+        assert second == []  # 이미 살아 있는 워커(이 프로세스)가 점유
+        assert {r.job_id for r in SQLiteJobStore(db_path).unfinished()} == {orphan.job_id, busy.job_id}
+    finally:
+        sibling.kill()
+        sibling.wait()
+
+
+def test_priority_lane_is_stored_and_added_to_old_databases(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "jobs.sqlite3")
+    conn = sqlite3.connect(db_path)  # 레인 컬럼이 없던 이전 버전 DB
+    conn.execute(
+        "CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, interviewee_id INTEGER NOT NULL, kind TEXT NOT NULL, "
+        "payload TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+        "error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO jobs (interviewee_id, kind, payload, created_at, updated_at) "
+                 "VALUES (100, 'stt_pipeline', '{}', 0, 0)")
+    conn.commit()
+    conn.close()
+
+    store = SQLiteJobStore(db_path)
+    store.add(101, "final_report", {}, priority="interactive")
+    store.add(102, "stt_pipeline", {})
+    lanes = [(r.interviewee_id, r.priority) for r in SQLiteJobStore(db_path).claim_unfinished()]
+    assert lanes == [(100, None), (101, "interactive"), (102, None)]
@@ -0,0 +1,66 @@
+import asyncio
+
+from app.services.local_redis import LocalRedis
+from app.services.queue_executor import FairShareScheduler, register_job_handler
+from app.services.shared_queue import SharedJobQueue
+
+
+def test_two_workers_share_queue_with_per_interviewee_order():
+    async def scenario():
+        redis = LocalRedis()
+        workers = [
+            SharedJobQueue(redis, prefix="t", lease_ms=500, poll_sec=0.005, scheduler=FairShareScheduler(2))
+            for _ in range(2)
+        ]
+        ran, running = [], set()
+
+        async def handler(interviewee_id, payload):
+            assert interviewee_id not in running  # 같은 면접자 작업은 동시에 하나만
+            running.add(interviewee_id)
+            await asyncio.sleep(0.005)
+            ran.append((interviewee_id, payload["n"]))
+            running.discard(interviewee_id)
+
+        register_job_handler("shared_test", handler)
+        for n in range(4):
+            for interviewee_id in (9401, 9402, 9403):
+                await workers[n % 2].push(interviewee_id, "shared_test", {"n": n})
+        for worker in workers:
+            worker.start()
+        drained = await workers[0].drain(9401, timeout=5) and await workers[0].drain(9402, timeout=5) \
+            and await workers[0].drain(9403, timeout=5)
+        for worker in workers:
+            await worker.stop()
+            await worker.scheduler.shutdown()
+        return drained, ran
+
+    drained, ran = asyncio.run(scenario())
+    assert drained
+    for interviewee_id in (9401, 9402, 9403):
+        assert [n for i, n in ran if i == interviewee_id] == [0, 1, 2, 3]
+
+
+def test_expired_lease_is_taken_over_and_superseded_jobs_are_removed():
+    async def scenario():
+        redis = LocalRedis()
+        queue = SharedJobQueue(redis, prefix="t", lease_ms=50, poll_sec=0.005, scheduler=FairShareScheduler(1))
+        ran = []
+
+        async def handler(interviewee_id, payload):
+            ran.append(payload["n"])
+
+        register_job_handler("shared_test2", handler)
+        # 다른 프로세스가 점유한 채로 죽은 상황
+        await redis.set("t:lease:9411", "dead-worker", px=50)
+        await queue.push(9411, "shared_test2", {"n": 0})
+        await queue.push(9411, "shared_test2", {"n": 1}, supersede_key="audio:x")
+        await queue.push(9411, "shared_test2", {"n": 2}, supersede_key="audio:x")
+        queue.start()
+        drained = await queue.drain(9411, timeout=5)
+        await queue.stop()
+        await queue.scheduler.shutdown()
+        return drained, ran
+
+    drained, ran = asyncio.run(scenario())
+    assert drained
+    assert ran == [0, 2]
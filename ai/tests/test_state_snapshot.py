@@ -0,0 +1,83 @@
+import asyncio
+
+from app.state.snapshot import StateSnapshotter
+from app.state.store import InMemoryStateStore
+
+
+def test_snapshot_writes_dirty_deltas_compacts_and_restores_after_restart(tmp_path):
+    async def before_restart():
+        store = InMemoryStateStore(archive_dir="")
+        snapshotter = StateSnapshotter(store, str(tmp_path), interval_sec=60, compact_every=2)
+        await store.put(101, {"interviewee_id": 101, "stt": {"segments": ["첫 답변"]}, "done": False})
+        await store.put(102, {"interviewee_id": 102, "done": False})
+        first = await snapshotter.flush()
+        unchanged = await snapshotter.flush()
+        await store.put(101, {"interviewee_id": 101, "stt": {"segments": ["첫 답변", "둘째 답변"]}, "done": False})
+        await store.delete(102)
+        second = await snapshotter.flush()  # 두 번째 델타 → 전체 스냅샷으로 합침
+        await store.put(103, {"interviewee_id": 103, "summary": {"total_score": 72}, "done": False})
+        await snapshotter.flush()  # 합친 뒤의 델타
+        stats = snapshotter.stats()
+        snapshotter.release()  # 재시작 (프로세스 종료 시 잠금 반납)
+        return first, unchanged, second, stats
+
+    async def after_restart():
+        store = InMemoryStateStore(archive_dir="")
+        restored = await StateSnapshotter(store, str(tmp_path)).load()
+        return restored, await store.get(101), await store.get(102), await store.get(103), store.take_dirty()
+
+    first, unchanged, second, stats = asyncio.run(before_restart())
+    assert (first, unchanged, second) == (2, 0, 2)
+    assert stats["compactions"] == 1 and stats["delta_writes"] == 3
+
+    restored, s101, s102, s103, dirty = asyncio.run(after_restart())
+    assert restored == 2
+    assert s101["stt"]["segments"] == ["첫 답변", "둘째 답변"]
+    assert s102 is None and s103["summary"]["total_score"] == 72
+    assert dirty == {}
+
+
+def test_snapshot_is_not_restored_from_a_group_writable_directory(tmp_path):
+    import os
+
+    async def scenario():
+        store = InMemoryStateStore(archive_dir="")
+        snapshotter = StateSnapshotter(store, str(tmp_path / "snap"), interval_sec=60)
+        await store.put(101, {"interviewee_id": 101, "done": False})
+        await snapshotter.flush()
+        created_mode = os.stat(tmp_path / "snap").st_mode & 0o777
+        snapshotter.release()
+        os.chmod(tmp_path / "snap", 0o770)
+        restored = await StateSnapshotter(InMemoryStateStore(archive_dir=""), str(tmp_path / "snap")).load()
+        return created_mode, restored
+
+    created_mode, restored = asyncio.run(scenario())
+    assert created_mode == 0o700
+    assert restored == 0
+
+
+def test_second_snapshotter_on_the_same_directory_is_refused(tmp_path):
+    async def scenario():
+        owner_store, other_store = InMemoryStateStore(archive_dir=""), InMemoryStateStore(archive_dir="")
+        owner = StateSnapshotter(owner_store, str(tmp_path), interval_sec=60)
+        other = StateSnapshotter(other_store, str(tmp_path), interval_sec=60)
+        await owner_store.put(101, {"interviewee_id": 101, "done": False})
+        await owner.flush()
+
+        restored = await other.load()
+        await other_store.put(102, {"interviewee_id": 102, "done": False})
+        written = await other.flush()
+        other.start()
+        await other.stop()
+        await owner.stop()
+
+        # 잠금이 반납된 뒤에는 다음 워커가 사용 가능
+        after = StateSnapshotter(InMemoryStateStore(archive_dir=""), str(tmp_path))
+        restored_after = await after.load()
+        after.release()
+        return restored, written, other.stats(), restored_after
+
+    restored, written, stats, restored_after = asyncio.run(scenario())
+    assert (restored, written) == (0, 0)
+    assert stats["disabled"] and not stats["running"] and stats["delta_writes"] == 0
+    assert restored_after == 1
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from app.services.local_redis import LocalRedis
+from app.state.store import InMemoryStateStore, RedisStateStore
+
+
+@pytest.mark.parametrize("make_store", [
+    lambda: InMemoryStateStore(archive_dir=""),
+    lambda: RedisStateStore(LocalRedis(), prefix="t", archive_dir=""),
+])
+def test_state_store_contract(make_store):
+    async def scenario():
+        store = make_store()
+        await store.put(101, {"interviewee_id": 101, "stt": {"segments": [{"raw": "안녕하세요"}]}, "done": False})
+        await store.put(102, {"interviewee_id": 102, "done": False})
+
+        def finish(state):
+            state["done"] = True
+            return state
+
+        updated = await store.update(101, finish)
+        missing = await store.update(999, lambda state: state)
+        loaded = await store.get(101)
+        ids = sorted([i async for i in store.scan()])
+        deleted = await store.delete(102)
+        return updated, missing, loaded, ids, deleted, await store.get(102)
+
+    updated, missing, loaded, ids, deleted, gone = asyncio.run(scenario())
+    assert updated["done"] is True and missing is None
+    assert loaded["done"] is True and loaded["stt"]["segments"][0]["raw"] == "안녕하세요"
+    assert ids == [101, 102]
+    assert deleted and gone is None
+
+
+def test_memory_store_evicts_by_ttl_and_budget_and_reads_back_from_archive(tmp_path):
+    async def scenario():
+        store = InMemoryStateStore(done_ttl_sec=0.05, max_bytes=300, archive_dir=str(tmp_path))
+        await store.put(1, {"interviewee_id": 1, "done": True, "summary": {"total_score": 80}})
+        await asyncio.sleep(0.06)
+        await store.put(2, {"interviewee_id": 2, "done": False, "stt": {"segments": ["가" * 40]}})
+        await store.put(3, {"interviewee_id": 3, "done": False, "stt": {"segments": ["나" * 40]}})
+        in_memory = list(store._states)
+        expired = await store.get(1)
+        evicted = await store.get(2)  # 진행 중 상태는 메모리로 복귀
+        return in_memory, expired, evicted, list(store._states), store.stats()
+
+    in_memory, expired, evicted, reloaded, stats = asyncio.run(scenario())
+    assert in_memory == [3]
+    assert expired["summary"]["total_score"] == 80
+    assert evicted["stt"]["segments"] == ["가" * 40]
+    assert 2 in reloaded and 1 not in reloaded
+    assert stats["evicted"]["ttl"] == 1 and stats["evicted"]["lru"] >= 1
+
+
+@pytest.mark.parametrize("make_store", [
+    lambda: InMemoryStateStore(archive_dir=""),
+    lambda: RedisStateStore(LocalRedis(), prefix="t", archive_dir=""),
+])
+def test_versioned_commit_merges_fields_and_drops_late_writes_after_done(make_store):
+    async def scenario():
+        store = make_store()
+        await store.put(101, {"interviewee_id": 101, "stt": {"segments": []}, "done": False})
+
+        # STT 작업과 최종 평가가 같은 버전을 읽고 각자 처리
+        stt_base, stt_version = await store.get_versioned(101)
+        final_base, final_version = await store.get_versioned(101)
+        stt_state = {**stt_base, "stt": {"segments": ["마지막 답변"]}}
+        final_state = {**final_base, "summary": {"total_score": 80}, "done": True}
+
+        stale = await store.compare_and_put(101, final_state, final_version - 1)
+        stt_saved = await store.commit(101, stt_base, stt_state, stt_version)
+        final_saved = await store.commit(101, final_base, final_state, final_version)  # 충돌 → 병합
+        merged = await store.get(101)
+
+        late_base, late_version = await store.get_versioned(101)
+        await store.put(101, {**merged, "report": "ok"})
+        late = await store.commit(101, late_base, {**late_base, "stt": {"segments": []}}, late_version,
+                                  skip_if_done=True)
+        return stale, stt_saved, final_saved, merged, late, await store.get(101)
+
+    stale, stt_saved, final_saved, merged, late, final = asyncio.run(scenario())
+    assert stale is False and stt_saved and final_saved
+    assert merged["stt"]["segments"] == ["마지막 답변"]
+    assert merged["done"] is True and merged["summary"]["total_score"] == 80
+    assert late is None and final["stt"]["segments"] == ["마지막 답변"] and final["report"] == "ok"
+
+
+def test_version_numbers_are_not_reused_after_eviction_or_delete(tmp_path):
+    async def memory_scenario():
+        store = InMemoryStateStore(max_bytes=120, archive_dir=str(tmp_path))
+        await store.put(1, {"interviewee_id": 1, "stt": {"segments": []}})
+        await store.put(1, {"interviewee_id": 1, "stt": {"segments": ["첫 답변"]}})
+        stale, version = await store.get_versioned(1)
+        await store.put(2, {"interviewee_id": 2, "stt": {"segments": ["나" * 40]}})  # 1번 LRU 제거
+        evicted = 1 not in store._states
+        await store.get(1)  # 아카이브에서 다시 올림
+        await store.put(1, {"interviewee_id": 1, "stt": {"segments": ["첫 답변", "둘째 답변"]}})
+        return evicted, await store.compare_and_put(1, stale, version), await store.get(1)
+
+    async def redis_scenario():
+        store = RedisStateStore(LocalRedis(), prefix="t", archive_dir="")
+        await store.put(1, {"interviewee_id": 1, "done": False})
+        stale, version = await store.get_versioned(1)
+        await store.delete(1)
+        await store.put(1, {"interviewee_id": 1, "done": True})
+        return await store.compare_and_put(1, stale, version), await store.get(1)
+
+    evicted, overwritten, latest = asyncio.run(memory_scenario())
+    assert evicted and overwritten is False
+    assert latest["stt"]["segments"] == ["첫 답변", "둘째 답변"]
+    overwritten, latest = asyncio.run(redis_scenario())
+    assert overwritten is False and latest["done"] is True
+
+
+def test_redis_compare_and_put_is_one_script_call_and_archives_only_committed_states(tmp_path):
+    async def scenario():
+        redis = LocalRedis()
+        worker_a = RedisStateStore(redis, prefix="t", archive_dir=str(tmp_path))
+        worker_b = RedisStateStore(redis, prefix="t", archive_dir=str(tmp_path))  # 같은 Redis를 쓰는 다른 워커
+        await worker_a.put(7, {"interviewee_id": 7, "done": False})
+        base, version = await worker_a.get_versioned(7)
+        won = await worker_b.compare_and_put(7, {"interviewee_id": 7, "done": True, "by": "b"}, version)
+        lost = await worker_a.compare_and_put(7, {**base, "done": True, "by": "a"}, version)
+        keys = sorted([key async for key in redis.scan_iter(match="t:*")])
+        archived = worker_a.archive.read(7)
+        return won, lost, keys, archived, await redis.pttl("t:7")
+
+    won, lost, keys, archived, ttl = asyncio.run(scenario())
+    assert won is True and lost is False
+    assert keys == [b"t:7", b"t:7:ver", b"t:version_seq"]  # 쓰기 잠금 키 없음
+    assert archived["by"] == "b" and ttl > 0
@@ -0,0 +1,41 @@
+from app.services.interview.stt_cache import (
+    TranscriptionCache,
+    audio_content_digest,
+    transcription_cache_key,
+)
+
+
+def test_digest_is_read_from_upload_filename(tmp_path):
+    path = tmp_path / "101_20250630_120000_0123456789abcdef.webm"
+    path.write_bytes(b"not really audio")
+    assert audio_content_digest(str(path)) == "0123456789abcdef"
+
+
+def test_digest_falls_back_to_content_hash(tmp_path):
+    a = tmp_path / "a.webm"
+    b = tmp_path / "b.webm"
+    a.write_bytes(b"same bytes")
+    b.write_bytes(b"same bytes")
+    assert audio_content_digest(str(a)) == audio_content_digest(str(b))
+    assert len(audio_content_digest(str(a))) == 16
+
+
+def test_lru_evicts_oldest_entry():
+    cache = TranscriptionCache(max_entries=2)
+    cache.put("a", {"raw": "A"})
+    cache.put("b", {"raw": "B"})
+    assert cache.get("a") == {"raw": "A"}  # a가 최근 사용됨
+    cache.put("c", {"raw": "C"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"raw": "A"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_cache_survives_new_instance(tmp_path):
+    key = transcription_cache_key("0123456789abcdef", "openai", "ko")
+    TranscriptionCache(max_entries=4, cache_dir=str(tmp_path)).put(key, {"raw": "안녕하세요"})
+
+    fresh = TranscriptionCache(max_entries=4, cache_dir=str(tmp_path))
+    assert fresh.get(key) == {"raw": "안녕하세요"}
+    assert fresh.stats()["hits"] == 1
@@ -0,0 +1,21 @@
+from app.services.interview.transcript_stitching import stitch_transcripts
+
+
+def test_overlap_is_kept_once():
+    texts = [
+        "저는 백엔드 개발을 주로 했고",
+        "개발을 주로 했고 팀장도 맡았습니다.",
+    ]
+    assert stitch_transcripts(texts) == "저는 백엔드 개발을 주로 했고 팀장도 맡았습니다."
+
+
+def test_cut_boundary_word_is_skipped():
+    texts = [
+        "프로젝트에서 데이터 파이프라인을 설계했습니다",
+        "습니다 데이터 파이프라인을 설계했습니다 그리고 배포까지",
+    ]
+    assert stitch_transcripts(texts) == "프로젝트에서 데이터 파이프라인을 설계했습니다 그리고 배포까지"
+
+
+def test_no_overlap_concatenates_and_skips_empty_chunks():
+    assert stitch_transcripts(["첫 번째 문장", "", "두 번째 문장"]) == "첫 번째 문장 두 번째 문장"
@@ -0,0 +1,28 @@
+from app.services.interview.transcription_filter import AhoCorasick, TranscriptionFilter
+
+
+def test_matcher_ignores_spacing_and_finds_overlapping_patterns():
+    matcher = AhoCorasick(["시청해주셔서 감사합니다", "해주셔", "abcd", "bc"])
+    assert matcher.find_first("오늘도 시청 해 주셔서") == "해주셔"
+    assert matcher.find_first("xabcx") == "bc"
+    assert matcher.find_first("저는 백엔드 개발자입니다") is None
+
+
+def test_loops_and_highly_repetitive_text_are_rejected():
+    engine = TranscriptionFilter(patterns_file="")
+    assert engine.check("네 그렇습니다 그렇습니다 그렇습니다 그렇습니다") is not None
+    assert engine.check("감사합니다." * 20) is not None
+    assert engine.check("저는 데이터 파이프라인을 설계하고 운영한 경험이 있습니다.") is None
+
+
+def test_patterns_reload_when_file_changes(tmp_path):
+    patterns = tmp_path / "patterns.txt"
+    patterns.write_text("# 주석\n자막 제공\n", encoding="utf-8")
+    engine = TranscriptionFilter(patterns_file=str(patterns))
+    assert engine.check("자막 제공 및 광고") is not None
+    assert engine.check("구독 관리 시스템을 만들었습니다") is None  # 기본 패턴 대신 파일 패턴 사용
+
+    patterns.write_text("광고\n", encoding="utf-8")
+    assert engine.reload(force=True)
+    assert engine.pattern_count == 1
+    assert engine.check("자막 제공 및 광고") == "금지 문구 '광고'"
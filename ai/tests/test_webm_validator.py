@@ -0,0 +1,52 @@
+import struct
+
+from app.services.interview.webm_validator import inspect_webm
+
+UNKNOWN_SIZE = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+
+
+def element(element_id: int, payload: bytes, unknown_size: bool = False) -> bytes:
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    if unknown_size:
+        return id_bytes + UNKNOWN_SIZE + payload
+    return id_bytes + (len(payload) | (1 << 56)).to_bytes(8, "big") + payload
+
+
+def simple_block(timecode: int) -> bytes:
+    return element(0xA3, b"\x81" + struct.pack(">h", timecode) + b"\x80" + b"\x00" * 200)
+
+
+def build_webm(with_duration: bool, unknown_size: bool = False) -> bytes:
+    header = element(0x1A45DFA3, element(0x4282, b"webm"))
+    info_children = element(0x2AD7B1, (1_000_000).to_bytes(3, "big"))
+    if with_duration:
+        info_children += element(0x4489, struct.pack(">d", 3000.0))
+    clusters = b"".join(
+        element(0x1F43B675, element(0xE7, bytes([0, start // 256, start % 256]))
+                + simple_block(0) + simple_block(900), unknown_size)
+        for start in (0, 1000, 2000)
+    )
+    return header + element(0x18538067, element(0x1549A966, info_children) + clusters, unknown_size)
+
+
+def test_duration_is_read_from_info(tmp_path):
+    path = tmp_path / "answer.webm"
+    path.write_bytes(build_webm(with_duration=True))
+    info = inspect_webm(str(path))
+    assert info.valid and info.duration_ms == 3000 and info.duration_source == "info"
+    assert info.cluster_count == 3 and info.block_count == 6
+
+
+def test_media_recorder_stream_falls_back_to_block_timecodes(tmp_path):
+    path = tmp_path / "answer.webm"
+    path.write_bytes(build_webm(with_duration=False, unknown_size=True))
+    info = inspect_webm(str(path))
+    assert info.valid and info.duration_ms == 2900 and info.duration_source == "blocks"
+    assert info.cluster_count == 3
+
+
+def test_truncated_upload_is_rejected(tmp_path):
+    path = tmp_path / "answer.webm"
+    path.write_bytes(build_webm(with_duration=True)[:-50])
+    info = inspect_webm(str(path))
+    assert not info.valid and "잘린" in info.reason